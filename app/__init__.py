@@ -4,9 +4,6 @@ from flask import Flask
 from config import ActiveConfig
 from .models import db, MyUser  # import MyUser for user_loader
 
-# Mongo
-from pymongo.mongo_client import MongoClient
-from pymongo.server_api import ServerApi
 import os
 
 # Flask-Login
@@ -30,20 +27,22 @@ def create_app(run_db_create: bool = False, drop_db_all: bool = False):
     # --- SQLAlchemy (PostgreSQL/SQLite) ---
     db.init_app(app)
 
-    # --- MongoDB (Atlas) ---
-    try:
-        app.mongo_client = MongoClient(
-            app.config.get("MONGO_URI"),
-            server_api=ServerApi("1"),
-            tlsCAFile=app.config.get("MONGO_CERT"),
-        )
-        app.mongo_db = app.mongo_client[app.config.get("MONGO_DBNAME", "atlLocal")]
-        app.mongo_client.admin.command("ping")
-        print("✅ MongoDB connected (app.mongo_db ready)")
-    except Exception as e:
-        app.mongo_client = None
-        app.mongo_db = None
-        print(f"❌ MongoDB connection error at init: {e}")
+    # --- MongoDB (Atlas): optional, connects on first use of mongo.db ---
+    from .mongo import mongo
+    mongo.init_app(app)
+    print(f"[init] MongoDB: {'lazy client (connects on first use)' if mongo.configured else 'not configured'}")
+
+    # --- Response cache for public JSON reads ---
+    from .response_cache import response_cache
+    response_cache.init_app(app)
+
+    # --- Write-behind analytics counters (flushed by a background thread) ---
+    from .analytics_buffer import hit_buffer
+    hit_buffer.init_app(app)
+
+    # --- Process-local slug/id -> post resolution cache ---
+    from .slug_index import slug_index
+    slug_index.init_app(app)
 
     # --- Blueprints ---
     from .routes import main
@@ -52,6 +51,27 @@ def create_app(run_db_create: bool = False, drop_db_all: bool = False):
     from .api import api_bp
     app.register_blueprint(api_bp)
 
+    # --- CLI: `flask load-places` bulk-loads the place catalog ---
+    from .place_store import load_places_command
+    app.cli.add_command(load_places_command)
+
+    # --- CLI: `flask refresh-most-read` recomputes the most-read rankings ---
+    from .rankings import refresh_most_read_command
+    app.cli.add_command(refresh_most_read_command)
+
+    # --- CLI: `flask reindex-posts` builds the full-text search documents ---
+    from .post_search import reindex_posts_command
+    app.cli.add_command(reindex_posts_command)
+
+    # --- CLI: `flask pack-content` / `flask bench-content-storage` (CONTENT_STORAGE) ---
+    from .content_store import pack_content_command, bench_content_storage_command
+    app.cli.add_command(pack_content_command)
+    app.cli.add_command(bench_content_storage_command)
+
+    # --- CLI: `flask mongo-ping` checks MongoDB reachability ---
+    from .mongo import mongo_ping_command
+    app.cli.add_command(mongo_ping_command)
+
     # --- DB helpers ---
     if run_db_create:
         with app.app_context():
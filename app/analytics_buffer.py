@@ -0,0 +1,232 @@
+# analytics_buffer.py
+from __future__ import annotations
+import atexit
+import json
+import os
+import threading
+from collections import Counter
+from typing import Dict
+
+from flask import current_app
+from sqlalchemy import bindparam, func, insert, select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from .models import db, BlogPost, PostAnalytics
+from .rankings import most_read, record_views
+from .response_cache import response_cache
+
+# Counters a public hit may bump (PostAnalytics columns)
+HIT_FIELDS = ("views", "likes", "shares")
+HIT_EVENTS = {"view": "views", "like": "likes", "share": "shares"}
+
+# Defaults (overridable via ANALYTICS_* config)
+ANALYTICS_FLUSH_SECONDS = 5.0
+
+
+class HitBuffer:
+    """
+    Write-behind counters for PostAnalytics.
+
+    Hits are summed in memory per worker and applied every
+    ANALYTICS_FLUSH_SECONDS by a background thread, as ONE executemany of
+    `UPDATE post_analytics SET views = views + :views, ...` for all
+    touched posts, so concurrent workers never overwrite each other.
+
+    Nothing is dropped on the way out: a failed flush puts its counts back,
+    the atexit hook flushes what is left, and if the database is
+    unreachable at that point the counts are appended to the spool file
+    (ANALYTICS_SPOOL_PATH), which the next flush of any worker replays.
+    Only a hard kill (SIGKILL) loses the last interval.
+    ANALYTICS_FLUSH_SECONDS <= 0 applies each hit inline instead.
+    """
+
+    def __init__(self):
+        self.app = None
+        self.interval = ANALYTICS_FLUSH_SECONDS
+        self.spool_path = None
+        self._pending: Counter = Counter()   # (post_id, field) -> n
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._pid = os.getpid()
+        self.flushed = 0
+
+    def init_app(self, app) -> None:
+        self.app = app
+        self.interval = float(app.config.get("ANALYTICS_FLUSH_SECONDS", ANALYTICS_FLUSH_SECONDS))
+        self.spool_path = app.config.get("ANALYTICS_SPOOL_PATH")
+        atexit.register(self.stop)
+
+    # -------- recording --------------------------------------------------------
+
+    def add(self, post_id: int, field: str, n: int = 1) -> None:
+        if field not in HIT_FIELDS:
+            raise ValueError(f"Unknown counter: {field!r}")
+        self._check_fork()
+        if self.interval <= 0:
+            self._merge({(post_id, field): n})
+            self.flush()
+            return
+        self._ensure_thread()
+        with self._lock:
+            self._pending[(post_id, field)] += n
+
+    def pending(self) -> int:
+        return sum(self._pending.values())
+
+    def _merge(self, counts) -> None:
+        with self._lock:
+            self._pending.update(counts)
+
+    # -------- flushing ---------------------------------------------------------
+
+    def flush(self) -> int:
+        """
+        Apply everything pending (plus any spooled counts) in one
+        transaction. Must run inside an app context. Returns the number of
+        posts updated; on failure the counts are put back for the next try.
+        """
+        self._drain_spool()
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+        if not pending:
+            return 0
+
+        by_post: Dict[int, dict] = {}
+        for (post_id, field), n in pending.items():
+            by_post.setdefault(post_id, dict.fromkeys(HIT_FIELDS, 0))[field] += n
+
+        try:
+            n = _apply_increments(by_post)
+            db.session.commit()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            self._merge(pending)
+            current_app.logger.warning("Analytics flush failed, %d counts kept: %s", sum(pending.values()), e)
+            return 0
+
+        self.flushed += n
+        # Only the responses showing these posts; "analytics" (rankings) is
+        # dropped by most_read.refresh() when it actually re-ranks
+        response_cache.invalidate(*(f"post:{pid}" for pid in by_post))
+        most_read.mark_dirty()
+        most_read.refresh_if_due()
+        return n
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            with self.app.app_context():
+                self.flush()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="analytics-flusher", daemon=True)
+            self._thread.start()
+
+    def _check_fork(self) -> None:
+        # A forked worker starts empty: the parent still owns (and flushes)
+        # what it had buffered, and the parent's thread did not survive fork.
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._lock = threading.Lock()
+            self._pending = Counter()
+            self._thread = None
+
+    def stop(self) -> None:
+        """Stop the flusher and flush the rest; spool it if the DB is unreachable."""
+        if self.app is None or self._pid != os.getpid():
+            return
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=max(self.interval, 1.0) + 5)
+            self._thread = None
+        with self.app.app_context():
+            self.flush()
+        if self._pending:
+            self._spool()
+
+    # -------- spool ------------------------------------------------------------
+
+    def _spool(self) -> None:
+        if not self.spool_path:
+            return
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+        with open(self.spool_path, "a", encoding="utf-8") as fh:
+            for (post_id, field), n in pending.items():
+                fh.write(json.dumps([post_id, field, n]) + "\n")
+
+    def _drain_spool(self) -> None:
+        if not self.spool_path or not os.path.exists(self.spool_path):
+            return
+        # Claim the file atomically so two workers never replay it twice
+        claimed = f"{self.spool_path}.{os.getpid()}"
+        try:
+            os.replace(self.spool_path, claimed)
+        except FileNotFoundError:
+            return
+        counts: Counter = Counter()
+        with open(claimed, encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    post_id, field, n = json.loads(line)
+                except ValueError:
+                    continue
+                if field in HIT_FIELDS:
+                    counts[(int(post_id), field)] += int(n)
+        self._merge(counts)
+        os.remove(claimed)
+
+
+def _apply_increments(by_post: Dict[int, dict]) -> int:
+    """Atomic `col = col + :n` for each post; creates missing analytics rows."""
+    table = PostAnalytics.__table__
+    ids = list(by_post)
+
+    have = set(db.session.execute(select(table.c.post_id).where(table.c.post_id.in_(ids))).scalars())
+    missing = [pid for pid in ids if pid not in have]
+    if missing:
+        # Unknown posts are dropped; a row created concurrently by another
+        # worker is fine, the UPDATE below then adds to it.
+        known = db.session.execute(
+            select(BlogPost.post_id).where(BlogPost.post_id.in_(missing))
+        ).scalars().all()
+        for pid in set(missing) - set(known):
+            by_post.pop(pid)
+        for pid in known:
+            try:
+                with db.session.begin_nested():
+                    db.session.execute(insert(table).values(post_id=pid))
+            except IntegrityError:
+                pass
+    if not by_post:
+        return 0
+
+    stmt = (
+        update(table)
+        .where(table.c.post_id == bindparam("b_post_id"))
+        .values(
+            updated_at=func.now(),
+            **{f: table.c[f] + bindparam(f"b_{f}") for f in HIT_FIELDS},
+        )
+    )
+    db.session.execute(stmt, [
+        {"b_post_id": pid, **{f"b_{f}": counts[f] for f in HIT_FIELDS}}
+        for pid, counts in by_post.items()
+    ])
+
+    # Hourly buckets for the windowed rankings; never worth losing the totals over
+    try:
+        with db.session.begin_nested():
+            record_views({pid: counts["views"] for pid, counts in by_post.items()})
+    except (SQLAlchemyError, NotImplementedError) as e:
+        current_app.logger.warning("View buckets not recorded: %s", e)
+    return len(by_post)
+
+
+hit_buffer = HitBuffer()
@@ -1,12 +1,24 @@
 import os
-from flask import Blueprint, request, jsonify, current_app, url_for, json
+import base64
+import hashlib
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import NamedTuple
+from flask import Blueprint, Response, request, jsonify, current_app, url_for, json
 from flask.views import MethodView
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy import func, and_, text
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy import func, and_, or_, select, text
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import contains_eager, joinedload, load_only, selectinload
 from werkzeug.utils import secure_filename
 from werkzeug.security import generate_password_hash, check_password_hash
 from flask_login import login_user, current_user
 
+from .response_cache import response_cache, cache_tags, cached_response
+from .analytics_buffer import hit_buffer, HIT_EVENTS
+from .rankings import most_read, PERIODS as RANK_PERIODS
+from .slug_index import slug_index, PostRef
+from . import content_store, post_search
 from .models import (
     db,
     BlogCategory,
@@ -16,8 +28,13 @@ from .models import (
     NewsMain,
     PostAnalytics,
     BlogContent,   # ⬅️ SQL content model (1:1 with BlogPost)
+    undefer_content,
 )
 from .schemas import (
+    # Schema classes (sparse fieldsets build `only=` variants)
+    BlogPostOutSchema,
+    BlogPostWithAnalyticsOutSchema,
+    BlogContentOutSchema,
     # BlogCategory
     blog_category_out,
     blog_category_list_out,
@@ -48,6 +65,7 @@ from .schemas import (
     post_analytics_list_out,
     post_analytics_create,
     post_analytics_update,
+    post_analytics_hit,
     # Optional combined
     blog_post_with_analytics_out,
     blog_post_with_analytics_list_out,
@@ -148,14 +166,39 @@ def _news_main_post(nm: NewsMain):
         return BlogPost.query.get(nm.post_id)
     return None
 
-def _find_blog_post(ident: str) -> BlogPost | None:
-    """Return BlogPost by numeric id or slug."""
+def _fetch_resolved(ident: str, ref: PostRef, *options) -> BlogPost | None:
+    """Load the post slug_index resolved `ident` to; None (entry dropped) if the entry was stale."""
+    bp = BlogPost.query.options(*options).get(ref.post_id)
+    if bp is None or (not str(ident).isdigit() and bp.slug != str(ident)):
+        slug_index.discard(ident)
+        return None
+    return bp
+
+def _find_blog_post(ident: str, *options) -> BlogPost | None:
+    """Return BlogPost by numeric id or slug (`options`: loader options, e.g. _full_content())."""
     if str(ident).isdigit():
-        return BlogPost.query.get(int(ident))
-    return BlogPost.query.filter_by(slug=str(ident)).first()
+        return BlogPost.query.options(*options).get(int(ident))
+    for _ in range(2):  # a stale slug entry gets one fresh resolve
+        ref = slug_index.resolve(ident)
+        if ref is None:
+            return None
+        bp = _fetch_resolved(ident, ref, *options)
+        if bp is not None:
+            return bp
+    return None
 
-def _require_blog_post(ident: str) -> BlogPost:
-    bp = _find_blog_post(ident)
+def _post_ident_clause(ident: str):
+    """WHERE clause matching _find_blog_post's id-or-slug lookup."""
+    if str(ident).isdigit():
+        return BlogPost.post_id == int(ident)
+    return BlogPost.slug == str(ident)
+
+def _post_tags(post_ids) -> list[str]:
+    """Response-cache tags for the posts rendered in a response."""
+    return [f"post:{pid}" for pid in post_ids if pid is not None]
+
+def _require_blog_post(ident: str, *options) -> BlogPost:
+    bp = _find_blog_post(ident, *options)
     if not bp:
         # Keep 404 behavior like get_or_404
         from flask import abort
@@ -167,13 +210,14 @@ def _find_news_blogpost(ident: str) -> BlogPost | None:
     Resolve a News post by either numeric id (post_id) or slug.
     Returns the underlying BlogPost row if it has a NewsPost twin.
     """
-    if str(ident).isdigit():
-        np = NewsPost.query.get(int(ident))
-        return np.post if np else None
-    bp = BlogPost.query.filter_by(slug=str(ident)).first()
-    if not bp:
-        return None
-    return bp if NewsPost.query.get(bp.post_id) else None
+    for _ in range(2):  # a stale entry gets one fresh resolve
+        ref = slug_index.resolve(ident)
+        if ref is None or not ref.is_news:
+            return None
+        bp = _fetch_resolved(ident, ref)
+        if bp is not None:
+            return bp
+    return None
 
 def _require_news_blogpost(ident: str) -> BlogPost:
     bp = _find_news_blogpost(ident)
@@ -182,16 +226,373 @@ def _require_news_blogpost(ident: str) -> BlogPost:
         abort(404, description="NewsPost not found.")
     return bp
 
+def _check_post_ref(ident: str, ref: PostRef) -> PostRef | None:
+    """
+    Re-read the resolved post by primary key (cheap: no post, no joins
+    beyond NewsPost). Another worker's write only reaches this worker's
+    slug_index after SLUG_INDEX_TTL, so the entry may name a deleted or
+    renamed post, or an old category; None (entry dropped) in that case.
+    """
+    row = db.session.execute(
+        select(BlogPost.slug, NewsPost.post_id.is_not(None), BlogPost.blog_cat_id)
+        .outerjoin(NewsPost, NewsPost.post_id == BlogPost.post_id)
+        .where(BlogPost.post_id == ref.post_id)
+    ).first()
+    fresh = PostRef(ref.post_id, bool(row[1]), row[2]) if row is not None else None
+    if fresh is None or fresh != ref or (not str(ident).isdigit() and row[0] != str(ident)):
+        slug_index.discard(ident)
+        return None
+    return fresh
+
+def _resolve_post_ref(ident: str) -> PostRef | None:
+    """slug_index.resolve(), checked against the row (see _check_post_ref)."""
+    for _ in range(2):  # a stale entry gets one fresh resolve
+        ref = slug_index.resolve(ident)
+        if ref is None:
+            return None
+        ref = _check_post_ref(ident, ref)
+        if ref is not None:
+            return ref
+    return None
+
+def _require_post_ref(ident: str, news: bool = False) -> PostRef:
+    """
+    Resolve `<ident>` to (post_id, is_news, blog_cat_id) without loading
+    the post, for endpoints that only exclude or group by it. 404s like
+    _require_blog_post / _require_news_blogpost.
+    """
+    ref = _resolve_post_ref(ident)
+    if ref is None or (news and not ref.is_news):
+        from flask import abort
+        abort(404, description="NewsPost not found." if news else "BlogPost not found.")
+    return ref
+
 def _get_content_row(post_id: int) -> BlogContent | None:
-    return BlogContent.query.filter_by(post_id=post_id).first()
+    return BlogContent.query.options(undefer_content()).filter_by(post_id=post_id).first()
 
-def _embed_content_if_requested(bp: BlogPost, data: dict, include_content: bool):
+def _content_map(posts, columns=None) -> dict[int, BlogContent]:
+    """
+    post_id -> BlogContent for a page of posts in at most ONE query.
+    Uses BlogPost.content when it is already loaded on the instance and
+    fetches the rest with a single `post_id IN (...)` select, restricted to
+    `columns` (BlogContent attribute names) when given.
+    """
+    out: dict[int, BlogContent] = {}
+    missing = []
+    for bp in posts:
+        if bp is None:
+            continue
+        if "content" in sa_inspect(bp).unloaded:
+            missing.append(bp.post_id)
+        elif bp.content is not None:
+            out[bp.post_id] = bp.content
+    if missing:
+        query = BlogContent.query.filter(BlogContent.post_id.in_(missing))
+        if columns is not None:
+            query = query.options(load_only(*(getattr(BlogContent, c) for c in {"post_id", *columns})))
+        else:
+            query = query.options(undefer_content())
+        for bc in query:
+            out[bc.post_id] = bc
+    return out
+
+def _content_dumps(posts, columns=None) -> dict[int, dict]:
+    """
+    post_id -> serialized content for a page of posts, trimmed to `columns`
+    when given. Whole rows come from the packed layout when
+    CONTENT_STORAGE="packed" (see content_store), else via _content_map.
+    """
+    if columns is None and content_store.reads_packed():
+        return content_store.contents(bp.post_id for bp in posts if bp is not None)
+    schema = blog_content_out if columns is None else _only_schema(BlogContentOutSchema, columns)
+    return {pid: schema.dump(bc) for pid, bc in _content_map(posts, columns).items()}
+
+def _embed_contents(posts, rows: list[dict], include_content: bool, projection=None):
+    """Attach dumped content to each serialized row (rows[i] <-> posts[i])."""
     if not include_content:
         return
-    bc = _get_content_row(bp.post_id)
-    if bc is not None:
-        # dump returns the flat content object you want
-        data["content"] = blog_content_out.dump(bc)
+    columns = projection.content_fields if projection is not None else None
+    contents = _content_dumps(posts, columns)
+    for bp, row in zip(posts, rows):
+        content = contents.get(bp.post_id) if bp is not None else None
+        if content is not None:
+            # the flat content object you want
+            row["content"] = content
+
+def _embed_content_if_requested(bp: BlogPost, data: dict, include_content: bool):
+    _embed_contents([bp], [data], include_content)
+
+_POST_LOADERS = {"selectin": selectinload, "joined": joinedload}
+
+# BlogPost.content is not loaded by default (its column groups are deferred);
+# endpoints that serialize the whole content row opt in with _full_content().
+_FULL_CONTENT = undefer_content(joinedload(BlogPost.content))
+
+def _full_content() -> list:
+    """Loader options for serializing whole content rows (none: served packed)."""
+    return [] if content_store.reads_packed() else [_FULL_CONTENT]
+
+def _post_list_options(via=None, strategy: str | None = None, projection=None, content: bool = False) -> list:
+    """
+    Loader-options preset for BlogPost list queries. Batch-loads the
+    relationships the list serializers read (author_first_name,
+    category_title, analytics) so a page costs a constant number of
+    statements instead of one lazy load per row and relationship.
+    Configured by POST_LIST_EAGER_LOADS / POST_LIST_LOAD_STRATEGY.
+    `via` chains the preset under a loader that reaches BlogPost
+    (e.g. contains_eager(NewsPost.post)); `strategy` overrides the config.
+    A `projection` (see _Projection) adds its column pushdown and drops
+    relationships the requested fields never touch, and joins the content
+    it embeds; without one, `content=True` joins the full content row.
+    """
+    loader = _POST_LOADERS[strategy or current_app.config.get("POST_LIST_LOAD_STRATEGY", "selectin")]
+    names = current_app.config.get("POST_LIST_EAGER_LOADS", ("author", "category", "analytics"))
+    if projection is not None:
+        names = [n for n in names if projection.needs_relationship(n)]
+    opts = [loader(getattr(BlogPost, name)) for name in names]
+    if projection is not None:
+        opts += projection.options()
+    elif content:
+        opts += _full_content()
+    return [via.options(*opts)] if via is not None else opts
+
+# ---------------------------------------------------------
+# Sparse fieldsets: ?fields= / ?content_fields=
+# ---------------------------------------------------------
+# Output keys the post endpoints add on top of BlogPostOutSchema
+_POST_EXTRA_FIELDS = {"image_url", "analytics", "views", "likes", "comments", "shares"}
+_POST_FIELDS = frozenset(set(BlogPostWithAnalyticsOutSchema._declared_fields) - {"content_mongo_id"} | _POST_EXTRA_FIELDS)
+_CONTENT_FIELDS = frozenset(BlogContentOutSchema._declared_fields)
+
+# Computed output key -> BlogPost columns / relationship it reads
+_POST_FIELD_DEPS = {"author_first_name": ("author_id", "author"), "category_title": ("blog_cat_id", "category")}
+
+@lru_cache(maxsize=128)
+def _only_schema(schema_cls, only: frozenset, many: bool = False):
+    return schema_cls(only=tuple(sorted(only)), many=many)
+
+class _Projection(NamedTuple):
+    """
+    Requested fieldsets for a post list call (None = everything).
+    Trims the marshmallow output and pushes the projection down to SQL with
+    load_only(), so card grids never read the ~60 BlogContent columns.
+    The post schemas never nest content: it is embedded separately, and
+    only when `content` is true.
+    """
+    fields: frozenset | None
+    content_fields: frozenset | None
+    include_content: bool
+
+    @property
+    def content(self) -> bool:
+        """Whether content is embedded at all."""
+        if not self.include_content:
+            return False
+        return self.fields is None or "content" in self.fields or self.content_fields is not None
+
+    def needs_relationship(self, name: str) -> bool:
+        if self.fields is None:
+            return True
+        if name == "analytics":
+            return True  # cheap 1:1 row; the list views always read it
+        return any(name in deps and key in self.fields for key, deps in _POST_FIELD_DEPS.items())
+
+    def options(self) -> list:
+        """load_only() / content loader options for a BlogPost query."""
+        opts = []
+        if self.fields is not None:
+            # post_id/created_at: identity + keyset; image: image_url is always computed
+            cols = {"post_id", "created_at", "image"}
+            cols |= self.fields & set(BlogPost.__table__.columns.keys())
+            for key, (fk, _rel) in _POST_FIELD_DEPS.items():
+                if key in self.fields:
+                    cols.add(fk)
+            opts.append(load_only(*(getattr(BlogPost, c) for c in cols)))
+        if self.content and self.content_fields is not None:
+            cols = {"blog_con_id", "post_id", *self.content_fields}
+            opts.append(joinedload(BlogPost.content).load_only(*(getattr(BlogContent, c) for c in cols)))
+        elif self.content:
+            opts += _full_content()
+        return opts
+
+    def post_schema(self, many: bool = False, analytics: bool = False):
+        schema_cls = BlogPostWithAnalyticsOutSchema if analytics else BlogPostOutSchema
+        if self.fields is None:
+            if analytics:
+                return blog_post_with_analytics_list_out if many else blog_post_with_analytics_out
+            return blog_post_list_out if many else blog_post_out
+        return _only_schema(schema_cls, self.fields & set(schema_cls._declared_fields) - {"content"}, many)
+
+    def trim(self, row: dict) -> dict:
+        if self.fields is None:
+            return row
+        keep = self.fields | ({"content"} if self.content else set())
+        return {k: v for k, v in row.items() if k in keep}
+
+def _parse_fieldset(arg: str, allowed: frozenset) -> frozenset | None:
+    raw = request.args.get(arg)
+    if not raw:
+        return None
+    names = frozenset(f.strip() for f in raw.split(",") if f.strip())
+    unknown = names - allowed
+    if unknown:
+        raise ValueError(f"Unknown {arg}: {', '.join(sorted(unknown))}")
+    return names
+
+def _request_projection(include_content: bool) -> _Projection:
+    """Parse ?fields= / ?content_fields=; raises ValueError on unknown names."""
+    return _Projection(
+        fields=_parse_fieldset("fields", _POST_FIELDS),
+        content_fields=_parse_fieldset("content_fields", _CONTENT_FIELDS),
+        include_content=include_content,
+    )
+
+# ---------------------------------------------------------
+# Pagination: offset (?page=) or keyset (?cursor=)
+# ---------------------------------------------------------
+def _encode_cursor(values) -> str:
+    raw = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def _decode_cursor(token: str, keys) -> list:
+    """Inverse of _encode_cursor; raises ValueError on anything malformed."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+    except Exception as e:
+        raise ValueError("Invalid cursor.") from e
+    if not isinstance(values, list) or len(values) != len(keys):
+        raise ValueError("Invalid cursor.")
+    decoded = []
+    for k, v in zip(keys, values):
+        # Keyset columns are NOT NULL DateTime / Integer: check each value so a
+        # forged cursor fails here (400), not in the comparison or the driver
+        if isinstance(k.type, db.DateTime) and isinstance(v, str):
+            try:
+                decoded.append(datetime.fromisoformat(v))
+            except (TypeError, ValueError) as e:
+                raise ValueError("Invalid cursor.") from e
+        elif isinstance(k.type, db.Integer) and isinstance(v, int) and not isinstance(v, bool):
+            decoded.append(v)
+        else:
+            raise ValueError("Invalid cursor.")
+    return decoded
+
+def _keyset_after(keys, values):
+    """Rows strictly after `values` in (keys DESC) order."""
+    return or_(*(
+        and_(*(k == v for k, v in zip(keys[:i], values[:i])), keys[i] < values[i])
+        for i in range(len(keys))
+    ))
+
+def _paginate(query, keys, page: int, per_page: int, *, order_by=None, key_of=None):
+    """
+    Page `query` (no ORDER BY yet) and return (rows, meta) where meta is
+    merged into the response body.
+
+    - Offset mode (default): .paginate() ordered by `order_by`
+      (defaults to `keys` DESC); meta = page/per_page/total/pages.
+    - Keyset mode (?cursor= present, empty for the first page): rows after
+      the cursor ordered by `keys` DESC, fetched with LIMIT per_page+1 and no
+      OFFSET/COUNT; meta = per_page/next_cursor (None on the last page),
+      plus total only when ?include_total=true.
+
+    `keys` must be unique together (end with a primary key). `key_of` maps a
+    row to the object carrying the key attributes (e.g. NewsPost -> BlogPost).
+    Raises ValueError for a malformed cursor.
+    """
+    if "cursor" not in request.args:
+        paged = query.order_by(*(order_by or [k.desc() for k in keys])).paginate(
+            page=page, per_page=per_page, error_out=False
+        )
+        return paged.items, {
+            "page": paged.page,
+            "per_page": paged.per_page,
+            "total": paged.total,
+            "pages": paged.pages,
+        }
+
+    per_page = max(1, per_page)
+    meta = {"per_page": per_page}
+    if request.args.get("include_total", default="false").lower() in ("1", "true", "yes"):
+        meta["total"] = query.order_by(None).count()
+
+    token = request.args.get("cursor") or ""
+    if token:
+        query = query.filter(_keyset_after(keys, _decode_cursor(token, keys)))
+    rows = query.order_by(*(k.desc() for k in keys)).limit(per_page + 1).all()
+
+    meta["next_cursor"] = None
+    if len(rows) > per_page:
+        rows = rows[:per_page]
+        last = key_of(rows[-1]) if key_of else rows[-1]
+        meta["next_cursor"] = _encode_cursor([getattr(last, k.key) for k in keys])
+    return rows, meta
+
+# ---------------------------------------------------------
+# Conditional GET (ETag / Last-Modified)
+# ---------------------------------------------------------
+class _Validators(NamedTuple):
+    etag: str
+    last_modified: datetime | None
+
+def _post_freshness(*criteria, joins=(), extra=()) -> tuple:
+    """
+    One aggregate row over the BlogPost rows matching `criteria`:
+    (count, max BlogPost/BlogContent/PostAnalytics updated_at, *extra).
+    `joins` are (target, onclause) pairs needed by the criteria.
+    """
+    stmt = (
+        select(
+            func.count(BlogPost.post_id),
+            func.max(BlogPost.updated_at),
+            func.max(BlogContent.updated_at),
+            func.max(PostAnalytics.updated_at),
+            *extra,
+        )
+        .select_from(BlogPost)
+        .outerjoin(BlogContent, BlogContent.post_id == BlogPost.post_id)
+        .outerjoin(PostAnalytics, PostAnalytics.post_id == BlogPost.post_id)
+    )
+    for target, onclause in joins:
+        stmt = stmt.join(target, onclause)
+    return tuple(db.session.execute(stmt.where(*criteria)).one())
+
+def _as_utc(dt: datetime) -> datetime:
+    return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
+
+def _validators(*parts) -> _Validators:
+    """
+    Strong ETag over the request (path + args) and `parts`; Last-Modified is
+    the newest datetime among `parts`.
+    """
+    stamps = [_as_utc(p) for p in parts if isinstance(p, datetime)]
+    raw = json.dumps(
+        [request.path, sorted(request.args.items(multi=True)),
+         [p.isoformat() if isinstance(p, (date, datetime)) else p for p in parts]]
+    )
+    return _Validators(
+        etag=hashlib.sha1(raw.encode()).hexdigest(),
+        last_modified=max(stamps).replace(microsecond=0) if stamps else None,
+    )
+
+def _not_modified(v: _Validators) -> Response | None:
+    """304 when If-None-Match / If-Modified-Since show the client is current."""
+    if request.if_none_match:
+        fresh = request.if_none_match.contains(v.etag)
+    elif request.if_modified_since and v.last_modified is not None:
+        fresh = v.last_modified <= request.if_modified_since
+    else:
+        fresh = False
+    return _with_validators(Response(status=304), v) if fresh else None
+
+def _with_validators(rv, v: _Validators) -> Response:
+    resp = current_app.make_response(rv)
+    if resp.status_code in (200, 304):
+        resp.set_etag(v.etag)
+        if v.last_modified is not None:
+            resp.last_modified = v.last_modified
+        resp.cache_control.no_cache = True  # always revalidate; 304s are cheap
+    return resp
 
 # ======================================================
 # BlogCategory (CRUD)
@@ -263,6 +664,8 @@ class BlogCategoryItemAPI(GuardedMethodView):
             db.session.rollback()
             return _json_error("Title or slug already exists.", 409)
 
+        response_cache.invalidate("posts", f"cat:{cat_id}")  # category_title is in every post payload
+        post_search.index_category(cat_id)
         return blog_category_out.dump(cat), 200
 
     def patch(self, cat_id: int):
@@ -285,12 +688,15 @@ class BlogCategoryItemAPI(GuardedMethodView):
             db.session.rollback()
             return _json_error("Title or slug already exists.", 409)
 
+        response_cache.invalidate("posts", f"cat:{cat_id}")  # category_title is in every post payload
+        post_search.index_category(cat_id)
         return blog_category_out.dump(cat), 200
 
     def delete(self, cat_id: int):
         cat = BlogCategory.query.get_or_404(cat_id)
         db.session.delete(cat)
         db.session.commit()
+        response_cache.invalidate("posts", f"cat:{cat_id}")
         return jsonify({"status": "deleted", "blog_cat_id": cat_id}), 200
 
 # ======================================================
@@ -377,6 +783,7 @@ class MyUserItemAPI(GuardedMethodView):
             db.session.rollback()
             return _json_error("Could not update user (constraint error).", 409)
 
+        response_cache.invalidate("posts")  # author_first_name
         return my_user_out.dump(user), 200
 
     def patch(self, user_id: int):
@@ -400,12 +807,14 @@ class MyUserItemAPI(GuardedMethodView):
             db.session.rollback()
             return _json_error("Could not update user (constraint error).", 409)
 
+        response_cache.invalidate("posts")  # author_first_name
         return my_user_out.dump(user), 200
 
     def delete(self, user_id: int):
         user = MyUser.query.get_or_404(user_id)
         db.session.delete(user)
         db.session.commit()
+        response_cache.invalidate("posts")
         return jsonify({"status": "deleted", "my_user_id": user_id}), 200
 
 
@@ -444,20 +853,18 @@ class AuthLoginAPI(GuardedMethodView):
 class BlogContentListAPI(GuardedMethodView):
     decorators_by_method = PUBLIC_READ_ADMIN_WRITE
     def get(self):
-        """List content rows (paginated)."""
+        """List content rows (paginated by ?page= or ?cursor=)."""
         page = request.args.get("page", default=1, type=int)
         per_page = request.args.get("per_page", default=20, type=int)
-        paged = BlogContent.query.order_by(BlogContent.updated_at.desc()).paginate(
-            page=page, per_page=per_page, error_out=False
-        )
-        data = blog_content_list_out.dump(paged.items)
-        return jsonify({
-            "items": data,
-            "page": paged.page,
-            "per_page": paged.per_page,
-            "total": paged.total,
-            "pages": paged.pages
-        }), 200
+        try:
+            rows, meta = _paginate(
+                BlogContent.query.options(undefer_content()), (BlogContent.updated_at, BlogContent.blog_con_id), page, per_page,
+                order_by=[BlogContent.updated_at.desc()],
+            )
+        except ValueError as e:
+            return _json_error(str(e), 400)
+        data = blog_content_list_out.dump(rows)
+        return jsonify({"items": data, **meta}), 200
 
     def post(self):
         """Create content for a post (enforces 1:1)."""
@@ -476,6 +883,8 @@ class BlogContentListAPI(GuardedMethodView):
         bc = BlogContent(post_id=post_id, content=payload.get("content"))
         db.session.add(bc)
         db.session.commit()
+        response_cache.invalidate(*_post_tags([post_id]))
+        post_search.index_posts([post_id])
         return blog_content_out.dump(bc), 201
 
 
@@ -504,6 +913,8 @@ class BlogContentItemAPI(GuardedMethodView):
             bc.content = payload.get("content")
 
         db.session.commit()
+        response_cache.invalidate(*_post_tags([post_id]))
+        post_search.index_posts([post_id])
         return blog_content_out.dump(bc), 200
 
     def patch(self, post_id: int):
@@ -519,6 +930,8 @@ class BlogContentItemAPI(GuardedMethodView):
         if "content" in payload:
             bc.content = payload["content"]
         db.session.commit()
+        response_cache.invalidate(*_post_tags([post_id]))
+        post_search.index_posts([post_id])
         return blog_content_out.dump(bc), 200
 
     def delete(self, post_id: int):
@@ -527,6 +940,8 @@ class BlogContentItemAPI(GuardedMethodView):
             return _json_error("Content row not found.", 404)
         db.session.delete(bc)
         db.session.commit()
+        response_cache.invalidate(*_post_tags([post_id]))
+        post_search.index_posts([post_id])
         return jsonify({"status": "deleted", "post_id": post_id}), 200
 
 # ======================================================
@@ -542,8 +957,22 @@ class BlogPostListAPI(GuardedMethodView):
         include_content = request.args.get("include_content", default="true").lower() in ("1", "true", "yes")
         include_analytics = request.args.get("include_analytics", default="false").lower() in ("1", "true", "yes")
 
-        query = BlogPost.query
-        if q:
+        try:
+            proj = _request_projection(include_content)
+        except ValueError as e:
+            return _json_error(str(e), 400)
+
+        query = BlogPost.query.options(*_post_list_options(projection=proj))
+        matches = None
+        if q and q.strip() and post_search.available():
+            # Full-text index (title, category, body); see /search/posts for ranked results
+            try:
+                matches = post_search.match_ids(q.strip())
+            except NotImplementedError as e:
+                current_app.logger.warning("Full-text search unavailable, using ILIKE: %s", e)
+        if matches is not None:
+            query = query.filter(BlogPost.post_id.in_(matches))
+        elif q:
             like = f"%{q.strip()}%"
             query = query.filter(
                 db.or_(
@@ -552,34 +981,26 @@ class BlogPostListAPI(GuardedMethodView):
                 )
             )
 
-        paged = query.order_by(BlogPost.created_at.desc()).paginate(page=page, per_page=per_page, error_out=False)
+        try:
+            rows, meta = _paginate(
+                query, (BlogPost.created_at, BlogPost.post_id), page, per_page,
+                order_by=[BlogPost.created_at.desc()],
+            )
+        except ValueError as e:
+            return _json_error(str(e), 400)
 
-        if include_analytics:
-            items = blog_post_with_analytics_list_out.dump(paged.items)
-        else:
-            items = blog_post_list_out.dump(paged.items)
+        items = proj.post_schema(many=True, analytics=include_analytics).dump(rows)
 
-        for i, row in enumerate(paged.items):
+        for i, row in enumerate(rows):
             # Hide legacy field if present in schema
             items[i].pop("content_mongo_id", None)
             items[i]["image_url"] = url_for("static", filename=row.image) if row.image else None
             if not include_analytics:
                 items[i]["analytics"] = _analytics_dict(getattr(row, "analytics", None))
 
-        if include_content:
-            for i, row in enumerate(paged.items):
-                bc = _get_content_row(row.post_id)
-                if bc is not None:
-                    # ✅ FIX: don’t .get("content"); dump returns the flat object we want
-                    items[i]["content"] = blog_content_out.dump(bc)
+        _embed_contents(rows, items, proj.content, proj)
 
-        return jsonify({
-            "items": items,
-            "page": paged.page,
-            "per_page": paged.per_page,
-            "total": paged.total,
-            "pages": paged.pages
-        }), 200
+        return jsonify({"items": [proj.trim(row) for row in items], **meta}), 200
 
     def post(self):
         # Accept multipart form (for file + JSON)
@@ -631,6 +1052,9 @@ class BlogPostListAPI(GuardedMethodView):
             db.session.add(bc)
             db.session.commit()
 
+        response_cache.invalidate("posts", f"cat:{post.blog_cat_id}")
+        post_search.index_posts([post.post_id])
+
         # Build response
         data = blog_post_out.dump(post)
         data["image_url"] = url_for("static", filename=post.image) if post.image else None
@@ -651,7 +1075,12 @@ class BlogPostItemAPI(GuardedMethodView):
         include_content = request.args.get("include_content", default="true").lower() in ("1", "true", "yes")
         include_analytics = request.args.get("include_analytics", default="false").lower() in ("1", "true", "yes")
 
-        post = _require_blog_post(ident)
+        v = _validators(*_post_freshness(_post_ident_clause(ident)))
+        not_modified = _not_modified(v)
+        if not_modified is not None:
+            return not_modified
+
+        post = _require_blog_post(ident, *(_full_content() if include_content else []))
         data = (blog_post_with_analytics_out.dump(post)
                 if include_analytics
                 else blog_post_out.dump(post))
@@ -663,10 +1092,11 @@ class BlogPostItemAPI(GuardedMethodView):
         _embed_content_if_requested(post, data, include_content)
         # Hide legacy field if present in schema
         data.pop("content_mongo_id", None)
-        return data, 200
+        return _with_validators((data, 200), v)
 
     def put(self, ident: str):
         post = _require_blog_post(ident)
+        old_cat_id = post.blog_cat_id
 
         if request.content_type and request.content_type.startswith("multipart/form-data"):
             image_file = request.files.get("image")
@@ -719,6 +1149,8 @@ class BlogPostItemAPI(GuardedMethodView):
         except IntegrityError:
             db.session.rollback()
             return _json_error("Title or slug already exists.", 409)
+        response_cache.invalidate(f"cat:{old_cat_id}", f"cat:{post.blog_cat_id}", *_post_tags([post.post_id]))
+        post_search.index_posts([post.post_id])
 
         data = blog_post_out.dump(post)
         data["image_url"] = url_for("static", filename=post.image) if post.image else None
@@ -734,6 +1166,7 @@ class BlogPostItemAPI(GuardedMethodView):
 
     def patch(self, ident: str):
         post = _require_blog_post(ident)
+        old_cat_id = post.blog_cat_id
 
         if request.content_type and request.content_type.startswith("multipart/form-data"):
             image_file = request.files.get("image")
@@ -783,6 +1216,8 @@ class BlogPostItemAPI(GuardedMethodView):
         except IntegrityError:
             db.session.rollback()
             return _json_error("Title or slug already exists.", 409)
+        response_cache.invalidate(f"cat:{old_cat_id}", f"cat:{post.blog_cat_id}", *_post_tags([post.post_id]))
+        post_search.index_posts([post.post_id])
 
         data = blog_post_out.dump(post)
         data["image_url"] = url_for("static", filename=post.image) if post.image else None
@@ -804,6 +1239,8 @@ class BlogPostItemAPI(GuardedMethodView):
             db.session.delete(bc)
         db.session.delete(post)
         db.session.commit()
+        response_cache.invalidate("posts", f"cat:{post.blog_cat_id}", *_post_tags([post.post_id]))
+        post_search.index_posts([post.post_id])
         return jsonify({"status": "deleted", "post_id": post.post_id}), 200
 
 
@@ -811,12 +1248,15 @@ class BlogPostItemAPI(GuardedMethodView):
 # Latest Blog (paginated, newest first)
 # ======================================================
 class LatestBlogAPI(GuardedMethodView):
+    @cached_response("posts")
     def get(self):
         """
         Return latest blog posts (newest first) with the SAME paging shape
         as /api/v1/blog-posts.
         Supports:
           - ?page=, ?per_page=
+          - ?cursor= (keyset mode; empty for the first page), ?include_total=true|false
+          - ?fields=a,b,... / ?content_fields=x,y,... (sparse fieldsets)
           - ?include_content=true|false
           - ?include_analytics=true|false
         """
@@ -825,38 +1265,38 @@ class LatestBlogAPI(GuardedMethodView):
         include_content = request.args.get("include_content", default="true").lower() in ("1", "true", "yes")
         include_analytics = request.args.get("include_analytics", default="false").lower() in ("1", "true", "yes")
 
-        query = BlogPost.query.order_by(BlogPost.created_at.desc())
-        paged = query.paginate(page=page, per_page=per_page, error_out=False)
+        try:
+            proj = _request_projection(include_content)
+        except ValueError as e:
+            return _json_error(str(e), 400)
 
-        if include_analytics:
-            items = blog_post_with_analytics_list_out.dump(paged.items)
-        else:
-            items = blog_post_list_out.dump(paged.items)
+        query = BlogPost.query.options(*_post_list_options(projection=proj))
+        try:
+            rows, meta = _paginate(
+                query, (BlogPost.created_at, BlogPost.post_id), page, per_page,
+                order_by=[BlogPost.created_at.desc()],
+            )
+        except ValueError as e:
+            return _json_error(str(e), 400)
 
-        for i, row in enumerate(paged.items):
+        items = proj.post_schema(many=True, analytics=include_analytics).dump(rows)
+
+        for i, row in enumerate(rows):
             items[i].pop("content_mongo_id", None)
             items[i]["image_url"] = url_for("static", filename=row.image) if row.image else None
             if not include_analytics:
                 items[i]["analytics"] = _analytics_dict(getattr(row, "analytics", None))
 
-        if include_content:
-            for i, row in enumerate(paged.items):
-                bc = _get_content_row(row.post_id)
-                if bc is not None:
-                    items[i]["content"] = blog_content_out.dump(bc)
+        _embed_contents(rows, items, proj.content, proj)
+        cache_tags(*_post_tags(row.post_id for row in rows))
 
-        return jsonify({
-            "items": items,
-            "page": paged.page,
-            "per_page": paged.per_page,
-            "total": paged.total,
-            "pages": paged.pages
-        }), 200
+        return jsonify({"items": [proj.trim(row) for row in items], **meta}), 200
 
 # ---------------------------------------------------------
 # BlogPostReadNextAPI (accepts id or slug)
 # ---------------------------------------------------------
 class BlogPostReadNextAPI(GuardedMethodView):
+    @cached_response("posts")
     def get(self, ident: str):
         """
         GET /api/v1/blog/<ident>/read-next
@@ -871,40 +1311,48 @@ class BlogPostReadNextAPI(GuardedMethodView):
         include_content = request.args.get("include_content", default="false").lower() in ("1", "true", "yes")
         include_analytics = request.args.get("include_analytics", default="false").lower() in ("1", "true", "yes")
 
-        bp_current = _require_blog_post(ident)
+        try:
+            proj = _request_projection(include_content)
+        except ValueError as e:
+            return _json_error(str(e), 400)
+
+        current = _require_post_ref(ident)
 
         rows = (
             BlogPost.query
-            .filter(BlogPost.post_id != bp_current.post_id)
+            .options(*_post_list_options(projection=proj))
+            .filter(BlogPost.post_id != current.post_id)
             .order_by(BlogPost.created_at.desc())
             .limit(limit)
             .all()
         )
 
         items = []
+        contents = _content_dumps(rows, proj.content_fields) if proj.content else {}
         for bp in rows:
-            row = blog_post_out.dump(bp)
+            row = proj.post_schema().dump(bp)
             row.pop("content_mongo_id", None)
             row["image_url"] = url_for("static", filename=bp.image) if bp.image else None
 
-            if include_content:
-                bc = _get_content_row(bp.post_id)
-                if bc is not None:
-                    row["content"] = blog_content_out.dump(bc)
+            content = contents.get(bp.post_id)
+            if content is not None:
+                row["content"] = content
 
             if include_analytics:
                 row.update(_analytics_dict(getattr(bp, "analytics", None)))
             else:
                 row["analytics"] = _analytics_dict(getattr(bp, "analytics", None))
 
-            items.append(row)
+            items.append(proj.trim(row))
 
+        cache_tags(*_post_tags([current.post_id, *(bp.post_id for bp in rows)]))
         return jsonify({"items": items, "count": len(items)}), 200
 
 # ---------------------------------------------------------
 # BlogPostRelatedAPI (accepts id or slug)
 # ---------------------------------------------------------
 class BlogPostRelatedAPI(GuardedMethodView):
+    @cached_response("posts")
     def get(self, ident: str):
         """
         GET /api/v1/blog/<ident>/related
@@ -919,12 +1367,18 @@ class BlogPostRelatedAPI(GuardedMethodView):
         include_content = request.args.get("include_content", default="false").lower() in ("1", "true", "yes")
         include_analytics = request.args.get("include_analytics", default="false").lower() in ("1", "true", "yes")
 
-        bp_current = _require_blog_post(ident)
-        cat_id = bp_current.blog_cat_id
+        try:
+            proj = _request_projection(include_content)
+        except ValueError as e:
+            return _json_error(str(e), 400)
+
+        current = _require_post_ref(ident)
+        cat_id = current.blog_cat_id
 
         rows = (
             BlogPost.query
-            .filter(BlogPost.post_id != bp_current.post_id)
+            .options(*_post_list_options(projection=proj))
+            .filter(BlogPost.post_id != current.post_id)
             .filter(BlogPost.blog_cat_id == cat_id)
             .order_by(BlogPost.created_at.desc())
             .limit(limit)
@@ -932,23 +1386,24 @@ class BlogPostRelatedAPI(GuardedMethodView):
         )
 
         items = []
+        contents = _content_dumps(rows, proj.content_fields) if proj.content else {}
         for bp in rows:
-            row = blog_post_out.dump(bp)
+            row = proj.post_schema().dump(bp)
             row.pop("content_mongo_id", None)
             row["image_url"] = url_for("static", filename=bp.image) if bp.image else None
 
-            if include_content:
-                bc = _get_content_row(bp.post_id)
-                if bc is not None:
-                    row["content"] = blog_content_out.dump(bc)
+            content = contents.get(bp.post_id)
+            if content is not None:
+                row["content"] = content
 
             if include_analytics:
                 row.update(_analytics_dict(getattr(bp, "analytics", None)))
             else:
                 row["analytics"] = _analytics_dict(getattr(bp, "analytics", None))
 
-            items.append(row)
+            items.append(proj.trim(row))
 
+        cache_tags(f"cat:{cat_id}", *_post_tags([current.post_id, *(bp.post_id for bp in rows)]))
         return jsonify({"items": items, "count": len(items)}), 200
 
 # ======================================================
@@ -962,34 +1417,43 @@ class NewsPostListAPI(GuardedMethodView):
         include_content = request.args.get("include_content", default="true").lower() in ("1", "true", "yes")
         include_analytics = request.args.get("include_analytics", default="false").lower() in ("1", "true", "yes")
 
-        query = NewsPost.query.join(BlogPost, NewsPost.post_id == BlogPost.post_id)
-        paged = query.order_by(BlogPost.created_at.desc()).paginate(page=page, per_page=per_page, error_out=False)
+        try:
+            proj = _request_projection(include_content)
+        except ValueError as e:
+            return _json_error(str(e), 400)
+
+        query = (
+            NewsPost.query
+            .join(BlogPost, NewsPost.post_id == BlogPost.post_id)
+            .options(*_post_list_options(via=contains_eager(NewsPost.post), projection=proj))
+        )
+        try:
+            rows, meta = _paginate(
+                query, (BlogPost.created_at, BlogPost.post_id), page, per_page,
+                order_by=[BlogPost.created_at.desc()], key_of=lambda news: news.post,
+            )
+        except ValueError as e:
+            return _json_error(str(e), 400)
 
         items = []
-        for news in paged.items:
-            bp = news.post
-            row = blog_post_out.dump(bp)
+        posts = [news.post for news in rows]
+        contents = _content_dumps(posts, proj.content_fields) if proj.content else {}
+        for bp in posts:
+            row = proj.post_schema().dump(bp)
             row.pop("content_mongo_id", None)
             row["image_url"] = url_for("static", filename=bp.image) if bp.image else None
 
-            if include_content:
-                bc = _get_content_row(bp.post_id)
-                if bc is not None:
-                    row["content"] = blog_content_out.dump(bc)
+            content = contents.get(bp.post_id)
+            if content is not None:
+                row["content"] = content
 
             if include_analytics:
                 row.update(_analytics_dict(getattr(bp, "analytics", None)))
             else:
                 row["analytics"] = _analytics_dict(getattr(bp, "analytics", None))
-            items.append(row)
+            items.append(proj.trim(row))
 
-        return jsonify({
-            "items": items,
-            "page": paged.page,
-            "per_page": paged.per_page,
-            "total": paged.total,
-            "pages": paged.pages
-        }), 200
+        return jsonify({"items": items, **meta}), 200
 
     def post(self):
         """Create a NewsPost row tied to an existing BlogPost.post_id."""
@@ -1009,6 +1473,7 @@ class NewsPostListAPI(GuardedMethodView):
         news = NewsPost(post_id=post_id)
         db.session.add(news)
         db.session.commit()
+        response_cache.invalidate("news", *_post_tags([post_id]))
 
         data = blog_post_out.dump(bp)
         data["image_url"] = url_for("static", filename=bp.image) if bp.image else None
@@ -1025,14 +1490,19 @@ class NewsPostItemAPI(GuardedMethodView):
         include_content = request.args.get("include_content", default="true").lower() in ("1", "true", "yes")
         include_analytics = request.args.get("include_analytics", default="false").lower() in ("1", "true", "yes")
 
+        v = _validators(*_post_freshness(
+            _post_ident_clause(ident), joins=[(NewsPost, NewsPost.post_id == BlogPost.post_id)]
+        ))
+        not_modified = _not_modified(v)
+        if not_modified is not None:
+            return not_modified
+
         bp = _require_news_blogpost(ident)
         data = blog_post_out.dump(bp)
         data["image_url"] = url_for("static", filename=bp.image) if bp.image else None
 
         if include_content:
-            bc = _get_content_row(bp.post_id)
-            if bc is not None:
-                data["content"] = blog_content_out.dump(bc)
+            _embed_content_if_requested(bp, data, True)
 
         if include_analytics:
             data.update(_analytics_dict(getattr(bp, "analytics", None)))
@@ -1040,7 +1510,7 @@ class NewsPostItemAPI(GuardedMethodView):
             data["analytics"] = _analytics_dict(getattr(bp, "analytics", None))
 
         data.pop("content_mongo_id", None)
-        return data, 200
+        return _with_validators((data, 200), v)
 
     def put(self, ident: str):
         """NewsPost rows are thin; PUT just echoes current BlogPost shape."""
@@ -1086,64 +1556,80 @@ class NewsPostItemAPI(GuardedMethodView):
             news = NewsPost.query.get_or_404(bp.post_id)
         db.session.delete(news)
         db.session.commit()
+        response_cache.invalidate("news", *_post_tags([news.post_id]))
         return jsonify({"status": "deleted", "news_post_id": news.post_id}), 200
 
 # ---------------------------------------------------------
 # NewsPostReadNextAPI (accepts id or slug)
 # ---------------------------------------------------------
 class NewsPostReadNextAPI(GuardedMethodView):
+    @cached_response("posts", "news")
     def get(self, ident: str):
         limit = request.args.get("limit", default=3, type=int)
         include_content = request.args.get("include_content", default="false").lower() in ("1", "true", "yes")
         include_analytics = request.args.get("include_analytics", default="false").lower() in ("1", "true", "yes")
 
-        bp_current = _require_news_blogpost(ident)
+        try:
+            proj = _request_projection(include_content)
+        except ValueError as e:
+            return _json_error(str(e), 400)
+
+        current = _require_post_ref(ident, news=True)
 
         rows = (
             BlogPost.query
+            .options(*_post_list_options(projection=proj))
             .join(NewsPost, NewsPost.post_id == BlogPost.post_id)
-            .filter(BlogPost.post_id != bp_current.post_id)
+            .filter(BlogPost.post_id != current.post_id)
             .order_by(BlogPost.created_at.desc())
             .limit(limit)
             .all()
         )
 
         items = []
+        contents = _content_dumps(rows, proj.content_fields) if proj.content else {}
         for bp in rows:
-            row = blog_post_out.dump(bp)
+            row = proj.post_schema().dump(bp)
             row.pop("content_mongo_id", None)
             row["image_url"] = url_for("static", filename=bp.image) if bp.image else None
 
-            if include_content:
-                bc = _get_content_row(bp.post_id)
-                if bc is not None:
-                    row["content"] = blog_content_out.dump(bc)
+            content = contents.get(bp.post_id)
+            if content is not None:
+                row["content"] = content
 
             if include_analytics:
                 row.update(_analytics_dict(getattr(bp, "analytics", None)))
             else:
                 row["analytics"] = _analytics_dict(getattr(bp, "analytics", None))
 
-            items.append(row)
+            items.append(proj.trim(row))
 
+        cache_tags(*_post_tags([current.post_id, *(bp.post_id for bp in rows)]))
         return jsonify({"items": items, "count": len(items)}), 200
 
 # ---------------------------------------------------------
 # NewsPostRelatedAPI (accepts id or slug)
 # ---------------------------------------------------------
 class NewsPostRelatedAPI(GuardedMethodView):
+    @cached_response("posts", "news")
     def get(self, ident: str):
         limit = request.args.get("limit", default=4, type=int)
         include_content = request.args.get("include_content", default="false").lower() in ("1", "true", "yes")
         include_analytics = request.args.get("include_analytics", default="false").lower() in ("1", "true", "yes")
 
-        bp_current = _require_news_blogpost(ident)
-        cat_id = bp_current.blog_cat_id
+        try:
+            proj = _request_projection(include_content)
+        except ValueError as e:
+            return _json_error(str(e), 400)
+
+        current = _require_post_ref(ident, news=True)
+        cat_id = current.blog_cat_id
 
         rows = (
             BlogPost.query
+            .options(*_post_list_options(projection=proj))
             .join(NewsPost, NewsPost.post_id == BlogPost.post_id)
-            .filter(BlogPost.post_id != bp_current.post_id)
+            .filter(BlogPost.post_id != current.post_id)
             .filter(BlogPost.blog_cat_id == cat_id)
             .order_by(BlogPost.created_at.desc())
             .limit(limit)
@@ -1151,23 +1637,24 @@ class NewsPostRelatedAPI(GuardedMethodView):
         )
 
         items = []
+        contents = _content_dumps(rows, proj.content_fields) if proj.content else {}
         for bp in rows:
-            row = blog_post_out.dump(bp)
+            row = proj.post_schema().dump(bp)
             row.pop("content_mongo_id", None)
             row["image_url"] = url_for("static", filename=bp.image) if bp.image else None
 
-            if include_content:
-                bc = _get_content_row(bp.post_id)
-                if bc is not None:
-                    row["content"] = blog_content_out.dump(bc)
+            content = contents.get(bp.post_id)
+            if content is not None:
+                row["content"] = content
 
             if include_analytics:
                 row.update(_analytics_dict(getattr(bp, "analytics", None)))
             else:
                 row["analytics"] = _analytics_dict(getattr(bp, "analytics", None))
 
-            items.append(row)
+            items.append(proj.trim(row))
 
+        cache_tags(f"cat:{cat_id}", *_post_tags([current.post_id, *(bp.post_id for bp in rows)]))
         return jsonify({"items": items, "count": len(items)}), 200
 
 # ======================================================
@@ -1175,6 +1662,7 @@ class NewsPostRelatedAPI(GuardedMethodView):
 # ======================================================
 class NewsMainListAPI(GuardedMethodView):
     decorators_by_method = PUBLIC_READ_ADMIN_WRITE
+    @cached_response("news-main")
     def get(self):
         page = request.args.get("page", default=1, type=int)
         per_page = request.args.get("per_page", default=20, type=int)
@@ -1182,41 +1670,58 @@ class NewsMainListAPI(GuardedMethodView):
         active_only = request.args.get("active", default=None)
 
         query = NewsMain.query
+        window = []
+        extra = [func.count(NewsMain.news_main_id), func.max(NewsMain.updated_at)]
 
         if active_only is not None and str(active_only).lower() in ("1", "true", "yes"):
             today = func.current_date()
-            query = query.filter(and_(NewsMain.start_date <= today, NewsMain.end_date >= today))
-
-        query = query.join(BlogPost, NewsMain.post_id == BlogPost.post_id)
+            window = [NewsMain.start_date <= today, NewsMain.end_date >= today]
+            extra.append(today)  # the active set also changes at midnight
+            query = query.filter(and_(*window))
+
+        # Validators over every matching row (a superset of the page)
+        v = _validators(*_post_freshness(
+            *window, joins=[(NewsMain, NewsMain.post_id == BlogPost.post_id)], extra=extra
+        ))
+        not_modified = _not_modified(v)
+        if not_modified is not None:
+            return not_modified
+
+        query = query.join(BlogPost, NewsMain.post_id == BlogPost.post_id).options(
+            *_post_list_options(
+                via=joinedload(NewsMain.news_post).selectinload(NewsPost.post), content=include_content
+            )
+        )
 
         paged = query.order_by(NewsMain.start_date.desc(), NewsMain.created_at.desc()) \
                      .paginate(page=page, per_page=per_page, error_out=False)
 
         items = []
-        for nm in paged.items:
-            bp = _news_main_post(nm)
+        posts = [_news_main_post(nm) for nm in paged.items]
+        cache_tags(*_post_tags(bp.post_id for bp in posts if bp is not None))
+        contents = _content_dumps(posts) if include_content else {}
+        for nm, bp in zip(paged.items, posts):
             nm_row = news_main_out.dump(nm)
             post_row = blog_post_out.dump(bp) if bp else {}
             post_row.pop("content_mongo_id", None)
             if bp and bp.image:
                 post_row["image_url"] = url_for("static", filename=bp.image)
-            if include_content and bp:
-                bc = _get_content_row(bp.post_id)
-                if bc is not None:
-                    post_row["content"] = blog_content_out.dump(bc)
+            content = contents.get(bp.post_id) if bp else None
+            if content is not None:
+                post_row["content"] = content
             post_row["analytics"] = _analytics_dict(getattr(bp, "analytics", None)) if bp else _analytics_dict(None)
             items.append({
                 "news_main": nm_row,
                 "post": post_row,
             })
 
-        return jsonify({
+        return _with_validators((jsonify({
             "items": items,
             "page": paged.page,
             "per_page": paged.per_page,
             "total": paged.total,
             "pages": paged.pages
-        }), 200
+        }), 200), v)
 
     def post(self):
         payload = request.get_json(silent=True) or {}
@@ -1241,6 +1746,7 @@ class NewsMainListAPI(GuardedMethodView):
         except IntegrityError:
             db.session.rollback()
             return _json_error("Could not create NewsMain (constraint violation: overlapping window or duplicate).", 409)
+        response_cache.invalidate("news-main")
 
         data = {
             "news_main": news_main_out.dump(nm),
@@ -1263,9 +1769,7 @@ class NewsMainItemAPI(GuardedMethodView):
         if bp and bp.image:
             post_row["image_url"] = url_for("static", filename=bp.image)
         if include_content and bp:
-            bc = _get_content_row(bp.post_id)
-            if bc is not None:
-                post_row["content"] = blog_content_out.dump(bc)
+            _embed_content_if_requested(bp, post_row, True)
         post_row["analytics"] = _analytics_dict(getattr(bp, "analytics", None)) if bp else _analytics_dict(None)
         post_row.pop("content_mongo_id", None)
         return {"news_main": nm_row, "post": post_row}, 200
@@ -1296,6 +1800,7 @@ class NewsMainItemAPI(GuardedMethodView):
         except IntegrityError:
             db.session.rollback()
             return _json_error("Could not update NewsMain (constraint violation: overlapping window or duplicate).", 409)
+        response_cache.invalidate("news-main")
 
         bp = _news_main_post(nm)
         post_row = blog_post_out.dump(bp) if bp else {}
@@ -1312,6 +1817,7 @@ class NewsMainItemAPI(GuardedMethodView):
         nm = NewsMain.query.get_or_404(news_main_id)
         db.session.delete(nm)
         db.session.commit()
+        response_cache.invalidate("news-main")
         return jsonify({"status": "deleted", "news_main_id": news_main_id}), 200
 
 # ======================================================
@@ -1323,17 +1829,15 @@ class PostAnalyticsListAPI(GuardedMethodView):
         page = request.args.get("page", default=1, type=int)
         per_page = request.args.get("per_page", default=50, type=int)
 
-        paged = PostAnalytics.query.order_by(PostAnalytics.updated_at.desc()).paginate(
-            page=page, per_page=per_page, error_out=False
-        )
-        data = post_analytics_list_out.dump(paged.items)
-        return jsonify({
-            "items": data,
-            "page": paged.page,
-            "per_page": paged.per_page,
-            "total": paged.total,
-            "pages": paged.pages
-        }), 200
+        try:
+            rows, meta = _paginate(
+                PostAnalytics.query, (PostAnalytics.updated_at, PostAnalytics.post_analytics_id), page, per_page,
+                order_by=[PostAnalytics.updated_at.desc()],
+            )
+        except ValueError as e:
+            return _json_error(str(e), 400)
+        data = post_analytics_list_out.dump(rows)
+        return jsonify({"items": data, **meta}), 200
 
     def post(self):
         payload = request.get_json(silent=True) or {}
@@ -1357,6 +1861,8 @@ class PostAnalyticsListAPI(GuardedMethodView):
         )
         db.session.add(pa)
         db.session.commit()
+        response_cache.invalidate(*_post_tags([post_id]))
+        most_read.mark_dirty()  # re-ranked by refresh_if_due(), like hit flushes
         return post_analytics_out.dump(pa), 201
 
 
@@ -1387,6 +1893,8 @@ class PostAnalyticsItemAPI(GuardedMethodView):
         except IntegrityError:
             db.session.rollback()
             return _json_error("Could not update analytics.", 409)
+        response_cache.invalidate(*_post_tags([post_id]))
+        most_read.mark_dirty()  # re-ranked by refresh_if_due(), like hit flushes
 
         return post_analytics_out.dump(pa), 200
 
@@ -1396,44 +1904,97 @@ class PostAnalyticsItemAPI(GuardedMethodView):
             return _json_error("Analytics row not found.", 404)
         db.session.delete(pa)
         db.session.commit()
+        response_cache.invalidate(*_post_tags([post_id]))
+        most_read.mark_dirty()  # re-ranked by refresh_if_due(), like hit flushes
         return jsonify({"status": "deleted", "post_id": post_id}), 200
 
+class PostAnalyticsHitAPI(GuardedMethodView):
+    def post(self, post_id: int):
+        """
+        POST /api/v1/post-analytics/<post_id>/hit   (public)
+        Body: { "event": "view" | "like" | "share" }   (default "view")
+        Records one increment in this worker's write-behind buffer; it is
+        applied to post_analytics by the next flush (no DB work here).
+        """
+        payload = request.get_json(silent=True) or {}
+        errors = post_analytics_hit.validate(payload)
+        if errors:
+            return _json_error(errors, 400)
+
+        event = payload.get("event", "view")
+        hit_buffer.add(post_id, HIT_EVENTS[event])
+        return jsonify({"status": "accepted", "post_id": post_id, "event": event}), 202
+
 # ======================================================
-# Most-read (from SQL Views) — read-only helpers
+# Most-read (materialized rankings, see rankings.py)
 # ======================================================
+def _most_read_rows(scope: str, period: str = "all", limit: int | None = None) -> list[dict]:
+    """Top `limit` rows of a most-read ranking, with image_url."""
+    out = most_read.top(scope, period, limit)
+    for row in out:
+        row["image_url"] = url_for("static", filename=row["image"]) if row.get("image") else None
+    return out
+
+def _most_read_response(scope: str):
+    """
+    ?window=all|24h|7d|30d (default all) and ?limit= (default: the whole
+    ranking, as the legacy views returned; capped at MOST_READ_TOP_N).
+    `views` is the count within the window; "all" lists unviewed posts too
+    (like the legacy views), the windows only posts viewed in them.
+    Validators are computed over the ranked rows themselves, so even a 304
+    stays O(limit).
+    """
+    period = request.args.get("window", default="all")
+    if period not in RANK_PERIODS:
+        return _json_error(f"window must be one of: {', '.join(RANK_PERIODS)}.", 400)
+    limit = request.args.get("limit", type=int)
+
+    out = _most_read_rows(scope, period, limit)
+    v = _validators(*(
+        row[k] for row in out
+        for k in ("post_id", "views", "likes", "comments", "shares", "title", "slug", "image")
+    ))
+    not_modified = _not_modified(v)
+    if not_modified is not None:
+        return not_modified
+
+    cache_tags(*_post_tags(row["post_id"] for row in out))
+    return _with_validators((jsonify({"items": out, "count": len(out), "window": period}), 200), v)
+
+def _latest_news_subquery(limit: int | None = None):
+    """
+    v_latest_news_posts numbered by row_number() so its order survives a
+    join (ORDER BY .c.pos); the limit is applied in SQL. A view's ORDER BY
+    is not guaranteed once it is joined or numbered, so the window (and the
+    LIMIT) spell out the view's ordering: newest post first, ties by id.
+    """
+    order = "bp.created_at DESC, bp.post_id DESC"
+    sql = (
+        f"SELECT v.post_id, row_number() OVER (ORDER BY {order}) AS pos"
+        " FROM atllocal_db.v_latest_news_posts v"
+        " JOIN atllocal_db.blog_post bp ON bp.post_id = v.post_id"
+        f" ORDER BY {order}"
+    )
+    params = {}
+    if limit is not None and limit > 0:
+        sql += " LIMIT :limit"
+        params["limit"] = limit
+    return text(sql).bindparams(**params).columns(post_id=db.Integer, pos=db.Integer).subquery("latest")
+
 class MostReadBlogAPI(GuardedMethodView):
+    @cached_response("posts", "analytics")
     def get(self):
-        sql = text("""
-            SELECT post_id, title, slug, image, blog_cat_id, author_id,
-                   created_at, views, likes, comments, shares
-            FROM atllocal_db.v_most_read_blog_posts
-        """)
-        rows = db.session.execute(sql).mappings().all()
-        out = []
-        for r in rows:
-            row = dict(r)
-            row["image_url"] = url_for("static", filename=row["image"]) if row.get("image") else None
-            out.append(row)
-        return jsonify({"items": out, "count": len(out)}), 200
+        return _most_read_response("blog")
 
 
 class MostReadNewsAPI(GuardedMethodView):
+    @cached_response("posts", "news", "analytics")
     def get(self):
-        sql = text("""
-            SELECT post_id, title, slug, image, blog_cat_id, author_id,
-                   created_at, views, likes, comments, shares
-            FROM atllocal_db.v_most_read_news_posts
-        """)
-        rows = db.session.execute(sql).mappings().all()
-        out = []
-        for r in rows:
-            row = dict(r)
-            row["image_url"] = url_for("static", filename=row["image"]) if row.get("image") else None
-            out.append(row)
-        return jsonify({"items": out, "count": len(out)}), 200
+        return _most_read_response("news")
 
 
 class LatestNewsAPI(GuardedMethodView):
+    @cached_response("posts", "news")
     def get(self):
         """
         Return latest news posts as FULL post objects (like /api/v1/news-posts),
@@ -1441,38 +2002,291 @@ class LatestNewsAPI(GuardedMethodView):
         """
         include_content = request.args.get("include_content", default="true").lower() in ("1", "true", "yes")
         include_analytics = request.args.get("include_analytics", default="false").lower() in ("1", "true", "yes")
+
+        try:
+            proj = _request_projection(include_content)
+        except ValueError as e:
+            return _json_error(str(e), 400)
         per_page = request.args.get("per_page", type=int)
 
-        sql = text("""SELECT post_id FROM atllocal_db.v_latest_news_posts""")
-        rows = db.session.execute(sql).mappings().all()
-        post_ids = [r["post_id"] for r in rows]
+        v = _validators(*_post_freshness(joins=[(NewsPost, NewsPost.post_id == BlogPost.post_id)]))
+        not_modified = _not_modified(v)
+        if not_modified is not None:
+            return not_modified
 
-        if per_page is not None and per_page > 0:
-            post_ids = post_ids[:per_page]
+        latest = _latest_news_subquery(per_page)
 
-        items = []
-        for pid in post_ids:
-            bp = BlogPost.query.get(pid)
-            if not bp:
-                continue
+        # One statement: posts + content (joined by default) + author/category/analytics
+        posts = (
+            BlogPost.query
+            .join(latest, latest.c.post_id == BlogPost.post_id)
+            .options(*_post_list_options(strategy="joined", projection=proj))
+            .order_by(latest.c.pos)
+            .all()
+        )
+        contents = _content_dumps(posts, proj.content_fields) if proj.content else {}
+        cache_tags(*_post_tags(bp.post_id for bp in posts))
 
-            row = blog_post_out.dump(bp)
+        items = []
+        for bp in posts:
+            row = proj.post_schema().dump(bp)
             row.pop("content_mongo_id", None)
             row["image_url"] = url_for("static", filename=bp.image) if bp.image else None
 
-            if include_content:
-                bc = _get_content_row(bp.post_id)
-                if bc is not None:
-                    row["content"] = blog_content_out.dump(bc)
+            content = contents.get(bp.post_id)
+            if content is not None:
+                row["content"] = content
 
             if include_analytics:
                 row.update(_analytics_dict(getattr(bp, "analytics", None)))
             else:
                 row["analytics"] = _analytics_dict(getattr(bp, "analytics", None))
 
+            items.append(proj.trim(row))
+
+        return _with_validators((jsonify({"items": items, "count": len(items)}), 200), v)
+
+# ======================================================
+# Full-text search over posts (see post_search.py)
+# ======================================================
+_search_card_out = BlogPostOutSchema(
+    only=("post_id", "title", "slug", "image", "blog_cat_id", "category_title", "created_at")
+)
+
+class PostSearchAPI(GuardedMethodView):
+    @cached_response("posts")
+    def get(self):
+        """
+        GET /api/v1/search/posts?q=...
+        Query params:
+          - q (required; websearch syntax on Postgres, all terms + prefix on SQLite)
+          - scope=news (optional; news posts only)
+          - page, per_page (default 1, 20; per_page max 50)
+        Response:
+          { "items": [{post card..., "image_url", "rank", "snippet"}], "count", "page", "per_page", "q" }
+        `snippet` is HTML-escaped body text with matches wrapped in <mark>.
+        """
+        q = (request.args.get("q") or "").strip()
+        if not q:
+            return _json_error("q is required.", 400)
+        page = max(request.args.get("page", default=1, type=int), 1)
+        per_page = min(max(request.args.get("per_page", default=20, type=int), 1), 50)
+        scope = request.args.get("scope")
+
+        hits = None
+        if post_search.available():
+            try:
+                hits = post_search.search(q, scope=scope, limit=per_page, offset=(page - 1) * per_page)
+            except (SQLAlchemyError, NotImplementedError) as e:
+                db.session.rollback()
+                current_app.logger.warning("Full-text search unavailable, using ILIKE: %s", e)
+        if hits is None:
+            # No index yet: title/slug substring match, newest first
+            like = f"%{q}%"
+            fallback = select(BlogPost.post_id).where(or_(BlogPost.title.ilike(like), BlogPost.slug.ilike(like)))
+            if scope == "news":
+                fallback = fallback.join(NewsPost, NewsPost.post_id == BlogPost.post_id)
+            ids = db.session.execute(
+                fallback.order_by(BlogPost.created_at.desc(), BlogPost.post_id.desc())
+                .limit(per_page).offset((page - 1) * per_page)
+            ).scalars().all()
+            hits = [post_search.SearchHit(pid, 0.0, None) for pid in ids]
+
+        posts = {
+            bp.post_id: bp for bp in
+            BlogPost.query.options(
+                load_only(BlogPost.post_id, BlogPost.title, BlogPost.slug, BlogPost.image,
+                          BlogPost.blog_cat_id, BlogPost.created_at),
+                joinedload(BlogPost.category),
+            ).filter(BlogPost.post_id.in_([h.post_id for h in hits])).all()
+        } if hits else {}
+
+        items = []
+        for hit in hits:
+            bp = posts.get(hit.post_id)
+            if bp is None:
+                continue
+            row = _search_card_out.dump(bp)
+            row["image_url"] = url_for("static", filename=bp.image) if bp.image else None
+            row["rank"] = round(hit.rank, 6)
+            row["snippet"] = hit.snippet
             items.append(row)
 
-        return jsonify({"items": items, "count": len(items)}), 200
+        cache_tags(*_post_tags(posts))
+        return jsonify({"items": items, "count": len(items), "page": page, "per_page": per_page, "q": q}), 200
+
+# ======================================================
+# Page bundles — every section of a page in one request
+# ======================================================
+class _PostRows:
+    """
+    Loads every post a page needs in one batched query (author, category,
+    analytics joined) and serializes each post once, so sections that
+    repeat a post share the same row. Rows embed their whole content for
+    the posts in `content_ids` (None = all, joined into the same query),
+    and only `card_columns` of it (None = whole) for the other `card_ids`.
+    """
+
+    def __init__(self, post_ids, content_ids=None, card_ids=(), card_columns=None):
+        ids = list(dict.fromkeys(pid for pid in post_ids if pid is not None))
+        posts = (
+            BlogPost.query.options(*_post_list_options(strategy="joined", content=content_ids is None))
+            .filter(BlogPost.post_id.in_(ids)).all()
+        ) if ids else []
+        self.posts = {bp.post_id: bp for bp in posts}
+        if content_ids is None:
+            self.contents = _content_dumps(self.posts.values())
+        else:
+            full = set(content_ids)
+            if card_columns is None:
+                full.update(card_ids)
+            self.contents = _content_dumps([self.posts.get(pid) for pid in full])
+            cards = [self.posts.get(pid) for pid in dict.fromkeys(card_ids) if pid not in full]
+            if cards:
+                self.contents.update(_content_dumps(cards, card_columns))
+        self._rows: dict[int, dict] = {}
+
+    def row(self, post_id: int) -> dict | None:
+        if post_id not in self._rows:
+            bp = self.posts.get(post_id)
+            if bp is None:
+                return None
+            row = blog_post_out.dump(bp)
+            row.pop("content_mongo_id", None)
+            row["image_url"] = url_for("static", filename=bp.image) if bp.image else None
+            row["analytics"] = _analytics_dict(getattr(bp, "analytics", None))
+            content = self.contents.get(post_id)
+            if content is not None:
+                row["content"] = content
+            self._rows[post_id] = row
+        return self._rows[post_id]
+
+    def rows(self, post_ids, projection: _Projection | None = None) -> list[dict]:
+        """Rows in `post_ids` order, trimmed to `projection` when given."""
+        out = []
+        for pid in post_ids:
+            row = self.row(pid)
+            if row is None:
+                continue
+            if projection is not None:
+                row = projection.trim(row)
+                if projection.content and projection.content_fields is not None and row.get("content"):
+                    # A copy: the cached row is shared with untrimmed sections (e.g. main)
+                    row = {**row, "content": {k: v for k, v in row["content"].items() if k in projection.content_fields}}
+            out.append(row)
+        return out
+
+
+class NewsPageAPI(GuardedMethodView):
+    @cached_response("posts", "news", "news-main", "analytics")
+    def get(self):
+        """
+        GET /api/v1/pages/news
+        Sections (same item shapes as the standalone endpoints):
+          posts     ~ /news-posts            (?per_page, default 10)
+          main      ~ /news-main?active=1
+          most_read ~ /analytics/most-read/news
+          latest    ~ /analytics/latest-news (?latest, default 3)
+        ?fields= / ?content_fields= trim the card sections (posts, latest).
+        """
+        per_page = request.args.get("per_page", default=10, type=int)
+        latest_limit = request.args.get("latest", default=3, type=int)
+        try:
+            cards = _request_projection(True)
+        except ValueError as e:
+            return _json_error(str(e), 400)
+
+        # Ids only; the posts themselves are loaded once below
+        post_ids = db.session.execute(
+            select(BlogPost.post_id)
+            .join(NewsPost, NewsPost.post_id == BlogPost.post_id)
+            .order_by(BlogPost.created_at.desc(), BlogPost.post_id.desc())
+            .limit(max(per_page, 0))
+        ).scalars().all()
+
+        today = func.current_date()
+        mains = (
+            NewsMain.query
+            .filter(NewsMain.start_date <= today, NewsMain.end_date >= today)
+            .order_by(NewsMain.start_date.desc(), NewsMain.created_at.desc())
+            .all()
+        )
+
+        latest = _latest_news_subquery(latest_limit)
+        latest_ids = db.session.execute(select(latest.c.post_id).order_by(latest.c.pos)).scalars().all()
+
+        ranked = _most_read_rows("news")
+
+        # Content only where it is rendered: whole for main, the cards' fields
+        # for the rest (whole cards: every post, joined into the one query)
+        main_ids = [nm.post_id for nm in mains]
+        whole_cards = cards.content and cards.content_fields is None
+        rows = _PostRows(
+            [*post_ids, *main_ids, *latest_ids],
+            content_ids=None if whole_cards else main_ids,
+            card_ids=[*post_ids, *latest_ids] if cards.content else (),
+            card_columns=cards.content_fields,
+        )
+        main_items = [
+            {"news_main": news_main_out.dump(nm), "post": rows.row(nm.post_id) or {}}
+            for nm in mains
+        ]
+        latest_items = rows.rows(latest_ids, cards)
+
+        cache_tags(*_post_tags([*rows.posts, *(r["post_id"] for r in ranked)]))
+        return jsonify({
+            "posts": {"items": rows.rows(post_ids, cards)},
+            "main": {"items": main_items},
+            "most_read": {"items": ranked, "count": len(ranked)},
+            "latest": {"items": latest_items, "count": len(latest_items)},
+        }), 200
+
+
+class BlogPageAPI(GuardedMethodView):
+    @cached_response("posts", "analytics")
+    def get(self, ident: str):
+        """
+        GET /api/v1/pages/blog/<ident>   (id or slug)
+        Sections:
+          post      ~ /blog-posts/<ident>?include_content=true
+          most_read ~ /analytics/most-read/blog
+          read_next ~ /blog/<ident>/read-next   (?read_next, default 3)
+          related   ~ /blog/<ident>/related     (?related, default 4)
+        """
+        read_next_limit = request.args.get("read_next", default=3, type=int)
+        related_limit = request.args.get("related", default=4, type=int)
+
+        current = _resolve_post_ref(ident)
+        if current is None:
+            return _json_error("BlogPost not found.", 404)
+
+        others = (
+            select(BlogPost.post_id)
+            .where(BlogPost.post_id != current.post_id)
+            .order_by(BlogPost.created_at.desc())
+        )
+        read_next_ids = db.session.execute(others.limit(read_next_limit)).scalars().all()
+        related_ids = db.session.execute(
+            others.where(BlogPost.blog_cat_id == current.blog_cat_id).limit(related_limit)
+        ).scalars().all()
+        ranked = _most_read_rows("blog")
+
+        # Only the article itself carries content (read-next/related default to none)
+        rows = _PostRows([current.post_id, *read_next_ids, *related_ids], content_ids=[current.post_id])
+        post = rows.row(current.post_id)
+        if post is None:  # deleted since it was resolved
+            slug_index.discard(ident)
+            return _json_error("BlogPost not found.", 404)
+        read_next = rows.rows(read_next_ids)
+        related = rows.rows(related_ids)
+
+        cache_tags(f"cat:{current.blog_cat_id}", *_post_tags([*rows.posts, *(r["post_id"] for r in ranked)]))
+        return jsonify({
+            "post": post,
+            "most_read": {"items": ranked, "count": len(ranked)},
+            "read_next": {"items": read_next, "count": len(read_next)},
+            "related": {"items": related, "count": len(related)},
+        }), 200
 
 # -------------------------------
 # Route Registration
@@ -1611,6 +2425,11 @@ api_bp.add_url_rule(
     view_func=PostAnalyticsItemAPI.as_view("post_analytics_item"),
     methods=["GET", "PATCH", "DELETE"],
 )
+api_bp.add_url_rule(
+    "/post-analytics/<int:post_id>/hit",
+    view_func=PostAnalyticsHitAPI.as_view("post_analytics_hit"),
+    methods=["POST"],
+)
 
 # Most-read / Latest News (views)
 api_bp.add_url_rule(
@@ -1623,3 +2442,22 @@ api_bp.add_url_rule(
     view_func=LatestNewsAPI.as_view("latest_news"),
     methods=["GET"],
 )
+
+# Search
+api_bp.add_url_rule(
+    "/search/posts",
+    view_func=PostSearchAPI.as_view("search_posts"),
+    methods=["GET"],
+)
+
+# Page bundles
+api_bp.add_url_rule(
+    "/pages/news",
+    view_func=NewsPageAPI.as_view("page_news"),
+    methods=["GET"],
+)
+api_bp.add_url_rule(
+    "/pages/blog/<ident>",
+    view_func=BlogPageAPI.as_view("page_blog"),
+    methods=["GET"],
+)
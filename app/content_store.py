@@ -0,0 +1,214 @@
+# content_store.py
+from __future__ import annotations
+import json
+import random
+import statistics
+import time
+import zlib
+from typing import Dict, Iterable, List
+
+import click
+from flask import current_app, has_app_context
+from sqlalchemy import delete, event, func, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from .models import db, BlogContent, BlogContentPacked, undefer_content
+from .schemas import blog_content_out
+
+# CONTENT_STORAGE values, in migration order:
+#   wide   - blog_content columns only (default)
+#   dual   - also keep blog_content_packed in step on every write
+#   packed - as dual, and full-content reads are served from the packed rows
+STORAGE_MODES = ("wide", "dual", "packed")
+
+CODEC = "zlib-json"
+_ZLIB_LEVEL = 6
+
+# Columns that go into the document; ids and audit columns stay real columns
+PACKED_COLUMNS = tuple(
+    c.name for c in BlogContent.__table__.columns
+    if c.name not in ("blog_con_id", "post_id", "created_at", "updated_at")
+)
+
+
+def storage_mode() -> str:
+    if not has_app_context():
+        return "wide"
+    mode = current_app.config.get("CONTENT_STORAGE", "wide")
+    if mode not in STORAGE_MODES:
+        raise ValueError(f"CONTENT_STORAGE must be one of {STORAGE_MODES}, not {mode!r}")
+    return mode
+
+def reads_packed() -> bool:
+    return storage_mode() == "packed"
+
+# -------- codec -----------------------------------------------------------------
+
+def pack(values) -> tuple[bytes, int]:
+    """Column values -> (compressed document, uncompressed size). NULLs are left out."""
+    doc = {c: values[c] for c in PACKED_COLUMNS if values[c] is not None}
+    raw = json.dumps(doc, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return zlib.compress(raw, _ZLIB_LEVEL), len(raw)
+
+def unpack(body: bytes, codec: str = CODEC) -> dict:
+    """Inverse of pack(): every PACKED_COLUMNS key, None where it was NULL."""
+    if codec != CODEC:
+        raise ValueError(f"Unknown content codec: {codec!r}")
+    values = dict.fromkeys(PACKED_COLUMNS)
+    values.update(json.loads(zlib.decompress(body)))
+    return values
+
+def serialize(row) -> dict:
+    """A blog_content_packed row in the BlogContentOutSchema shape the front end reads."""
+    return blog_content_out.dump({
+        "blog_con_id": row.blog_con_id,
+        "post_id": row.post_id,
+        "created_at": row.created_at,
+        "updated_at": row.updated_at,
+        **unpack(row.body, row.codec),
+    })
+
+# -------- write path --------------------------------------------------------------
+
+def repack(connection, post_ids: Iterable[int]) -> int:
+    """
+    Rewrite the packed rows of `post_ids` from blog_content, on `connection`
+    (i.e. inside the caller's transaction). Posts without content lose
+    theirs. Returns rows written.
+    """
+    ids = list(dict.fromkeys(post_ids))
+    if not ids:
+        return 0
+    wide, packed = BlogContent.__table__, BlogContentPacked.__table__
+    rows = []
+    for r in connection.execute(select(wide).where(wide.c.post_id.in_(ids))).mappings():
+        body, raw_size = pack(r)
+        rows.append({
+            "post_id": r["post_id"], "blog_con_id": r["blog_con_id"], "codec": CODEC,
+            "body": body, "raw_size": raw_size,
+            "created_at": r["created_at"], "updated_at": r["updated_at"],
+        })
+    connection.execute(delete(packed).where(packed.c.post_id.in_(ids)))
+    if rows:
+        connection.execute(insert(packed), rows)
+    return len(rows)
+
+@event.listens_for(BlogContent, "after_insert")
+@event.listens_for(BlogContent, "after_update")
+@event.listens_for(BlogContent, "after_delete")
+def _write_through(mapper, connection, target):
+    # Same flush, same transaction: the packed copy can never drift from
+    # blog_content, whichever code path (API, admin forms, scripts) wrote it.
+    if storage_mode() != "wide":
+        repack(connection, [target.post_id])
+
+# -------- read path ---------------------------------------------------------------
+
+def contents(post_ids: Iterable[int]) -> Dict[int, dict]:
+    """
+    post_id -> serialized content (BlogContentOutSchema shape) in one
+    SELECT of the packed rows. Falls back to blog_content if the packed
+    table cannot be read.
+    """
+    ids = list(dict.fromkeys(pid for pid in post_ids if pid is not None))
+    if not ids:
+        return {}
+    packed = BlogContentPacked.__table__
+    try:
+        rows = db.session.execute(select(packed).where(packed.c.post_id.in_(ids))).all()
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        current_app.logger.warning("Packed content unavailable, reading blog_content: %s", e)
+        return _wide_contents(ids)
+    return {row.post_id: serialize(row) for row in rows}
+
+def _wide_contents(ids: List[int]) -> Dict[int, dict]:
+    query = BlogContent.query.options(undefer_content()).filter(BlogContent.post_id.in_(ids))
+    return {bc.post_id: blog_content_out.dump(bc) for bc in query}
+
+# -------- CLI: migration + benchmark ------------------------------------------------
+
+@click.command("pack-content")
+@click.option("--batch-size", default=500, show_default=True)
+def pack_content_command(batch_size):
+    """
+    Create blog_content_packed and (re)pack every BlogContent row.
+
+    Migration: run this once (creates the table), deploy with
+    CONTENT_STORAGE=dual so writes keep the packed copy current, run it
+    again to catch rows written in between, compare with
+    `flask bench-content-storage`, then switch to CONTENT_STORAGE=packed.
+    Safe to re-run at any point.
+    """
+    BlogContentPacked.__table__.create(db.engine, checkfirst=True)
+    total = last = 0
+    while True:
+        ids = db.session.execute(
+            select(BlogContent.post_id).where(BlogContent.post_id > last)
+            .order_by(BlogContent.post_id).limit(batch_size)
+        ).scalars().all()
+        if not ids:
+            break
+        total += repack(db.session.connection(), ids)
+        db.session.commit()
+        last = ids[-1]
+    raw, stored = db.session.execute(
+        select(func.coalesce(func.sum(BlogContentPacked.raw_size), 0),
+               func.coalesce(func.sum(func.length(BlogContentPacked.body)), 0))
+    ).one()
+    click.echo(f"Packed {total} content rows ({raw} bytes of JSON stored as {stored}).")
+
+def _row_sizes(post_ids: List[int]) -> tuple[float, float]:
+    """Average stored bytes per row: (wide, packed)."""
+    wide, packed = BlogContent.__table__, BlogContentPacked.__table__
+    if db.session.get_bind().dialect.name == "postgresql":
+        # On-disk tuple size, after Postgres' own TOAST compression
+        def size(t):
+            return db.session.execute(
+                select(func.avg(func.pg_column_size(t.table_valued()))).where(t.c.post_id.in_(post_ids))
+            ).scalar() or 0
+        return float(size(wide)), float(size(packed))
+    # Elsewhere: payload bytes of the non-NULL values
+    text_cols = [wide.c[c] for c in PACKED_COLUMNS]
+    rows = db.session.execute(select(*text_cols).where(wide.c.post_id.in_(post_ids))).all()
+    wide_avg = statistics.fmean(
+        sum(len(str(v).encode("utf-8")) for v in r if v is not None) for r in rows
+    ) if rows else 0.0
+    packed_avg = db.session.execute(
+        select(func.avg(func.length(packed.c.body))).where(packed.c.post_id.in_(post_ids))
+    ).scalar() or 0
+    return wide_avg, float(packed_avg)
+
+def _timed(fn, rounds: int) -> tuple[float, float]:
+    """(median, p95) milliseconds of `fn()` over `rounds` runs, identity map cleared each time."""
+    samples = []
+    for _ in range(rounds):
+        db.session.expunge_all()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+@click.command("bench-content-storage")
+@click.option("--rounds", default=200, show_default=True, help="Timed reads per layout.")
+@click.option("--batch", default=10, show_default=True, help="Posts per read (a page of cards).")
+@click.option("--seed", default=0, show_default=True)
+def bench_content_storage_command(rounds, batch, seed):
+    """Compare row size and full-content read latency: blog_content vs blog_content_packed."""
+    ids = db.session.execute(select(BlogContentPacked.post_id)).scalars().all()
+    if not ids:
+        raise click.ClickException("blog_content_packed is empty; run `flask pack-content` first.")
+    rng = random.Random(seed)
+    pages = [rng.sample(ids, min(batch, len(ids))) for _ in range(rounds)]
+
+    wide_size, packed_size = _row_sizes(ids)
+    wide_pages, packed_pages = iter(pages), iter(pages)
+    wide_ms = _timed(lambda: _wide_contents(next(wide_pages)), rounds)
+    packed_ms = _timed(lambda: contents(next(packed_pages)), rounds)
+    db.session.rollback()
+
+    click.echo(f"{len(ids)} rows, {rounds} reads of {batch} posts")
+    click.echo(f"{'layout':<8} {'bytes/row':>10} {'median ms':>10} {'p95 ms':>8}")
+    click.echo(f"{'wide':<8} {wide_size:>10.0f} {wide_ms[0]:>10.2f} {wide_ms[1]:>8.2f}")
+    click.echo(f"{'packed':<8} {packed_size:>10.0f} {packed_ms[0]:>10.2f} {packed_ms[1]:>8.2f}")
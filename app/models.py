@@ -2,7 +2,8 @@
 
 from datetime import datetime
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import func
+from sqlalchemy import DDL, event, func, false, text
+from sqlalchemy.orm import Load, deferred
 from flask_login import UserMixin
 
 db = SQLAlchemy()
@@ -65,7 +66,11 @@ class MyUser(UserMixin, db.Model):
 
 class BlogPost(db.Model):
     __tablename__ = "blog_post"
-    __table_args__ = {"schema": SCHEMA}
+    __table_args__ = (
+        # keyset pagination: ORDER BY created_at DESC, post_id DESC
+        db.Index("blog_post_created_at_post_id_idx", "created_at", "post_id"),
+        {"schema": SCHEMA},
+    )
 
     post_id        = db.Column(db.Integer, primary_key=True)
     title          = db.Column(db.String(255), nullable=False, unique=True)
@@ -83,7 +88,8 @@ class BlogPost(db.Model):
     author   = db.relationship("MyUser",      back_populates="posts")
     news     = db.relationship("NewsPost",    back_populates="post", uselist=False, cascade="all, delete-orphan")
     analytics = db.relationship("PostAnalytics", back_populates="post", uselist=False, cascade="all, delete-orphan")  
-    content  = db.relationship("BlogContent", back_populates="post", uselist=False,cascade="all, delete-orphan",passive_deletes=True,lazy="joined",)
+    # Not joined by default: queries opt in with undefer_content(joinedload(BlogPost.content))
+    content  = db.relationship("BlogContent", back_populates="post", uselist=False,cascade="all, delete-orphan",passive_deletes=True)
 
     def __repr__(self):
         return f"<BlogPost {self.slug}>"
@@ -93,6 +99,7 @@ class BlogContent(db.Model):
     __table_args__ = (
         db.UniqueConstraint("post_id", name="blog_content_post_id_unique"),
         db.Index("blog_content_post_id_idx", "post_id"),
+        db.Index("blog_content_updated_at_idx", "updated_at", "blog_con_id"),
         {"schema": SCHEMA},
     )
 
@@ -105,96 +112,147 @@ class BlogContent(db.Model):
         nullable=False,
     )
 
-    yt_vid_id = db.Column(db.String(20), server_default="4AaaTmxpJe8")
+    # Text/media columns are deferred in groups (CONTENT_GROUPS): a plain load
+    # reads only ids and audit columns, queries undefer what they serialize.
+    yt_vid_id = deferred(db.Column(db.String(20), server_default="4AaaTmxpJe8"), group="headers")
 
     # ========= Section 1 (required text) =========
-    section_1_title       = db.Column(db.String(255), nullable=False)
-    section_1_paragraph_1 = db.Column(db.Text,        nullable=False)
-    section_1_paragraph_2 = db.Column(db.Text,        nullable=False)
-    section_1_paragraph_3 = db.Column(db.Text,        nullable=False)
-    section_1_img             = db.Column(db.String(300))
-    section_1_link_internal   = db.Column(db.String(300))
-    section_1_link_external   = db.Column(db.String(300))
+    section_1_title       = deferred(db.Column(db.String(255), nullable=False), group="headers")
+    section_1_paragraph_1 = deferred(db.Column(db.Text,        nullable=False), group="section_1")
+    section_1_paragraph_2 = deferred(db.Column(db.Text,        nullable=False), group="section_1")
+    section_1_paragraph_3 = deferred(db.Column(db.Text,        nullable=False), group="section_1")
+    section_1_img             = deferred(db.Column(db.String(300)), group="section_1")
+    section_1_link_internal   = deferred(db.Column(db.String(300)), group="section_1")
+    section_1_link_external   = deferred(db.Column(db.String(300)), group="section_1")
 
     # ========= Section 2 (required text) =========
-    section_2_title       = db.Column(db.String(255), nullable=False)
-    section_2_paragraph_1 = db.Column(db.Text,        nullable=False)
-    section_2_paragraph_2 = db.Column(db.Text,        nullable=False)
-    section_2_paragraph_3 = db.Column(db.Text,        nullable=False)
-    section_2_img             = db.Column(db.String(300))
-    section_2_link_internal   = db.Column(db.String(300))
-    section_2_link_external   = db.Column(db.String(300))
+    section_2_title       = deferred(db.Column(db.String(255), nullable=False), group="headers")
+    section_2_paragraph_1 = deferred(db.Column(db.Text,        nullable=False), group="section_2")
+    section_2_paragraph_2 = deferred(db.Column(db.Text,        nullable=False), group="section_2")
+    section_2_paragraph_3 = deferred(db.Column(db.Text,        nullable=False), group="section_2")
+    section_2_img             = deferred(db.Column(db.String(300)), group="section_2")
+    section_2_link_internal   = deferred(db.Column(db.String(300)), group="section_2")
+    section_2_link_external   = deferred(db.Column(db.String(300)), group="section_2")
 
     # ========= Section 3 (required text) =========
-    section_3_title       = db.Column(db.String(255), nullable=False)
-    section_3_paragraph_1 = db.Column(db.Text,        nullable=False)
-    section_3_paragraph_2 = db.Column(db.Text,        nullable=False)
-    section_3_paragraph_3 = db.Column(db.Text,        nullable=False)
-    section_3_img             = db.Column(db.String(300))
-    section_3_link_internal   = db.Column(db.String(300))
-    section_3_link_external   = db.Column(db.String(300))
+    section_3_title       = deferred(db.Column(db.String(255), nullable=False), group="headers")
+    section_3_paragraph_1 = deferred(db.Column(db.Text,        nullable=False), group="section_3")
+    section_3_paragraph_2 = deferred(db.Column(db.Text,        nullable=False), group="section_3")
+    section_3_paragraph_3 = deferred(db.Column(db.Text,        nullable=False), group="section_3")
+    section_3_img             = deferred(db.Column(db.String(300)), group="section_3")
+    section_3_link_internal   = deferred(db.Column(db.String(300)), group="section_3")
+    section_3_link_external   = deferred(db.Column(db.String(300)), group="section_3")
 
     # ========= Section 4 (required text) =========
-    section_4_title       = db.Column(db.String(255), nullable=False)
-    section_4_paragraph_1 = db.Column(db.Text,        nullable=False)
-    section_4_paragraph_2 = db.Column(db.Text,        nullable=False)
-    section_4_paragraph_3 = db.Column(db.Text,        nullable=False)
-    section_4_img             = db.Column(db.String(300))
-    section_4_link_internal   = db.Column(db.String(300))
-    section_4_link_external   = db.Column(db.String(300))
+    section_4_title       = deferred(db.Column(db.String(255), nullable=False), group="headers")
+    section_4_paragraph_1 = deferred(db.Column(db.Text,        nullable=False), group="section_4")
+    section_4_paragraph_2 = deferred(db.Column(db.Text,        nullable=False), group="section_4")
+    section_4_paragraph_3 = deferred(db.Column(db.Text,        nullable=False), group="section_4")
+    section_4_img             = deferred(db.Column(db.String(300)), group="section_4")
+    section_4_link_internal   = deferred(db.Column(db.String(300)), group="section_4")
+    section_4_link_external   = deferred(db.Column(db.String(300)), group="section_4")
 
     # ========= Section 5 (required text) =========
-    section_5_title       = db.Column(db.String(255), nullable=False)
-    section_5_paragraph_1 = db.Column(db.Text,        nullable=False)
-    section_5_paragraph_2 = db.Column(db.Text,        nullable=False)
-    section_5_paragraph_3 = db.Column(db.Text,        nullable=False)
-    section_5_img             = db.Column(db.String(300))
-    section_5_link_internal   = db.Column(db.String(300))
-    section_5_link_external   = db.Column(db.String(300))
+    section_5_title       = deferred(db.Column(db.String(255), nullable=False), group="headers")
+    section_5_paragraph_1 = deferred(db.Column(db.Text,        nullable=False), group="section_5")
+    section_5_paragraph_2 = deferred(db.Column(db.Text,        nullable=False), group="section_5")
+    section_5_paragraph_3 = deferred(db.Column(db.Text,        nullable=False), group="section_5")
+    section_5_img             = deferred(db.Column(db.String(300)), group="section_5")
+    section_5_link_internal   = deferred(db.Column(db.String(300)), group="section_5")
+    section_5_link_external   = deferred(db.Column(db.String(300)), group="section_5")
 
     # ===== Section 6 (conclusion, required) =====
-    section_6_conclusion_title       = db.Column(db.String(255), nullable=False)
-    section_6_conclusion_paragraph_1 = db.Column(db.Text,        nullable=False)
-    section_6_conclusion_paragraph_2 = db.Column(db.Text,        nullable=False)
-    section_6_conclusion_paragraph_3 = db.Column(db.Text,        nullable=False)
-    section_6_conclusion_img             = db.Column(db.String(300))
-    section_6_conclusion_link_internal   = db.Column(db.String(300))
-    section_6_conclusion_link_external   = db.Column(db.String(300))
+    section_6_conclusion_title       = deferred(db.Column(db.String(255), nullable=False), group="headers")
+    section_6_conclusion_paragraph_1 = deferred(db.Column(db.Text,        nullable=False), group="conclusion")
+    section_6_conclusion_paragraph_2 = deferred(db.Column(db.Text,        nullable=False), group="conclusion")
+    section_6_conclusion_paragraph_3 = deferred(db.Column(db.Text,        nullable=False), group="conclusion")
+    section_6_conclusion_img             = deferred(db.Column(db.String(300)), group="conclusion")
+    section_6_conclusion_link_internal   = deferred(db.Column(db.String(300)), group="conclusion")
+    section_6_conclusion_link_external   = deferred(db.Column(db.String(300)), group="conclusion")
 
     # ===== Section 7 (assoc-press, required) =====
-    section_7_assoc_press_title       = db.Column(db.String(255), nullable=False)
-    section_7_assoc_press_paragraph_1 = db.Column(db.Text,        nullable=False)
-    section_7_assoc_press_img             = db.Column(db.String(300))
-    section_7_assoc_press_link_internal   = db.Column(db.String(300))
-    section_7_assoc_press_link_external   = db.Column(db.String(300))
+    section_7_assoc_press_title       = deferred(db.Column(db.String(255), nullable=False), group="headers")
+    section_7_assoc_press_paragraph_1 = deferred(db.Column(db.Text,        nullable=False), group="assoc_press")
+    section_7_assoc_press_img             = deferred(db.Column(db.String(300)), group="assoc_press")
+    section_7_assoc_press_link_internal   = deferred(db.Column(db.String(300)), group="assoc_press")
+    section_7_assoc_press_link_external   = deferred(db.Column(db.String(300)), group="assoc_press")
 
     # ===== Section 8 (FAQs) =====
     # Q/A 1–3 required
-    faq_q_1 = db.Column(db.Text, nullable=False)
-    faq_a_1 = db.Column(db.Text, nullable=False)
-    faq_q_2 = db.Column(db.Text, nullable=False)
-    faq_a_2 = db.Column(db.Text, nullable=False)
-    faq_q_3 = db.Column(db.Text, nullable=False)
-    faq_a_3 = db.Column(db.Text, nullable=False)
+    faq_q_1 = deferred(db.Column(db.Text, nullable=False), group="faq")
+    faq_a_1 = deferred(db.Column(db.Text, nullable=False), group="faq")
+    faq_q_2 = deferred(db.Column(db.Text, nullable=False), group="faq")
+    faq_a_2 = deferred(db.Column(db.Text, nullable=False), group="faq")
+    faq_q_3 = deferred(db.Column(db.Text, nullable=False), group="faq")
+    faq_a_3 = deferred(db.Column(db.Text, nullable=False), group="faq")
     # Q/A 4–6 optional
-    faq_q_4 = db.Column(db.Text)
-    faq_a_4 = db.Column(db.Text)
-    faq_q_5 = db.Column(db.Text)
-    faq_a_5 = db.Column(db.Text)
-    faq_q_6 = db.Column(db.Text)
-    faq_a_6 = db.Column(db.Text)
+    faq_q_4 = deferred(db.Column(db.Text), group="faq")
+    faq_a_4 = deferred(db.Column(db.Text), group="faq")
+    faq_q_5 = deferred(db.Column(db.Text), group="faq")
+    faq_a_5 = deferred(db.Column(db.Text), group="faq")
+    faq_q_6 = deferred(db.Column(db.Text), group="faq")
+    faq_a_6 = deferred(db.Column(db.Text), group="faq")
 
     # Audit columns
     created_at = db.Column(db.DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = db.Column(db.DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
     # ORM link back to BlogPost
-    post = db.relationship("BlogPost", back_populates="content", lazy="joined", uselist=False)
+    post = db.relationship("BlogPost", back_populates="content", uselist=False)
 
     def __repr__(self):
         return f"<BlogContent blog_con_id={self.blog_con_id} post_id={self.post_id}>"
 
 
+# Deferred column groups of BlogContent, in page order
+CONTENT_GROUPS = (
+    "headers",      # yt_vid_id + every section title
+    "section_1", "section_2", "section_3", "section_4", "section_5",
+    "conclusion", "assoc_press", "faq",
+)
+
+def undefer_content(loader=None, groups=CONTENT_GROUPS):
+    """
+    Loader option that loads BlogContent with `groups` undeferred (all by
+    default) in the same statement. Chain it on a relationship loader,
+    e.g. undefer_content(joinedload(BlogPost.content)), or pass it as is to
+    a BlogContent query. Groups left deferred are fetched on first access,
+    one query per group.
+    """
+    opt = loader if loader is not None else Load(BlogContent)
+    for group in groups:
+        opt = opt.undefer_group(group)
+    return opt
+
+
+class BlogContentPacked(db.Model):
+    """
+    Compact storage layout for BlogContent: every text/media column of a
+    row in one compressed JSON document (NULL columns omitted), next to the
+    ids and audit timestamps it was packed from. Written through from
+    blog_content and served per CONTENT_STORAGE (see content_store).
+    """
+    __tablename__ = "blog_content_packed"
+    __table_args__ = {"schema": SCHEMA}
+
+    post_id = db.Column(
+        db.Integer,
+        db.ForeignKey(f"{SCHEMA}.blog_post.post_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    blog_con_id = db.Column(db.Integer, nullable=False)
+    codec       = db.Column(db.String(16), nullable=False)
+    body        = db.Column(db.LargeBinary, nullable=False)
+    raw_size    = db.Column(db.Integer, nullable=False)   # uncompressed JSON bytes
+
+    # Copied from blog_content, so the serialized shape is unchanged
+    created_at = db.Column(db.DateTime(timezone=True), nullable=False)
+    updated_at = db.Column(db.DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<BlogContentPacked post_id={self.post_id} codec={self.codec}>"
+
+
 class NewsPost(db.Model):
     """
     One-to-one extension of BlogPost (same primary key).
@@ -270,6 +328,7 @@ class PostAnalytics(db.Model):
     __tablename__ = "post_analytics"
     __table_args__ = (
         db.UniqueConstraint("post_id", name="post_analytics_post_id_unique"),
+        db.Index("post_analytics_updated_at_idx", "updated_at", "post_analytics_id"),
         {"schema": SCHEMA},
     )
 
@@ -296,6 +355,155 @@ class PostAnalytics(db.Model):
         return f"<PostAnalytics id={self.post_analytics_id} post_id={self.post_id} views={self.views}>"
 
 
+class PostViewBucket(db.Model):
+    """
+    Views per post per UTC hour, fed by the write-behind hit flusher.
+    Source for the windowed (24h/7d/30d) most-read rankings; buckets older
+    than the widest window are pruned on refresh.
+    """
+    __tablename__ = "post_view_bucket"
+    __table_args__ = (
+        db.Index("post_view_bucket_start_idx", "bucket_start"),
+        {"schema": SCHEMA},
+    )
+
+    post_id = db.Column(
+        db.Integer,
+        db.ForeignKey(f"{SCHEMA}.blog_post.post_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    bucket_start = db.Column(db.DateTime(timezone=True), primary_key=True)
+    views        = db.Column(db.Integer, nullable=False, server_default="0")
+
+    def __repr__(self):
+        return f"<PostViewBucket post_id={self.post_id} bucket={self.bucket_start} views={self.views}>"
+
+
+class MostReadRank(db.Model):
+    """
+    Materialized most-read top-N per scope ("blog" | "news") and period
+    ("all" | "24h" | "7d" | "30d"). Replaced wholesale by rankings.refresh();
+    reads are an index range scan of `limit` rows.
+    """
+    __tablename__ = "most_read_rank"
+    __table_args__ = {"schema": SCHEMA}
+
+    scope   = db.Column(db.String(8), primary_key=True)
+    period  = db.Column(db.String(8), primary_key=True)
+    rank    = db.Column(db.Integer, primary_key=True)
+    post_id = db.Column(
+        db.Integer,
+        db.ForeignKey(f"{SCHEMA}.blog_post.post_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    views        = db.Column(db.Integer, nullable=False, server_default="0")
+    refreshed_at = db.Column(db.DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    def __repr__(self):
+        return f"<MostReadRank {self.scope}/{self.period} #{self.rank} post_id={self.post_id}>"
+
+
+class PostSearchDoc(db.Model):
+    """
+    Denormalized full-text document per post (title, category, section
+    titles/paragraphs, FAQs), kept current on the write path by
+    post_search.index_posts().
+    Postgres: GIN expression index over post_search_vector().
+    SQLite: mirrored into the FTS5 table post_search_fts by triggers.
+    """
+    __tablename__ = "post_search_doc"
+    __table_args__ = {"schema": SCHEMA}
+
+    post_id = db.Column(
+        db.Integer,
+        db.ForeignKey(f"{SCHEMA}.blog_post.post_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    title    = db.Column(db.Text, nullable=False, server_default="")
+    category = db.Column(db.Text, nullable=False, server_default="")
+    body     = db.Column(db.Text, nullable=False, server_default="")
+
+    updated_at = db.Column(db.DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<PostSearchDoc post_id={self.post_id}>"
+
+
+def post_search_vector(table=None):
+    """
+    Weighted tsvector (title A, category B, body D). Queries must use this
+    exact expression for Postgres to pick the GIN index, hence literal
+    (not bound) constants.
+    """
+    t = (table if table is not None else PostSearchDoc.__table__).c
+    cfg = text("'english'::regconfig")
+    return (
+        func.setweight(func.to_tsvector(cfg, t.title), text("'A'"))
+        .op("||")(func.setweight(func.to_tsvector(cfg, t.category), text("'B'")))
+        .op("||")(func.setweight(func.to_tsvector(cfg, t.body), text("'D'")))
+    )
+
+db.Index("post_search_doc_fts_idx", post_search_vector(), postgresql_using="gin").ddl_if(dialect="postgresql")
+
+# SQLite test databases: external-content FTS5 table synced from post_search_doc
+for _ddl in (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SCHEMA}.post_search_fts USING fts5("
+    "title, category, body, content='post_search_doc', content_rowid='post_id', tokenize='porter unicode61')",
+    f"CREATE TRIGGER IF NOT EXISTS {SCHEMA}.post_search_doc_ai AFTER INSERT ON post_search_doc BEGIN "
+    "INSERT INTO post_search_fts(rowid, title, category, body) VALUES (new.post_id, new.title, new.category, new.body); END",
+    f"CREATE TRIGGER IF NOT EXISTS {SCHEMA}.post_search_doc_ad AFTER DELETE ON post_search_doc BEGIN "
+    "INSERT INTO post_search_fts(post_search_fts, rowid, title, category, body) "
+    "VALUES ('delete', old.post_id, old.title, old.category, old.body); END",
+    f"CREATE TRIGGER IF NOT EXISTS {SCHEMA}.post_search_doc_au AFTER UPDATE ON post_search_doc BEGIN "
+    "INSERT INTO post_search_fts(post_search_fts, rowid, title, category, body) "
+    "VALUES ('delete', old.post_id, old.title, old.category, old.body); "
+    "INSERT INTO post_search_fts(rowid, title, category, body) VALUES (new.post_id, new.title, new.category, new.body); END",
+):
+    event.listen(PostSearchDoc.__table__, "after_create", DDL(_ddl).execute_if(dialect="sqlite"))
+event.listen(
+    PostSearchDoc.__table__, "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {SCHEMA}.post_search_fts").execute_if(dialect="sqlite"),
+)
+
+
+class AtlPlace(db.Model):
+    """
+    Local business / place catalog behind the search map and directory.
+    The in-memory search index (search_service.PlaceIndex) is rebuilt from
+    this table; see place_store.py for the bulk loader.
+    """
+    __tablename__ = "atl_place"
+    __table_args__ = (
+        db.Index("atl_place_slug_idx", "slug", unique=True),
+        db.Index("atl_place_primary_category_idx", "primary_category"),
+        db.Index("atl_place_lat_lng_idx", "lat", "lng"),
+        {"schema": SCHEMA},
+    )
+
+    atl_place_id     = db.Column(db.Integer, primary_key=True)
+    title            = db.Column(db.String(255), nullable=False)
+    slug             = db.Column(db.String(255), nullable=False)
+    img              = db.Column(db.String(300), nullable=False, server_default="images/placeholder.png")
+    rating           = db.Column(db.Float)
+    review_count     = db.Column(db.Integer, nullable=False, server_default="0")
+    categories       = db.Column(db.JSON)   # list[str], e.g. ["coffee shop"]
+    tags             = db.Column(db.JSON)   # optional list[str]
+    primary_category = db.Column(db.String(255))   # categories[0], indexed for filtering
+    is_atl_verified  = db.Column(db.Boolean, nullable=False, server_default=false())
+    review_link      = db.Column(db.String(300))
+    open_status      = db.Column(db.String(50))
+    open_now_status  = db.Column(db.Boolean)
+    address          = db.Column(db.String(300))
+    lat              = db.Column(db.Float)
+    lng              = db.Column(db.Float)
+
+    created_at = db.Column(db.DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = db.Column(db.DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<AtlPlace {self.slug}>"
+
+
 class Property(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(120), nullable=False)
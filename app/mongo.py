@@ -0,0 +1,140 @@
+# mongo.py
+from __future__ import annotations
+import os
+import threading
+import time
+
+import click
+
+# Defaults (overridable via MONGO_* config)
+MONGO_CONNECT_TIMEOUT_MS = 2000
+MONGO_SERVER_SELECTION_TIMEOUT_MS = 2000
+MONGO_SOCKET_TIMEOUT_MS = 5000
+MONGO_HEALTH_INTERVAL = 30.0
+
+
+class MongoConnection:
+    """
+    Optional, lazily created MongoDB client (formerly app.mongo_client /
+    app.mongo_db, which create_app connected and pinged at startup).
+
+    Nothing touches the network in create_app: `client` / `db` build the
+    MongoClient on first use, with connect=False and the MONGO_*_TIMEOUT_MS
+    settings, so the first operation waits at most the server-selection
+    timeout. Clients are per process; a forked worker builds its own
+    instead of inheriting the parent's sockets and monitor threads.
+    Without MONGO_URI both are None.
+
+    Health is probed out of band: health() returns the last ping result
+    and, when it is older than MONGO_HEALTH_INTERVAL, starts a background
+    ping instead of waiting for one. `flask mongo-ping` pings synchronously.
+    """
+
+    def __init__(self):
+        self.app = None
+        self._client = None
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._probe: threading.Thread | None = None
+        self._health = {"ok": None, "checked_at": None, "latency_ms": None, "error": None}
+
+    def init_app(self, app) -> None:
+        self.app = app
+        app.extensions["mongo"] = self
+
+    @property
+    def configured(self) -> bool:
+        return self.app is not None and bool(self.app.config.get("MONGO_URI"))
+
+    @property
+    def client(self):
+        """Per-process MongoClient, created on first access (None if unconfigured)."""
+        self._check_fork()
+        if self._client is None and self.configured:
+            with self._lock:
+                if self._client is None:
+                    self._client = self._make_client()
+        return self._client
+
+    @property
+    def db(self):
+        client = self.client
+        if client is None:
+            return None
+        return client[self.app.config.get("MONGO_DBNAME") or "atlLocal"]
+
+    def _make_client(self):
+        from pymongo.mongo_client import MongoClient
+        from pymongo.server_api import ServerApi
+
+        cfg = self.app.config
+        uri = cfg["MONGO_URI"]
+        timeouts = {
+            "connectTimeoutMS": cfg.get("MONGO_CONNECT_TIMEOUT_MS", MONGO_CONNECT_TIMEOUT_MS),
+            "serverSelectionTimeoutMS": cfg.get("MONGO_SERVER_SELECTION_TIMEOUT_MS", MONGO_SERVER_SELECTION_TIMEOUT_MS),
+            "socketTimeoutMS": cfg.get("MONGO_SOCKET_TIMEOUT_MS", MONGO_SOCKET_TIMEOUT_MS),
+        }
+        # A timeout spelled out in the URI wins over the config default
+        timeouts = {k: v for k, v in timeouts.items() if f"{k.lower()}=" not in uri.lower()}
+        return MongoClient(
+            uri,
+            server_api=ServerApi("1"),
+            tlsCAFile=cfg.get("MONGO_CERT"),
+            connect=False,  # no I/O until the first operation
+            **timeouts,
+        )
+
+    def _check_fork(self) -> None:
+        # The parent's client (sockets, monitor threads) is unusable after
+        # fork; drop the reference without closing it and start over.
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._lock = threading.Lock()
+            self._client = None
+            self._probe = None
+
+    # -------- health ----------------------------------------------------------------
+
+    def ping(self) -> bool:
+        """Round-trip to the server now (blocking); records the result for health()."""
+        started = time.monotonic()
+        error = None
+        try:
+            client = self.client
+            if client is None:
+                error = "MONGO_URI is not set"
+            else:
+                client.admin.command("ping")
+        except Exception as e:  # bad URI, DNS, timeout, auth: all mean "unhealthy"
+            error = str(e)
+        self._health = {
+            "ok": error is None,
+            "checked_at": time.time(),
+            "latency_ms": round((time.monotonic() - started) * 1000, 1),
+            "error": error,
+        }
+        return error is None
+
+    def health(self) -> dict:
+        """Last probe result (never blocks); refreshes it in the background when stale."""
+        self._check_fork()
+        interval = self.app.config.get("MONGO_HEALTH_INTERVAL", MONGO_HEALTH_INTERVAL) if self.app else MONGO_HEALTH_INTERVAL
+        checked_at = self._health["checked_at"]
+        stale = checked_at is None or time.time() - checked_at >= interval
+        if self.configured and stale and (self._probe is None or not self._probe.is_alive()):
+            self._probe = threading.Thread(target=self.ping, name="mongo-health", daemon=True)
+            self._probe.start()
+        return {"configured": self.configured, "client_created": self._client is not None, **self._health}
+
+
+mongo = MongoConnection()
+
+@click.command("mongo-ping")
+def mongo_ping_command():
+    """Ping MongoDB with the configured timeouts; exit status 1 if unreachable."""
+    ok = mongo.ping()
+    h = mongo.health()
+    if ok:
+        click.echo(f"MongoDB reachable ({h['latency_ms']} ms).")
+    else:
+        raise click.ClickException(f"MongoDB unreachable: {h['error']}")
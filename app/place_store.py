@@ -0,0 +1,205 @@
+# place_store.py
+from __future__ import annotations
+import glob
+import json
+import os
+import re
+import threading
+import time
+from typing import Iterable, List
+
+import click
+from flask import current_app
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from .models import db, AtlPlace
+from .search_service import PlaceIndex
+
+# -------- source files -------------------------------------------------------
+
+VISIT_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "visit_data")
+
+# Load order matters: the first record for a slug wins, so the richest
+# sources go first (seed has coords/ratings, vists_data has categories/addresses).
+DEFAULT_SOURCES = (
+    "atl_places_seed.json",
+    "vists_data.json",
+    "atlanta_local_businesses_part*.json",
+)
+
+DEFAULT_IMG = "images/placeholder.png"
+
+def _source_paths(patterns: Iterable[str] = DEFAULT_SOURCES) -> List[str]:
+    paths: List[str] = []
+    for pattern in patterns:
+        if not os.path.isabs(pattern):
+            pattern = os.path.join(VISIT_DATA_DIR, pattern)
+        paths.extend(sorted(glob.glob(pattern)))
+    return paths
+
+# -------- record normalization -----------------------------------------------
+
+def _place_slug(title: str) -> str:
+    text = (title or "").strip().lower().replace("&", " and ").replace("’", "'")
+    return re.sub(r"[^a-z0-9]+", "-", text.replace("'", "")).strip("-")
+
+def _float_or_none(val):
+    try:
+        return float(str(val).strip())
+    except (TypeError, ValueError):
+        return None
+
+def _place_row(rec: dict) -> dict | None:
+    """Map one JSON record (seed or visit_data shape) onto AtlPlace columns."""
+    title = (rec.get("title") or "").strip()
+    if not title:
+        return None
+
+    cats = rec.get("categories")
+    if not cats:
+        cats = [c for c in (rec.get("Google Category"), rec.get("keyword_category")) if c]
+    cats = [str(c).strip().lower() for c in cats if str(c).strip()]
+
+    address = rec.get("address")
+    if address and rec.get("city") and rec.get("city").lower() not in address.lower():
+        parts = [rec["city"].title(), (rec.get("state") or "").upper(), rec.get("zipcode") or ""]
+        address = f"{address}, {parts[0]}, {' '.join(p for p in parts[1:] if p)}"
+
+    rating = rec.get("rating", rec.get("rating_overall"))
+    return {
+        "title": title,
+        "slug": rec.get("slug") or _place_slug(title),
+        "img": rec.get("img") or DEFAULT_IMG,
+        "rating": _float_or_none(rating),
+        "review_count": int(rec.get("review_count") or 0),
+        "categories": cats,
+        "tags": rec.get("tags") or None,
+        "primary_category": cats[0] if cats else None,
+        "is_atl_verified": bool(rec.get("is_atl_verified")),
+        "review_link": rec.get("review_link"),
+        "open_status": rec.get("open_status"),
+        "open_now_status": rec.get("open_now_status"),
+        "address": address,
+        "lat": _float_or_none(rec.get("lat")),
+        "lng": _float_or_none(rec.get("lng")),
+    }
+
+# -------- bulk loader --------------------------------------------------------
+
+def bulk_load_places(paths: Iterable[str] | None = None, *, batch_size: int = 1000) -> int:
+    """
+    Insert places from JSON files into atl_place in batched executemany
+    statements (one round-trip per `batch_size` rows). Slugs already in the
+    table, or seen earlier in this load, are skipped. Returns rows inserted.
+    """
+    paths = _source_paths() if paths is None else list(paths)
+    seen = set(db.session.execute(select(AtlPlace.slug)).scalars())
+
+    inserted = 0
+    batch: List[dict] = []
+    for path in paths:
+        with open(path, encoding="utf-8") as fh:
+            records = json.load(fh)
+        for rec in records:
+            row = _place_row(rec)
+            if row is None or row["slug"] in seen:
+                continue
+            seen.add(row["slug"])
+            batch.append(row)
+            if len(batch) >= batch_size:
+                db.session.execute(insert(AtlPlace), batch)
+                inserted += len(batch)
+                batch = []
+    if batch:
+        db.session.execute(insert(AtlPlace), batch)
+        inserted += len(batch)
+
+    db.session.commit()
+    place_store.invalidate()
+    return inserted
+
+@click.command("load-places")
+@click.argument("paths", nargs=-1, type=click.Path(exists=True, dir_okay=False))
+@click.option("--batch-size", default=1000, show_default=True)
+def load_places_command(paths, batch_size):
+    """Bulk-load the place catalog (defaults to visit_data/*.json)."""
+    AtlPlace.__table__.create(db.engine, checkfirst=True)
+    n = bulk_load_places(paths or None, batch_size=batch_size)
+    click.echo(f"Loaded {n} places.")
+
+# -------- process-local index over the table ---------------------------------
+
+_PLACE_COLUMNS = (
+    "atl_place_id", "img", "title", "slug", "rating", "review_count", "categories", "tags",
+    "is_atl_verified", "review_link", "open_status", "open_now_status", "address", "lat", "lng",
+)
+
+class PlaceStore:
+    """
+    Owns this worker's PlaceIndex. The table is the source of truth: the
+    index is built from it on first use and rebuilt when the catalog
+    signature (row count, max updated_at) changes. The signature is checked
+    at most every PLACE_CATALOG_REFRESH_SECONDS.
+    If the table is missing, unreachable or still empty (`flask load-places`
+    not run yet), the seed file is served instead.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index: PlaceIndex | None = None
+        self._signature = None
+        self._checked_at = 0.0
+        self.version = 0   # bumped on every rebuild; usable as a cache key
+
+    def invalidate(self):
+        with self._lock:
+            self._checked_at = 0.0
+            self._signature = None
+
+    def index(self) -> PlaceIndex:
+        refresh = current_app.config.get("PLACE_CATALOG_REFRESH_SECONDS", 60)
+        now = time.monotonic()
+        if self._index is not None and now - self._checked_at < refresh:
+            return self._index
+
+        with self._lock:
+            if self._index is not None and now - self._checked_at < refresh:
+                return self._index
+            try:
+                signature = tuple(db.session.execute(
+                    select(func.count(AtlPlace.atl_place_id), func.max(AtlPlace.updated_at))
+                ).one())
+                if self._index is None or signature != self._signature:
+                    if signature[0]:
+                        self._index = PlaceIndex(self._load_rows())
+                    else:
+                        current_app.logger.warning("Place catalog is empty (run `flask load-places`), using seed file")
+                        self._index = self._seed_index()
+                    self._signature = signature
+                    self.version += 1
+            except SQLAlchemyError as e:
+                db.session.rollback()
+                current_app.logger.warning("Place catalog unavailable, using seed file: %s", e)
+                if self._index is None:
+                    self._index = self._seed_index()
+                    self.version += 1
+            self._checked_at = now
+            return self._index
+
+    @staticmethod
+    def _seed_index() -> PlaceIndex:
+        with open(os.path.join(VISIT_DATA_DIR, DEFAULT_SOURCES[0]), encoding="utf-8") as fh:
+            return PlaceIndex(json.load(fh))
+
+    @staticmethod
+    def _load_rows() -> List[dict]:
+        table = AtlPlace.__table__
+        stmt = select(*(table.c[name] for name in _PLACE_COLUMNS)).order_by(table.c.atl_place_id)
+        return [dict(row) for row in db.session.execute(stmt).mappings()]
+
+
+place_store = PlaceStore()
+
+def get_place_index() -> PlaceIndex:
+    return place_store.index()
@@ -0,0 +1,179 @@
+# post_search.py
+from __future__ import annotations
+import html
+import re
+from typing import Iterable, List, NamedTuple
+
+import click
+from flask import current_app
+from sqlalchemy import delete, func, insert, literal, select, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import joinedload
+
+from .models import db, SCHEMA, BlogContent, BlogPost, NewsPost, PostSearchDoc, post_search_vector, undefer_content
+
+# Text columns of BlogContent that make up the searchable body, in page order
+BODY_COLUMNS = tuple(
+    c.name for c in BlogContent.__table__.columns
+    if "_title" in c.name or "_paragraph_" in c.name or c.name.startswith("faq_")
+)
+
+# Highlight markers: never present in content, swapped for <mark> after escaping
+_MARK_START, _MARK_END = "⟦", "⟧"
+_HEADLINE_OPTS = f"StartSel={_MARK_START}, StopSel={_MARK_END}, MaxFragments=2, MaxWords=24, MinWords=10"
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class SearchHit(NamedTuple):
+    post_id: int
+    rank: float
+    snippet: str | None
+
+
+# -------- search documents (write path) ---------------------------------------
+
+def _document(bp: BlogPost) -> dict:
+    bc = bp.content
+    body = " ".join(v for v in (getattr(bc, c, None) for c in BODY_COLUMNS) if v) if bc is not None else ""
+    category = bp.category.title if bp.category is not None else ""
+    return {"post_id": bp.post_id, "title": bp.title or "", "category": category, "body": body}
+
+def index_posts(post_ids: Iterable[int]) -> int:
+    """
+    (Re)build the search documents for `post_ids` in one transaction:
+    posts that no longer exist lose theirs. Called after the write that
+    changed them has committed; a failure only leaves the documents stale
+    (`flask reindex-posts` repairs them). Returns documents written.
+    """
+    ids = list(dict.fromkeys(post_ids))
+    if not ids:
+        return 0
+    try:
+        posts = (
+            BlogPost.query
+            .options(joinedload(BlogPost.category), undefer_content(joinedload(BlogPost.content)))
+            .filter(BlogPost.post_id.in_(ids))
+            .all()
+        )
+        db.session.execute(delete(PostSearchDoc).where(PostSearchDoc.post_id.in_(ids)))
+        if posts:
+            db.session.execute(insert(PostSearchDoc), [_document(bp) for bp in posts])
+        db.session.commit()
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        current_app.logger.warning("Search documents not updated for %s: %s", ids, e)
+        return 0
+    return len(posts)
+
+def index_category(blog_cat_id: int) -> int:
+    """Re-index every post of a category (its title is part of each document)."""
+    ids = db.session.execute(select(BlogPost.post_id).where(BlogPost.blog_cat_id == blog_cat_id)).scalars().all()
+    return index_posts(ids)
+
+def reindex_all(batch_size: int = 500) -> int:
+    total = 0
+    last = 0
+    while True:
+        ids = db.session.execute(
+            select(BlogPost.post_id).where(BlogPost.post_id > last).order_by(BlogPost.post_id).limit(batch_size)
+        ).scalars().all()
+        if not ids:
+            return total
+        total += index_posts(ids)
+        last = ids[-1]
+
+@click.command("reindex-posts")
+@click.option("--batch-size", default=500, show_default=True)
+def reindex_posts_command(batch_size):
+    """Build the full-text search documents for every post."""
+    PostSearchDoc.__table__.create(db.engine, checkfirst=True)
+    n = reindex_all(batch_size)
+    click.echo(f"Indexed {n} posts.")
+
+# -------- queries ---------------------------------------------------------------
+
+def _fts5_query(q: str) -> str | None:
+    """User text -> safe FTS5 query: every term required, last one as a prefix."""
+    terms = _TERM_RE.findall(q.lower())
+    if not terms:
+        return None
+    return " ".join(f'"{t}"' for t in terms[:-1]) + (" " if len(terms) > 1 else "") + f'"{terms[-1]}"*'
+
+def _snippet(raw: str | None) -> str | None:
+    if not raw:
+        return None
+    return html.escape(raw).replace(_MARK_START, "<mark>").replace(_MARK_END, "</mark>")
+
+def search(q: str, *, scope: str | None = None, limit: int = 20, offset: int = 0) -> List[SearchHit]:
+    """
+    Ranked matches for `q` (best first) with an HTML-escaped snippet of the
+    body in which matches are wrapped in <mark>. `scope="news"` keeps news
+    posts only. Raises SQLAlchemyError when the index is unavailable.
+    """
+    dialect = db.session.get_bind().dialect.name
+    if dialect == "postgresql":
+        t = PostSearchDoc.__table__
+        vector = post_search_vector(t)
+        query = func.websearch_to_tsquery(text("'english'::regconfig"), q)
+        rank = func.ts_rank_cd(vector, query)
+        ranked = select(t.c.post_id, rank.label("rank")).where(vector.op("@@")(query))
+        if scope == "news":
+            ranked = ranked.join(NewsPost, NewsPost.post_id == t.c.post_id)
+        ranked = ranked.order_by(rank.desc(), t.c.post_id.desc()).limit(limit).offset(offset).subquery("ranked")
+        # ts_headline only for the page that is returned
+        stmt = (
+            select(
+                ranked.c.post_id, ranked.c.rank,
+                func.ts_headline(text("'english'::regconfig"), t.c.body, query, literal(_HEADLINE_OPTS)),
+            )
+            .join(t, t.c.post_id == ranked.c.post_id)
+            .order_by(ranked.c.rank.desc(), ranked.c.post_id.desc())
+        )
+        rows = db.session.execute(stmt).all()
+    elif dialect == "sqlite":
+        match = _fts5_query(q)
+        if match is None:
+            return []
+        news_join = f"JOIN {SCHEMA}.news_post np ON np.post_id = post_search_fts.rowid" if scope == "news" else ""
+        rows = db.session.execute(text(f"""
+            SELECT post_search_fts.rowid AS post_id,
+                   -bm25(post_search_fts, 10.0, 4.0, 1.0) AS rank,
+                   snippet(post_search_fts, 2, :start, :end, '…', 16) AS snippet
+            FROM {SCHEMA}.post_search_fts {news_join}
+            WHERE post_search_fts MATCH :match
+            ORDER BY rank DESC, post_id DESC
+            LIMIT :limit OFFSET :offset
+        """), {"start": _MARK_START, "end": _MARK_END, "match": match, "limit": limit, "offset": offset}).all()
+    else:
+        raise NotImplementedError(f"No full-text search for dialect {dialect!r}")
+    return [SearchHit(int(pid), float(rank), _snippet(snip)) for pid, rank, snip in rows]
+
+def match_ids(q: str):
+    """
+    SELECT of post_ids matching `q`, for filtering other post queries
+    (e.g. /blog-posts?q=). Index-backed on both dialects; raises
+    NotImplementedError on others, like search().
+    """
+    dialect = db.session.get_bind().dialect.name
+    t = PostSearchDoc.__table__
+    if dialect == "postgresql":
+        return select(t.c.post_id).where(
+            post_search_vector(t).op("@@")(func.websearch_to_tsquery(text("'english'::regconfig"), q))
+        )
+    if dialect == "sqlite":
+        return select(text("rowid")).select_from(text(f"{SCHEMA}.post_search_fts")).where(
+            text("post_search_fts MATCH :match").bindparams(match=_fts5_query(q) or '""')
+        )
+    raise NotImplementedError(f"No full-text search for dialect {dialect!r}")
+
+def available() -> bool:
+    """Whether search documents exist (checked once per process until they do)."""
+    if current_app.extensions.get("post_search_ready"):
+        return True
+    try:
+        ready = db.session.execute(select(PostSearchDoc.post_id).limit(1)).first() is not None
+    except SQLAlchemyError:
+        db.session.rollback()
+        ready = False
+    current_app.extensions["post_search_ready"] = ready
+    return ready
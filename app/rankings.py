@@ -0,0 +1,201 @@
+# rankings.py
+from __future__ import annotations
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+import click
+from flask import current_app
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.exc import SQLAlchemyError
+
+from .models import db, BlogPost, MostReadRank, NewsPost, PostAnalytics, PostViewBucket
+
+SCOPES = ("blog", "news")
+# period -> lookback (None = all-time totals from post_analytics)
+PERIODS = {"all": None, "24h": timedelta(hours=24), "7d": timedelta(days=7), "30d": timedelta(days=30)}
+
+# Legacy source per scope, used when the ranking tables are unavailable
+_LEGACY_VIEWS = {"blog": "v_most_read_blog_posts", "news": "v_most_read_news_posts"}
+
+# Defaults (overridable via MOST_READ_* config)
+MOST_READ_TOP_N = 100
+MOST_READ_REFRESH_SECONDS = 60
+
+# -------- hourly view buckets --------------------------------------------------
+
+def _hour(now: datetime | None = None) -> datetime:
+    return (now or datetime.now(timezone.utc)).replace(minute=0, second=0, microsecond=0)
+
+def record_views(views_by_post: Dict[int, int]) -> None:
+    """
+    Add view increments to the current hour's buckets (one upsert
+    executemany). Runs inside the caller's transaction.
+    """
+    rows = [{"post_id": pid, "bucket_start": _hour(), "views": n} for pid, n in views_by_post.items() if n]
+    if not rows:
+        return
+    dialect = db.session.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as upsert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as upsert
+    else:
+        raise NotImplementedError(f"No upsert for dialect {dialect!r}")
+    table = PostViewBucket.__table__
+    stmt = upsert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.post_id, table.c.bucket_start],
+        set_={"views": table.c.views + stmt.excluded.views},
+    )
+    db.session.execute(stmt, rows)
+
+# -------- materialized top-N ---------------------------------------------------
+
+def _ranking_query(scope: str, period: str, top_n: int, now: datetime):
+    lookback = PERIODS[period]
+    if lookback is None:
+        # Every post with an analytics row, unviewed ones included (as the legacy views)
+        views = PostAnalytics.views
+        stmt = select(PostAnalytics.post_id, views.label("views"))
+        post_id = PostAnalytics.post_id
+    else:
+        views = func.sum(PostViewBucket.views)
+        stmt = (
+            select(PostViewBucket.post_id, views.label("views"))
+            .where(PostViewBucket.bucket_start >= _hour(now) - lookback)
+            .group_by(PostViewBucket.post_id)
+        )
+        post_id = PostViewBucket.post_id
+    if scope == "news":
+        stmt = stmt.join(NewsPost, NewsPost.post_id == post_id)
+    return stmt.order_by(views.desc(), post_id.desc()).limit(top_n)
+
+
+class MostReadRankings:
+    """
+    Owns the most_read_rank table: top MOST_READ_TOP_N posts per scope and
+    period, recomputed from post_analytics (all-time) and post_view_bucket
+    (windows) when views have been flushed or analytics rows edited
+    (mark_dirty), at most every MOST_READ_REFRESH_SECONDS across all
+    workers (gated on the table's own refreshed_at). Serving a ranking is
+    then O(limit).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._dirty = True
+        self._checked_at = 0.0
+
+    def mark_dirty(self) -> None:
+        self._dirty = True
+
+    def refresh(self) -> bool:
+        """Recompute every scope/period in one transaction. Returns False on DB errors."""
+        top_n = current_app.config.get("MOST_READ_TOP_N", MOST_READ_TOP_N)
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            try:
+                rows = []
+                for scope in SCOPES:
+                    for period in PERIODS:
+                        ranked = db.session.execute(_ranking_query(scope, period, top_n, now)).all()
+                        rows.extend(
+                            {"scope": scope, "period": period, "rank": i, "post_id": pid,
+                             "views": int(views), "refreshed_at": now}
+                            for i, (pid, views) in enumerate(ranked, start=1)
+                        )
+                db.session.execute(delete(MostReadRank))
+                if rows:
+                    db.session.execute(insert(MostReadRank), rows)
+                db.session.execute(
+                    delete(PostViewBucket).where(PostViewBucket.bucket_start < _hour(now) - max(filter(None, PERIODS.values())))
+                )
+                db.session.commit()
+            except SQLAlchemyError as e:
+                db.session.rollback()
+                current_app.logger.warning("Most-read refresh failed: %s", e)
+                return False
+            self._dirty = False
+            self._checked_at = time.monotonic()
+
+        from .response_cache import response_cache
+        response_cache.invalidate("analytics")
+        return True
+
+    def refresh_if_due(self) -> bool:
+        """Refresh when views arrived since the last refresh and the table is older than the interval."""
+        interval = current_app.config.get("MOST_READ_REFRESH_SECONDS", MOST_READ_REFRESH_SECONDS)
+        if not self._dirty or time.monotonic() - self._checked_at < interval:
+            return False
+        self._checked_at = time.monotonic()
+        try:
+            last = db.session.execute(select(func.max(MostReadRank.refreshed_at))).scalar()
+        except SQLAlchemyError:
+            db.session.rollback()
+            return False
+        if last is not None:
+            if last.tzinfo is None:
+                last = last.replace(tzinfo=timezone.utc)
+            if datetime.now(timezone.utc) - last < timedelta(seconds=interval):
+                return False  # another worker refreshed recently
+        return self.refresh()
+
+    def top(self, scope: str, period: str = "all", limit: int | None = None) -> List[dict]:
+        """
+        Ranked rows for a scope/period (post_id, title, slug, image,
+        blog_cat_id, author_id, created_at, views, likes, comments, shares);
+        `views` is the count within the period; `limit` is capped at (and
+        defaults to) MOST_READ_TOP_N. Refreshes once if the table is empty;
+        falls back to the legacy view for "all" if it is missing.
+        """
+        self.refresh_if_due()  # picks up admin edits without waiting for a hit flush
+        top_n = current_app.config.get("MOST_READ_TOP_N", MOST_READ_TOP_N)
+        limit = top_n if limit is None else max(0, min(limit, top_n))
+        stmt = (
+            select(
+                BlogPost.post_id, BlogPost.title, BlogPost.slug, BlogPost.image,
+                BlogPost.blog_cat_id, BlogPost.author_id, BlogPost.created_at,
+                MostReadRank.views,
+                func.coalesce(PostAnalytics.likes, 0).label("likes"),
+                func.coalesce(PostAnalytics.comments, 0).label("comments"),
+                func.coalesce(PostAnalytics.shares, 0).label("shares"),
+            )
+            .select_from(MostReadRank)
+            .join(BlogPost, BlogPost.post_id == MostReadRank.post_id)
+            .outerjoin(PostAnalytics, PostAnalytics.post_id == MostReadRank.post_id)
+            .where(MostReadRank.scope == scope, MostReadRank.period == period)
+            .order_by(MostReadRank.rank)
+            .limit(limit)
+        )
+        if scope == "news":
+            stmt = stmt.join(NewsPost, NewsPost.post_id == BlogPost.post_id)
+        try:
+            rows = db.session.execute(stmt).mappings().all()
+            if not rows and limit and self._dirty and self.refresh():
+                rows = db.session.execute(stmt).mappings().all()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            if period != "all":
+                current_app.logger.warning("Most-read ranking unavailable: %s", e)
+                return []
+            current_app.logger.warning("Most-read ranking unavailable, using %s: %s", _LEGACY_VIEWS[scope], e)
+            rows = db.session.execute(text(f"""
+                SELECT post_id, title, slug, image, blog_cat_id, author_id,
+                       created_at, views, likes, comments, shares
+                FROM atllocal_db.{_LEGACY_VIEWS[scope]}
+                LIMIT :limit
+            """), {"limit": limit}).mappings().all()
+        return [dict(r) for r in rows]
+
+
+most_read = MostReadRankings()
+
+@click.command("refresh-most-read")
+def refresh_most_read_command():
+    """Recompute the materialized most-read rankings now."""
+    MostReadRank.__table__.create(db.engine, checkfirst=True)
+    PostViewBucket.__table__.create(db.engine, checkfirst=True)
+    ok = most_read.refresh()
+    click.echo("Most-read rankings refreshed." if ok else "Most-read refresh failed (see log).")
@@ -0,0 +1,291 @@
+# response_cache.py
+from __future__ import annotations
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Dict, Iterable, List, NamedTuple, Set
+
+from flask import current_app, g, request
+
+# Defaults (overridable via RESPONSE_CACHE_* config)
+RESPONSE_CACHE_SIZE = 512
+RESPONSE_CACHE_TTL = 30.0
+
+# Headers replayed on a hit; everything else is recomputed by Flask
+_STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Cache-Control")
+
+
+class CachedResponse(NamedTuple):
+    status: int
+    headers: List[tuple]
+    body: bytes
+
+
+# -------- backends -----------------------------------------------------------
+
+class MemoryBackend:
+    """
+    Per-process LRU + TTL store. Tag invalidation only reaches the worker
+    that performed the write; other workers converge within the TTL.
+    """
+
+    def __init__(self, maxsize: int = RESPONSE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()   # key -> (expires, entry, tags)
+        self._tags: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            if item[0] < time.time():
+                self._drop(key)
+                return None
+            self._data.move_to_end(key)
+            return item[1]
+
+    def set(self, key: str, entry: CachedResponse, tags: Iterable[str], ttl: float) -> None:
+        tags = frozenset(tags)
+        with self._lock:
+            self._drop(key)
+            self._data[key] = (time.time() + ttl, entry, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._data) > self.maxsize:
+                self._drop(next(iter(self._data)))
+
+    def invalidate(self, tags: Iterable[str]) -> int:
+        with self._lock:
+            keys = set().union(*(self._tags.get(t, ()) for t in tags))
+            for key in keys:
+                self._drop(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._tags.clear()
+
+    def size(self) -> int:
+        return len(self._data)
+
+    def _drop(self, key: str) -> None:
+        item = self._data.pop(key, None)
+        if item is None:
+            return
+        for tag in item[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+class SQLiteBackend:
+    """
+    Cross-process store in a local SQLite file (WAL), shared by every
+    gunicorn worker on the host, so one worker's write invalidates the
+    entry for all of them. Connections are opened lazily per thread and
+    re-opened after fork.
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS entries ("
+        " key TEXT PRIMARY KEY, status INTEGER, headers TEXT, body BLOB, expires REAL)",
+        "CREATE TABLE IF NOT EXISTS tags (tag TEXT, key TEXT, PRIMARY KEY (tag, key)) WITHOUT ROWID",
+        "CREATE INDEX IF NOT EXISTS tags_key_idx ON tags (key)",
+        "CREATE INDEX IF NOT EXISTS entries_expires_idx ON entries (expires)",
+    )
+
+    def __init__(self, path: str, maxsize: int = RESPONSE_CACHE_SIZE):
+        self.path = path
+        self.maxsize = maxsize
+        self._local = threading.local()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            for stmt in self._SCHEMA:
+                conn.execute(stmt)
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def get(self, key: str) -> CachedResponse | None:
+        row = self._conn().execute(
+            "SELECT status, headers, body FROM entries WHERE key = ? AND expires >= ?", (key, time.time())
+        ).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(row[0], [tuple(h) for h in json.loads(row[1])], row[2])
+
+    def set(self, key: str, entry: CachedResponse, tags: Iterable[str], ttl: float) -> None:
+        conn = self._conn()
+        now = time.time()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM tags WHERE key = ?", (key,))
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, status, headers, body, expires) VALUES (?, ?, ?, ?, ?)",
+                (key, entry.status, json.dumps(entry.headers), entry.body, now + ttl),
+            )
+            conn.executemany("INSERT OR IGNORE INTO tags (tag, key) VALUES (?, ?)", [(t, key) for t in set(tags)])
+            # Bound the file: expired rows first, then the soonest-to-expire
+            conn.execute("DELETE FROM entries WHERE expires < ?", (now,))
+            conn.execute(
+                "DELETE FROM entries WHERE key IN ("
+                " SELECT key FROM entries ORDER BY expires DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            )
+            conn.execute("DELETE FROM tags WHERE key NOT IN (SELECT key FROM entries)")
+
+    def invalidate(self, tags: Iterable[str]) -> int:
+        tags = list(set(tags))
+        if not tags:
+            return 0
+        marks = ",".join("?" * len(tags))
+        conn = self._conn()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            n = conn.execute(
+                f"DELETE FROM entries WHERE key IN (SELECT key FROM tags WHERE tag IN ({marks}))", tags
+            ).rowcount
+            conn.execute("DELETE FROM tags WHERE key NOT IN (SELECT key FROM entries)")
+        return n
+
+    def clear(self) -> None:
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM entries")
+            conn.execute("DELETE FROM tags")
+
+    def size(self) -> int:
+        return self._conn().execute("SELECT count(*) FROM entries").fetchone()[0]
+
+
+# -------- facade -------------------------------------------------------------
+
+class ResponseCache:
+    """
+    Response cache for public JSON reads, keyed by path + normalized args.
+
+    Backend is chosen by RESPONSE_CACHE_BACKEND: "memory" (default),
+    "sqlite" (file at RESPONSE_CACHE_PATH, shared across workers) or
+    "none". Entries carry tags such as "posts", "post:<id>", "cat:<id>",
+    "news-main" and "analytics"; write paths call invalidate() with the
+    tags they affect.
+    """
+
+    def __init__(self):
+        self.backend = None
+        self.ttl = RESPONSE_CACHE_TTL
+        self.hits = 0
+        self.misses = 0
+
+    def init_app(self, app) -> None:
+        kind = app.config.get("RESPONSE_CACHE_BACKEND", "memory")
+        size = app.config.get("RESPONSE_CACHE_SIZE", RESPONSE_CACHE_SIZE)
+        self.ttl = float(app.config.get("RESPONSE_CACHE_TTL", RESPONSE_CACHE_TTL))
+        if kind == "memory":
+            self.backend = MemoryBackend(size)
+        elif kind == "sqlite":
+            self.backend = SQLiteBackend(app.config["RESPONSE_CACHE_PATH"], size)
+        elif kind == "none":
+            self.backend = None
+        else:
+            raise ValueError(f"Unknown RESPONSE_CACHE_BACKEND: {kind!r}")
+
+    @staticmethod
+    def key() -> str:
+        # Every argument as sent, empty ones included: `?cursor=` selects
+        # keyset pagination and must not share the plain request's entry
+        args = sorted(request.args.items(multi=True))
+        return json.dumps([request.path, args])
+
+    def get(self, key: str) -> CachedResponse | None:
+        if self.backend is None:
+            return None
+        try:
+            entry = self.backend.get(key)
+        except sqlite3.Error as e:
+            current_app.logger.warning("Response cache read failed: %s", e)
+            entry = None
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def put(self, key: str, response, tags: Iterable[str]) -> None:
+        if self.backend is None:
+            return
+        headers = [(k, v) for k, v in response.headers.items() if k in _STORED_HEADERS]
+        entry = CachedResponse(response.status_code, headers, response.get_data())
+        try:
+            self.backend.set(key, entry, tags, self.ttl)
+        except sqlite3.Error as e:
+            current_app.logger.warning("Response cache write failed: %s", e)
+
+    def invalidate(self, *tags: str) -> int:
+        if self.backend is None:
+            return 0
+        try:
+            return self.backend.invalidate([t for t in tags if t])
+        except sqlite3.Error as e:
+            current_app.logger.warning("Response cache invalidation failed: %s", e)
+            return 0
+
+    def clear(self) -> None:
+        if self.backend is not None:
+            self.backend.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__ if self.backend else None,
+            "size": self.backend.size() if self.backend else 0,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+response_cache = ResponseCache()
+
+
+def cache_tags(*tags: str) -> None:
+    """Attach tags to the response the current view is building."""
+    g.setdefault("_response_cache_tags", set()).update(t for t in tags if t)
+
+
+def cached_response(*static_tags: str):
+    """
+    View decorator: serve 200 responses from response_cache, replaying
+    ETag/Last-Modified so hits still answer conditional requests with 304.
+    Tags are `static_tags` plus whatever the view passed to cache_tags().
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            key = response_cache.key()
+            hit = response_cache.get(key)
+            if hit is not None:
+                resp = current_app.response_class(hit.body, status=hit.status, headers=hit.headers)
+                return resp.make_conditional(request)
+
+            g._response_cache_tags = set(static_tags)
+            resp = current_app.make_response(view(*args, **kwargs))
+            if resp.status_code == 200:
+                response_cache.put(key, resp, g._response_cache_tags)
+            return resp
+        return wrapper
+    return decorator
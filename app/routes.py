@@ -1,1110 +1,32 @@
+import math
 import os
 from flask import Blueprint, render_template, request,abort, jsonify, current_app,redirect, url_for, flash
 from flask_login import login_user, logout_user, login_required, current_user
 from werkzeug.security import generate_password_hash, check_password_hash
 from werkzeug.utils import secure_filename
 from functools import wraps
-from .models import db, BlogCategory, MyUser, BlogPost,BlogContent ,NewsPost
+from .models import db, BlogCategory, MyUser, BlogPost,BlogContent ,NewsPost, undefer_content
 from .forms import BlogPostCreateForm, BlogPostUpdateForm, BlogContentForm
 from datetime import datetime
-from .search_service import search_places 
+from .search_service import (
+    search_places_page,
+    places_in_area,
+    suggest,
+    parse_bbox,
+    parse_latlng,
+    RANKING_MODES,
+    QUERY_CACHE,
+    DEFAULT_RADIUS_M,
+    MAX_RADIUS_M,
+)
+from .place_store import get_place_index
+from .response_cache import response_cache
+from .slug_index import slug_index
+from .mongo import mongo
 
 
 main = Blueprint('main', __name__)
 
-dummy_newsposts = [
-    {
-       "post_id":1,
-        "category":"business",
-        "title": "Atlanta airport sees continued delays, cancellations", 
-        "author": "Mike W",
-        "image":"images/post_img_1.png",
-        "date_created": datetime.now(),
-        "content":{
-            "section-1":{
-                "title":"Introduction to Hartsfield-Jackson Atlanta International Airport",
-                "paragraph-1":"Hartsfield-Jackson Atlanta International Airport (ATL) isn’t just the busiest airport in the U.S.—it’s one of the most crucial hubs in global air travel. With over 100 million passengers annually, ATL serves as a central connecting point for domestic and international flights, making any disruption at this airport a ripple felt across the nation.",
-                "paragraph-2":"Home to Delta Air Lines, which manages the lion’s share of arrivals and departures, ATL is experiencing continued delays and cancellations that are frustrating travelers and raising industry concerns.",
-                "paragraph-3":"Home to Delta Air Lines, which manages the lion’s share of arrivals and departures, ATL is experiencing continued delays and cancellations that are frustrating travelers and raising industry concerns.",
-            },
-            "section-2":{
-                "title":"Why Are Flights Being Delayed and Canceled?",
-                "paragraph-1":"Flight delays and cancellations aren’t new—but the consistency and volume ATL is facing this year have drawn attention. Multiple overlapping factors are contributing to the persistent chaos.",
-                "paragraph-2":"Atlanta’s summer weather can be unpredictable. Thunderstorms, fog, and occasional lightning strikes often disrupt takeoffs and landings. Unlike mechanical issues, weather disruptions can cause a chain reaction, grounding planes in other cities and leading to rolling delays throughout the day.",
-                "paragraph-3":"Atlanta’s summer weather can be unpredictable. Thunderstorms, fog, and occasional lightning strikes often disrupt takeoffs and landings. Unlike mechanical issues, weather disruptions can cause a chain reaction, grounding planes in other cities and leading to rolling delays throughout the day.",
-            },
-            "section-3":{
-                "title":"Delta Airlines Takes the Brunt of Cancellations",
-                "paragraph-1":"As the largest operator at ATL, Delta Airlines has been disproportionately affected.",
-                "paragraph-2":"Delta’s extensive network relies heavily on ATL. When delays strike, the domino effect spreads to dozens of connecting flights. Crew scheduling issues, mechanical maintenance, and last-minute aircraft swaps have further compounded the problem.",
-                "paragraph-3":"Post-pandemic travel has rebounded with surprising speed. Summer vacations, business conferences, and international travel demand have overwhelmed Delta’s systems, leading to overbooking and logistical strain.",
-            },
-            "section-4":{
-                "title":"How the Disruptions Affect Travelers",
-                "paragraph-1":"Flight cancellations often mean unplanned hotel stays, expensive rebookings, and missed prepaid plans. Although some travel insurance policies cover these costs, not everyone is covered—or reimbursed fully.",
-                "paragraph-2":"Business travelers and international tourists are particularly vulnerable. Missed meetings, rescheduled layovers, and limited rebooking options are hurting confidence in using ATL as a reliable hub.",
-                "paragraph-3":"Business travelers and international tourists are particularly vulnerable. Missed meetings, rescheduled layovers, and limited rebooking options are hurting confidence in using ATL as a reliable hub.",
-            },
-            "section-5":{
-                "title":"What Is Being Done to Fix the Problem?",
-                "paragraph-1":"Delta has begun hiring additional crew, investing in fleet maintenance, and offering more real-time updates through its mobile app. The airline is also proactively canceling lower-demand flights in advance to avoid last-minute chaos.",
-                "paragraph-2":"The FAA has acknowledged the staffing issues and launched accelerated training programs. Meanwhile, ATL is working with federal and state officials to secure funding for additional gates and smoother passenger flow enhancements.",
-                "paragraph-3":"The FAA has acknowledged the staffing issues and launched accelerated training programs. Meanwhile, ATL is working with federal and state officials to secure funding for additional gates and smoother passenger flow enhancements.",
-            },
-            "section-6-conclusion":{
-                "title":"Flying Through the Chaos with Confidence",
-                "paragraph-1":"Travelers passing through ATL are facing an increasingly uncertain experience. Yet, understanding the root causes and being prepared can make a major difference. Whether you're flying for business or leisure, a little planning—and a lot of patience—can help you navigate the current turbulence at Hartsfield-Jackson Atlanta International Airport.",
-                "paragraph-2":"Stay informed, arrive early, and use the right tools. With time, operational improvements and infrastructure upgrades may bring smoother skies to ATL’s millions of passengers.",
-                "paragraph-3":"Stay informed, arrive early, and use the right tools. With time, operational improvements and infrastructure upgrades may bring smoother skies to ATL’s millions of passengers.",
-            },
-            "section-7-assoc-press":{
-                "title":"The Atlanta Local",
-                "paragraph-1":"Copyright 2025 The Associated Press. All rights reserved. This material may not be published, broadcast, rewritten or redistributed without permission.",
-            },
-            "sectition-8-faqs":[
-                {
-                    "question":"Why is Delta most affected by ATL delays?", 
-                     "answer":"As the main airline operating at ATL, Delta’s extensive schedule is deeply tied to ATL’s functioning. A disruption here affects Delta's entire network.",
-                 },
-                    {
-                    "question":"Is it better to fly out of a different airport nearby?", 
-                     "answer":"Sometimes. Nearby airports like Birmingham or Charlotte may offer alternatives, but not all destinations are available.",
-                 },
-                {
-                    "question":"How can I get compensation for canceled flights?", 
-                     "answer":"Check Delta’s cancellation policy and the Department of Transportation’s refund rules. You may be eligible for vouchers or refunds.",
-                 },
-
-                {
-                    "question":"Does ATL have enough infrastructure to handle its current traffic?", 
-                     "answer":"The airport is working on expanding, but current facilities are stretched thin during peak hours.",
-                 },
-
-                {
-                    "question":"Can travel insurance help in these situations?", 
-                     "answer":"Yes, if you have coverage for delays or cancellations. Always check the fine print before traveling.",
-                 },
-                {
-                    "question":"Is this situation unique to Atlanta?", 
-                     "answer":"No, but ATL’s size amplifies its challenges. Other major hubs like JFK and LAX face similar issues.",
-                 },
-            ],
-        },
-
-    },
-    {
-        "post_id":2,
-        "category":"business",
-        "title": "Atlanta's Housing Market Sees Unexpected Surge", 
-        "author": "Mike W",
-        "content":{
-            "section-1":{
-                "title":"Introduction to Hartsfield-Jackson Atlanta International Airport",
-                "paragraph-1":"Hartsfield-Jackson Atlanta International Airport (ATL) isn’t just the busiest airport in the U.S.—it’s one of the most crucial hubs in global air travel. With over 100 million passengers annually, ATL serves as a central connecting point for domestic and international flights, making any disruption at this airport a ripple felt across the nation.",
-                "paragraph-2":"Home to Delta Air Lines, which manages the lion’s share of arrivals and departures, ATL is experiencing continued delays and cancellations that are frustrating travelers and raising industry concerns.",
-                "paragraph-3":"Home to Delta Air Lines, which manages the lion’s share of arrivals and departures, ATL is experiencing continued delays and cancellations that are frustrating travelers and raising industry concerns.",
-            },
-            "section-2":{
-                "title":"Why Are Flights Being Delayed and Canceled?",
-                "paragraph-1":"Flight delays and cancellations aren’t new—but the consistency and volume ATL is facing this year have drawn attention. Multiple overlapping factors are contributing to the persistent chaos.",
-                "paragraph-2":"Atlanta’s summer weather can be unpredictable. Thunderstorms, fog, and occasional lightning strikes often disrupt takeoffs and landings. Unlike mechanical issues, weather disruptions can cause a chain reaction, grounding planes in other cities and leading to rolling delays throughout the day.",
-                "paragraph-3":"Atlanta’s summer weather can be unpredictable. Thunderstorms, fog, and occasional lightning strikes often disrupt takeoffs and landings. Unlike mechanical issues, weather disruptions can cause a chain reaction, grounding planes in other cities and leading to rolling delays throughout the day.",
-            },
-            "section-3":{
-                "title":"Delta Airlines Takes the Brunt of Cancellations",
-                "paragraph-1":"As the largest operator at ATL, Delta Airlines has been disproportionately affected.",
-                "paragraph-2":"Delta’s extensive network relies heavily on ATL. When delays strike, the domino effect spreads to dozens of connecting flights. Crew scheduling issues, mechanical maintenance, and last-minute aircraft swaps have further compounded the problem.",
-                "paragraph-3":"Post-pandemic travel has rebounded with surprising speed. Summer vacations, business conferences, and international travel demand have overwhelmed Delta’s systems, leading to overbooking and logistical strain.",
-            },
-            "section-4":{
-                "title":"How the Disruptions Affect Travelers",
-                "paragraph-1":"Flight cancellations often mean unplanned hotel stays, expensive rebookings, and missed prepaid plans. Although some travel insurance policies cover these costs, not everyone is covered—or reimbursed fully.",
-                "paragraph-2":"Business travelers and international tourists are particularly vulnerable. Missed meetings, rescheduled layovers, and limited rebooking options are hurting confidence in using ATL as a reliable hub.",
-                "paragraph-3":"Business travelers and international tourists are particularly vulnerable. Missed meetings, rescheduled layovers, and limited rebooking options are hurting confidence in using ATL as a reliable hub.",
-            },
-            "section-5":{
-                "title":"What Is Being Done to Fix the Problem?",
-                "paragraph-1":"Delta has begun hiring additional crew, investing in fleet maintenance, and offering more real-time updates through its mobile app. The airline is also proactively canceling lower-demand flights in advance to avoid last-minute chaos.",
-                "paragraph-2":"The FAA has acknowledged the staffing issues and launched accelerated training programs. Meanwhile, ATL is working with federal and state officials to secure funding for additional gates and smoother passenger flow enhancements.",
-                "paragraph-3":"The FAA has acknowledged the staffing issues and launched accelerated training programs. Meanwhile, ATL is working with federal and state officials to secure funding for additional gates and smoother passenger flow enhancements.",
-            },
-            "section-6-conclusion":{
-                "title":"Flying Through the Chaos with Confidence",
-                "paragraph-1":"Travelers passing through ATL are facing an increasingly uncertain experience. Yet, understanding the root causes and being prepared can make a major difference. Whether you're flying for business or leisure, a little planning—and a lot of patience—can help you navigate the current turbulence at Hartsfield-Jackson Atlanta International Airport.",
-                "paragraph-2":"Stay informed, arrive early, and use the right tools. With time, operational improvements and infrastructure upgrades may bring smoother skies to ATL’s millions of passengers.",
-                "paragraph-3":"Stay informed, arrive early, and use the right tools. With time, operational improvements and infrastructure upgrades may bring smoother skies to ATL’s millions of passengers.",
-            },
-            "section-7-assoc-press":{
-                "title":"The Atlanta Local",
-                "paragraph-1":"Copyright 2025 The Associated Press. All rights reserved. This material may not be published, broadcast, rewritten or redistributed without permission.",
-            },
-            "sectition-8-faqs":[
-                {
-                    "question":"Why is Delta most affected by ATL delays?", 
-                     "answer":"As the main airline operating at ATL, Delta’s extensive schedule is deeply tied to ATL’s functioning. A disruption here affects Delta's entire network.",
-                 },
-                    {
-                    "question":"Is it better to fly out of a different airport nearby?", 
-                     "answer":"Sometimes. Nearby airports like Birmingham or Charlotte may offer alternatives, but not all destinations are available.",
-                 },
-                {
-                    "question":"How can I get compensation for canceled flights?", 
-                     "answer":"Check Delta’s cancellation policy and the Department of Transportation’s refund rules. You may be eligible for vouchers or refunds.",
-                 },
-
-                {
-                    "question":"Does ATL have enough infrastructure to handle its current traffic?", 
-                     "answer":"The airport is working on expanding, but current facilities are stretched thin during peak hours.",
-                 },
-
-                {
-                    "question":"Can travel insurance help in these situations?", 
-                     "answer":"Yes, if you have coverage for delays or cancellations. Always check the fine print before traveling.",
-                 },
-                {
-                    "question":"Is this situation unique to Atlanta?", 
-                     "answer":"No, but ATL’s size amplifies its challenges. Other major hubs like JFK and LAX face similar issues.",
-                 },
-            ],
-        },
-        "image":"images/post_img_2.png",
-        "date_created": datetime.now()
-    },
-    {
-        "post_id":3,
-        "category":"business",
-        "title": "5 must-visit coffee shops in Midtown", 
-        "author": "Mike W",
-        "content":{
-            "section-1":{
-                "title":"Introduction to Hartsfield-Jackson Atlanta International Airport",
-                "paragraph-1":"Hartsfield-Jackson Atlanta International Airport (ATL) isn’t just the busiest airport in the U.S.—it’s one of the most crucial hubs in global air travel. With over 100 million passengers annually, ATL serves as a central connecting point for domestic and international flights, making any disruption at this airport a ripple felt across the nation.",
-                "paragraph-2":"Home to Delta Air Lines, which manages the lion’s share of arrivals and departures, ATL is experiencing continued delays and cancellations that are frustrating travelers and raising industry concerns.",
-                "paragraph-3":"Home to Delta Air Lines, which manages the lion’s share of arrivals and departures, ATL is experiencing continued delays and cancellations that are frustrating travelers and raising industry concerns.",
-            },
-            "section-2":{
-                "title":"Why Are Flights Being Delayed and Canceled?",
-                "paragraph-1":"Flight delays and cancellations aren’t new—but the consistency and volume ATL is facing this year have drawn attention. Multiple overlapping factors are contributing to the persistent chaos.",
-                "paragraph-2":"Atlanta’s summer weather can be unpredictable. Thunderstorms, fog, and occasional lightning strikes often disrupt takeoffs and landings. Unlike mechanical issues, weather disruptions can cause a chain reaction, grounding planes in other cities and leading to rolling delays throughout the day.",
-                "paragraph-3":"Atlanta’s summer weather can be unpredictable. Thunderstorms, fog, and occasional lightning strikes often disrupt takeoffs and landings. Unlike mechanical issues, weather disruptions can cause a chain reaction, grounding planes in other cities and leading to rolling delays throughout the day.",
-            },
-            "section-3":{
-                "title":"Delta Airlines Takes the Brunt of Cancellations",
-                "paragraph-1":"As the largest operator at ATL, Delta Airlines has been disproportionately affected.",
-                "paragraph-2":"Delta’s extensive network relies heavily on ATL. When delays strike, the domino effect spreads to dozens of connecting flights. Crew scheduling issues, mechanical maintenance, and last-minute aircraft swaps have further compounded the problem.",
-                "paragraph-3":"Post-pandemic travel has rebounded with surprising speed. Summer vacations, business conferences, and international travel demand have overwhelmed Delta’s systems, leading to overbooking and logistical strain.",
-            },
-            "section-4":{
-                "title":"How the Disruptions Affect Travelers",
-                "paragraph-1":"Flight cancellations often mean unplanned hotel stays, expensive rebookings, and missed prepaid plans. Although some travel insurance policies cover these costs, not everyone is covered—or reimbursed fully.",
-                "paragraph-2":"Business travelers and international tourists are particularly vulnerable. Missed meetings, rescheduled layovers, and limited rebooking options are hurting confidence in using ATL as a reliable hub.",
-                "paragraph-3":"Business travelers and international tourists are particularly vulnerable. Missed meetings, rescheduled layovers, and limited rebooking options are hurting confidence in using ATL as a reliable hub.",
-            },
-            "section-5":{
-                "title":"What Is Being Done to Fix the Problem?",
-                "paragraph-1":"Delta has begun hiring additional crew, investing in fleet maintenance, and offering more real-time updates through its mobile app. The airline is also proactively canceling lower-demand flights in advance to avoid last-minute chaos.",
-                "paragraph-2":"The FAA has acknowledged the staffing issues and launched accelerated training programs. Meanwhile, ATL is working with federal and state officials to secure funding for additional gates and smoother passenger flow enhancements.",
-                "paragraph-3":"The FAA has acknowledged the staffing issues and launched accelerated training programs. Meanwhile, ATL is working with federal and state officials to secure funding for additional gates and smoother passenger flow enhancements.",
-            },
-            "section-6-conclusion":{
-                "title":"Flying Through the Chaos with Confidence",
-                "paragraph-1":"Travelers passing through ATL are facing an increasingly uncertain experience. Yet, understanding the root causes and being prepared can make a major difference. Whether you're flying for business or leisure, a little planning—and a lot of patience—can help you navigate the current turbulence at Hartsfield-Jackson Atlanta International Airport.",
-                "paragraph-2":"Stay informed, arrive early, and use the right tools. With time, operational improvements and infrastructure upgrades may bring smoother skies to ATL’s millions of passengers.",
-                "paragraph-3":"Stay informed, arrive early, and use the right tools. With time, operational improvements and infrastructure upgrades may bring smoother skies to ATL’s millions of passengers.",
-            },
-            "section-7-assoc-press":{
-                "title":"The Atlanta Local",
-                "paragraph-1":"Copyright 2025 The Associated Press. All rights reserved. This material may not be published, broadcast, rewritten or redistributed without permission.",
-            },
-            "sectition-8-faqs":[
-                {
-                    "question":"Why is Delta most affected by ATL delays?", 
-                     "answer":"As the main airline operating at ATL, Delta’s extensive schedule is deeply tied to ATL’s functioning. A disruption here affects Delta's entire network.",
-                 },
-                    {
-                    "question":"Is it better to fly out of a different airport nearby?", 
-                     "answer":"Sometimes. Nearby airports like Birmingham or Charlotte may offer alternatives, but not all destinations are available.",
-                 },
-                {
-                    "question":"How can I get compensation for canceled flights?", 
-                     "answer":"Check Delta’s cancellation policy and the Department of Transportation’s refund rules. You may be eligible for vouchers or refunds.",
-                 },
-
-                {
-                    "question":"Does ATL have enough infrastructure to handle its current traffic?", 
-                     "answer":"The airport is working on expanding, but current facilities are stretched thin during peak hours.",
-                 },
-
-                {
-                    "question":"Can travel insurance help in these situations?", 
-                     "answer":"Yes, if you have coverage for delays or cancellations. Always check the fine print before traveling.",
-                 },
-                {
-                    "question":"Is this situation unique to Atlanta?", 
-                     "answer":"No, but ATL’s size amplifies its challenges. Other major hubs like JFK and LAX face similar issues.",
-                 },
-            ],
-        },
-        "image":"images/post_img_3.png",
-        "date_created": datetime.now()
-    },
-    {
-        "post_id":4,
-        "category":"business",
-        "title": "5 must-visit coffee shops in Midtown", 
-        "author": "Mike W",
-        "content":{
-            "section-1":{
-                "title":"Introduction to Hartsfield-Jackson Atlanta International Airport",
-                "paragraph-1":"Hartsfield-Jackson Atlanta International Airport (ATL) isn’t just the busiest airport in the U.S.—it’s one of the most crucial hubs in global air travel. With over 100 million passengers annually, ATL serves as a central connecting point for domestic and international flights, making any disruption at this airport a ripple felt across the nation.",
-                "paragraph-2":"Home to Delta Air Lines, which manages the lion’s share of arrivals and departures, ATL is experiencing continued delays and cancellations that are frustrating travelers and raising industry concerns.",
-                "paragraph-3":"Home to Delta Air Lines, which manages the lion’s share of arrivals and departures, ATL is experiencing continued delays and cancellations that are frustrating travelers and raising industry concerns.",
-            },
-            "section-2":{
-                "title":"Why Are Flights Being Delayed and Canceled?",
-                "paragraph-1":"Flight delays and cancellations aren’t new—but the consistency and volume ATL is facing this year have drawn attention. Multiple overlapping factors are contributing to the persistent chaos.",
-                "paragraph-2":"Atlanta’s summer weather can be unpredictable. Thunderstorms, fog, and occasional lightning strikes often disrupt takeoffs and landings. Unlike mechanical issues, weather disruptions can cause a chain reaction, grounding planes in other cities and leading to rolling delays throughout the day.",
-                "paragraph-3":"Atlanta’s summer weather can be unpredictable. Thunderstorms, fog, and occasional lightning strikes often disrupt takeoffs and landings. Unlike mechanical issues, weather disruptions can cause a chain reaction, grounding planes in other cities and leading to rolling delays throughout the day.",
-            },
-            "section-3":{
-                "title":"Delta Airlines Takes the Brunt of Cancellations",
-                "paragraph-1":"As the largest operator at ATL, Delta Airlines has been disproportionately affected.",
-                "paragraph-2":"Delta’s extensive network relies heavily on ATL. When delays strike, the domino effect spreads to dozens of connecting flights. Crew scheduling issues, mechanical maintenance, and last-minute aircraft swaps have further compounded the problem.",
-                "paragraph-3":"Post-pandemic travel has rebounded with surprising speed. Summer vacations, business conferences, and international travel demand have overwhelmed Delta’s systems, leading to overbooking and logistical strain.",
-            },
-            "section-4":{
-                "title":"How the Disruptions Affect Travelers",
-                "paragraph-1":"Flight cancellations often mean unplanned hotel stays, expensive rebookings, and missed prepaid plans. Although some travel insurance policies cover these costs, not everyone is covered—or reimbursed fully.",
-                "paragraph-2":"Business travelers and international tourists are particularly vulnerable. Missed meetings, rescheduled layovers, and limited rebooking options are hurting confidence in using ATL as a reliable hub.",
-                "paragraph-3":"Business travelers and international tourists are particularly vulnerable. Missed meetings, rescheduled layovers, and limited rebooking options are hurting confidence in using ATL as a reliable hub.",
-            },
-            "section-5":{
-                "title":"What Is Being Done to Fix the Problem?",
-                "paragraph-1":"Delta has begun hiring additional crew, investing in fleet maintenance, and offering more real-time updates through its mobile app. The airline is also proactively canceling lower-demand flights in advance to avoid last-minute chaos.",
-                "paragraph-2":"The FAA has acknowledged the staffing issues and launched accelerated training programs. Meanwhile, ATL is working with federal and state officials to secure funding for additional gates and smoother passenger flow enhancements.",
-                "paragraph-3":"The FAA has acknowledged the staffing issues and launched accelerated training programs. Meanwhile, ATL is working with federal and state officials to secure funding for additional gates and smoother passenger flow enhancements.",
-            },
-            "section-6-conclusion":{
-                "title":"Flying Through the Chaos with Confidence",
-                "paragraph-1":"Travelers passing through ATL are facing an increasingly uncertain experience. Yet, understanding the root causes and being prepared can make a major difference. Whether you're flying for business or leisure, a little planning—and a lot of patience—can help you navigate the current turbulence at Hartsfield-Jackson Atlanta International Airport.",
-                "paragraph-2":"Stay informed, arrive early, and use the right tools. With time, operational improvements and infrastructure upgrades may bring smoother skies to ATL’s millions of passengers.",
-                "paragraph-3":"Stay informed, arrive early, and use the right tools. With time, operational improvements and infrastructure upgrades may bring smoother skies to ATL’s millions of passengers.",
-            },
-            "section-7-assoc-press":{
-                "title":"The Atlanta Local",
-                "paragraph-1":"Copyright 2025 The Associated Press. All rights reserved. This material may not be published, broadcast, rewritten or redistributed without permission.",
-            },
-            "sectition-8-faqs":[
-                {
-                    "question":"Why is Delta most affected by ATL delays?", 
-                     "answer":"As the main airline operating at ATL, Delta’s extensive schedule is deeply tied to ATL’s functioning. A disruption here affects Delta's entire network.",
-                 },
-                    {
-                    "question":"Is it better to fly out of a different airport nearby?", 
-                     "answer":"Sometimes. Nearby airports like Birmingham or Charlotte may offer alternatives, but not all destinations are available.",
-                 },
-                {
-                    "question":"How can I get compensation for canceled flights?", 
-                     "answer":"Check Delta’s cancellation policy and the Department of Transportation’s refund rules. You may be eligible for vouchers or refunds.",
-                 },
-
-                {
-                    "question":"Does ATL have enough infrastructure to handle its current traffic?", 
-                     "answer":"The airport is working on expanding, but current facilities are stretched thin during peak hours.",
-                 },
-
-                {
-                    "question":"Can travel insurance help in these situations?", 
-                     "answer":"Yes, if you have coverage for delays or cancellations. Always check the fine print before traveling.",
-                 },
-                {
-                    "question":"Is this situation unique to Atlanta?", 
-                     "answer":"No, but ATL’s size amplifies its challenges. Other major hubs like JFK and LAX face similar issues.",
-                 },
-            ],
-        },
-        "image":"images/post_img_1.png",
-        "date_created": datetime.now()
-    },
-    {
-        "post_id":5,
-        "category":"business",
-        "title": "City Council passes new zoning laws", 
-        "author": "Mike W",
-        "content":{
-            "section-1":{
-                "title":"Introduction to Hartsfield-Jackson Atlanta International Airport",
-                "paragraph-1":"Hartsfield-Jackson Atlanta International Airport (ATL) isn’t just the busiest airport in the U.S.—it’s one of the most crucial hubs in global air travel. With over 100 million passengers annually, ATL serves as a central connecting point for domestic and international flights, making any disruption at this airport a ripple felt across the nation.",
-                "paragraph-2":"Home to Delta Air Lines, which manages the lion’s share of arrivals and departures, ATL is experiencing continued delays and cancellations that are frustrating travelers and raising industry concerns.",
-                "paragraph-3":"Home to Delta Air Lines, which manages the lion’s share of arrivals and departures, ATL is experiencing continued delays and cancellations that are frustrating travelers and raising industry concerns.",
-            },
-            "section-2":{
-                "title":"Why Are Flights Being Delayed and Canceled?",
-                "paragraph-1":"Flight delays and cancellations aren’t new—but the consistency and volume ATL is facing this year have drawn attention. Multiple overlapping factors are contributing to the persistent chaos.",
-                "paragraph-2":"Atlanta’s summer weather can be unpredictable. Thunderstorms, fog, and occasional lightning strikes often disrupt takeoffs and landings. Unlike mechanical issues, weather disruptions can cause a chain reaction, grounding planes in other cities and leading to rolling delays throughout the day.",
-                "paragraph-3":"Atlanta’s summer weather can be unpredictable. Thunderstorms, fog, and occasional lightning strikes often disrupt takeoffs and landings. Unlike mechanical issues, weather disruptions can cause a chain reaction, grounding planes in other cities and leading to rolling delays throughout the day.",
-            },
-            "section-3":{
-                "title":"Delta Airlines Takes the Brunt of Cancellations",
-                "paragraph-1":"As the largest operator at ATL, Delta Airlines has been disproportionately affected.",
-                "paragraph-2":"Delta’s extensive network relies heavily on ATL. When delays strike, the domino effect spreads to dozens of connecting flights. Crew scheduling issues, mechanical maintenance, and last-minute aircraft swaps have further compounded the problem.",
-                "paragraph-3":"Post-pandemic travel has rebounded with surprising speed. Summer vacations, business conferences, and international travel demand have overwhelmed Delta’s systems, leading to overbooking and logistical strain.",
-            },
-            "section-4":{
-                "title":"How the Disruptions Affect Travelers",
-                "paragraph-1":"Flight cancellations often mean unplanned hotel stays, expensive rebookings, and missed prepaid plans. Although some travel insurance policies cover these costs, not everyone is covered—or reimbursed fully.",
-                "paragraph-2":"Business travelers and international tourists are particularly vulnerable. Missed meetings, rescheduled layovers, and limited rebooking options are hurting confidence in using ATL as a reliable hub.",
-                "paragraph-3":"Business travelers and international tourists are particularly vulnerable. Missed meetings, rescheduled layovers, and limited rebooking options are hurting confidence in using ATL as a reliable hub.",
-            },
-            "section-5":{
-                "title":"What Is Being Done to Fix the Problem?",
-                "paragraph-1":"Delta has begun hiring additional crew, investing in fleet maintenance, and offering more real-time updates through its mobile app. The airline is also proactively canceling lower-demand flights in advance to avoid last-minute chaos.",
-                "paragraph-2":"The FAA has acknowledged the staffing issues and launched accelerated training programs. Meanwhile, ATL is working with federal and state officials to secure funding for additional gates and smoother passenger flow enhancements.",
-                "paragraph-3":"The FAA has acknowledged the staffing issues and launched accelerated training programs. Meanwhile, ATL is working with federal and state officials to secure funding for additional gates and smoother passenger flow enhancements.",
-            },
-            "section-6-conclusion":{
-                "title":"Flying Through the Chaos with Confidence",
-                "paragraph-1":"Travelers passing through ATL are facing an increasingly uncertain experience. Yet, understanding the root causes and being prepared can make a major difference. Whether you're flying for business or leisure, a little planning—and a lot of patience—can help you navigate the current turbulence at Hartsfield-Jackson Atlanta International Airport.",
-                "paragraph-2":"Stay informed, arrive early, and use the right tools. With time, operational improvements and infrastructure upgrades may bring smoother skies to ATL’s millions of passengers.",
-                "paragraph-3":"Stay informed, arrive early, and use the right tools. With time, operational improvements and infrastructure upgrades may bring smoother skies to ATL’s millions of passengers.",
-            },
-            "section-7-assoc-press":{
-                "title":"The Atlanta Local",
-                "paragraph-1":"Copyright 2025 The Associated Press. All rights reserved. This material may not be published, broadcast, rewritten or redistributed without permission.",
-            },
-            "sectition-8-faqs":[
-                {
-                    "question":"Why is Delta most affected by ATL delays?", 
-                     "answer":"As the main airline operating at ATL, Delta’s extensive schedule is deeply tied to ATL’s functioning. A disruption here affects Delta's entire network.",
-                 },
-                    {
-                    "question":"Is it better to fly out of a different airport nearby?", 
-                     "answer":"Sometimes. Nearby airports like Birmingham or Charlotte may offer alternatives, but not all destinations are available.",
-                 },
-                {
-                    "question":"How can I get compensation for canceled flights?", 
-                     "answer":"Check Delta’s cancellation policy and the Department of Transportation’s refund rules. You may be eligible for vouchers or refunds.",
-                 },
-
-                {
-                    "question":"Does ATL have enough infrastructure to handle its current traffic?", 
-                     "answer":"The airport is working on expanding, but current facilities are stretched thin during peak hours.",
-                 },
-
-                {
-                    "question":"Can travel insurance help in these situations?", 
-                     "answer":"Yes, if you have coverage for delays or cancellations. Always check the fine print before traveling.",
-                 },
-                {
-                    "question":"Is this situation unique to Atlanta?", 
-                     "answer":"No, but ATL’s size amplifies its challenges. Other major hubs like JFK and LAX face similar issues.",
-                 },
-            ],
-        },
-        "image":"images/post_img_2.png",
-        "date_created": datetime.now()
-    },
-    {
-        "post_id":6,
-        "category":"business",
-        "title": "Tech scene expands beyond Buckhead", 
-        "author": "Mike W",
-        "content":{
-            "section-1":{
-                "title":"Introduction to Hartsfield-Jackson Atlanta International Airport",
-                "paragraph-1":"Hartsfield-Jackson Atlanta International Airport (ATL) isn’t just the busiest airport in the U.S.—it’s one of the most crucial hubs in global air travel. With over 100 million passengers annually, ATL serves as a central connecting point for domestic and international flights, making any disruption at this airport a ripple felt across the nation.",
-                "paragraph-2":"Home to Delta Air Lines, which manages the lion’s share of arrivals and departures, ATL is experiencing continued delays and cancellations that are frustrating travelers and raising industry concerns.",
-                "paragraph-3":"Home to Delta Air Lines, which manages the lion’s share of arrivals and departures, ATL is experiencing continued delays and cancellations that are frustrating travelers and raising industry concerns.",
-            },
-            "section-2":{
-                "title":"Why Are Flights Being Delayed and Canceled?",
-                "paragraph-1":"Flight delays and cancellations aren’t new—but the consistency and volume ATL is facing this year have drawn attention. Multiple overlapping factors are contributing to the persistent chaos.",
-                "paragraph-2":"Atlanta’s summer weather can be unpredictable. Thunderstorms, fog, and occasional lightning strikes often disrupt takeoffs and landings. Unlike mechanical issues, weather disruptions can cause a chain reaction, grounding planes in other cities and leading to rolling delays throughout the day.",
-                "paragraph-3":"Atlanta’s summer weather can be unpredictable. Thunderstorms, fog, and occasional lightning strikes often disrupt takeoffs and landings. Unlike mechanical issues, weather disruptions can cause a chain reaction, grounding planes in other cities and leading to rolling delays throughout the day.",
-            },
-            "section-3":{
-                "title":"Delta Airlines Takes the Brunt of Cancellations",
-                "paragraph-1":"As the largest operator at ATL, Delta Airlines has been disproportionately affected.",
-                "paragraph-2":"Delta’s extensive network relies heavily on ATL. When delays strike, the domino effect spreads to dozens of connecting flights. Crew scheduling issues, mechanical maintenance, and last-minute aircraft swaps have further compounded the problem.",
-                "paragraph-3":"Post-pandemic travel has rebounded with surprising speed. Summer vacations, business conferences, and international travel demand have overwhelmed Delta’s systems, leading to overbooking and logistical strain.",
-            },
-            "section-4":{
-                "title":"How the Disruptions Affect Travelers",
-                "paragraph-1":"Flight cancellations often mean unplanned hotel stays, expensive rebookings, and missed prepaid plans. Although some travel insurance policies cover these costs, not everyone is covered—or reimbursed fully.",
-                "paragraph-2":"Business travelers and international tourists are particularly vulnerable. Missed meetings, rescheduled layovers, and limited rebooking options are hurting confidence in using ATL as a reliable hub.",
-                "paragraph-3":"Business travelers and international tourists are particularly vulnerable. Missed meetings, rescheduled layovers, and limited rebooking options are hurting confidence in using ATL as a reliable hub.",
-            },
-            "section-5":{
-                "title":"What Is Being Done to Fix the Problem?",
-                "paragraph-1":"Delta has begun hiring additional crew, investing in fleet maintenance, and offering more real-time updates through its mobile app. The airline is also proactively canceling lower-demand flights in advance to avoid last-minute chaos.",
-                "paragraph-2":"The FAA has acknowledged the staffing issues and launched accelerated training programs. Meanwhile, ATL is working with federal and state officials to secure funding for additional gates and smoother passenger flow enhancements.",
-                "paragraph-3":"The FAA has acknowledged the staffing issues and launched accelerated training programs. Meanwhile, ATL is working with federal and state officials to secure funding for additional gates and smoother passenger flow enhancements.",
-            },
-            "section-6-conclusion":{
-                "title":"Flying Through the Chaos with Confidence",
-                "paragraph-1":"Travelers passing through ATL are facing an increasingly uncertain experience. Yet, understanding the root causes and being prepared can make a major difference. Whether you're flying for business or leisure, a little planning—and a lot of patience—can help you navigate the current turbulence at Hartsfield-Jackson Atlanta International Airport.",
-                "paragraph-2":"Stay informed, arrive early, and use the right tools. With time, operational improvements and infrastructure upgrades may bring smoother skies to ATL’s millions of passengers.",
-                "paragraph-3":"Stay informed, arrive early, and use the right tools. With time, operational improvements and infrastructure upgrades may bring smoother skies to ATL’s millions of passengers.",
-            },
-            "section-7-assoc-press":{
-                "title":"The Atlanta Local",
-                "paragraph-1":"Copyright 2025 The Associated Press. All rights reserved. This material may not be published, broadcast, rewritten or redistributed without permission.",
-            },
-            "sectition-8-faqs":[
-                {
-                    "question":"Why is Delta most affected by ATL delays?", 
-                     "answer":"As the main airline operating at ATL, Delta’s extensive schedule is deeply tied to ATL’s functioning. A disruption here affects Delta's entire network.",
-                 },
-                    {
-                    "question":"Is it better to fly out of a different airport nearby?", 
-                     "answer":"Sometimes. Nearby airports like Birmingham or Charlotte may offer alternatives, but not all destinations are available.",
-                 },
-                {
-                    "question":"How can I get compensation for canceled flights?", 
-                     "answer":"Check Delta’s cancellation policy and the Department of Transportation’s refund rules. You may be eligible for vouchers or refunds.",
-                 },
-
-                {
-                    "question":"Does ATL have enough infrastructure to handle its current traffic?", 
-                     "answer":"The airport is working on expanding, but current facilities are stretched thin during peak hours.",
-                 },
-
-                {
-                    "question":"Can travel insurance help in these situations?", 
-                     "answer":"Yes, if you have coverage for delays or cancellations. Always check the fine print before traveling.",
-                 },
-                {
-                    "question":"Is this situation unique to Atlanta?", 
-                     "answer":"No, but ATL’s size amplifies its challenges. Other major hubs like JFK and LAX face similar issues.",
-                 },
-            ],
-        },
-        "image":"images/post_img_3.png",
-        "date_created": datetime.now()
-    },
-    {
-        "post_id":7,
-        "category":"business",
-        "title": "MARTA unveils new transit plans", 
-        "author": "Mike W",
-        "content":{
-            "section-1":{
-                "title":"Introduction to Hartsfield-Jackson Atlanta International Airport",
-                "paragraph-1":"Hartsfield-Jackson Atlanta International Airport (ATL) isn’t just the busiest airport in the U.S.—it’s one of the most crucial hubs in global air travel. With over 100 million passengers annually, ATL serves as a central connecting point for domestic and international flights, making any disruption at this airport a ripple felt across the nation.",
-                "paragraph-2":"Home to Delta Air Lines, which manages the lion’s share of arrivals and departures, ATL is experiencing continued delays and cancellations that are frustrating travelers and raising industry concerns.",
-                "paragraph-3":"Home to Delta Air Lines, which manages the lion’s share of arrivals and departures, ATL is experiencing continued delays and cancellations that are frustrating travelers and raising industry concerns.",
-            },
-            "section-2":{
-                "title":"Why Are Flights Being Delayed and Canceled?",
-                "paragraph-1":"Flight delays and cancellations aren’t new—but the consistency and volume ATL is facing this year have drawn attention. Multiple overlapping factors are contributing to the persistent chaos.",
-                "paragraph-2":"Atlanta’s summer weather can be unpredictable. Thunderstorms, fog, and occasional lightning strikes often disrupt takeoffs and landings. Unlike mechanical issues, weather disruptions can cause a chain reaction, grounding planes in other cities and leading to rolling delays throughout the day.",
-                "paragraph-3":"Atlanta’s summer weather can be unpredictable. Thunderstorms, fog, and occasional lightning strikes often disrupt takeoffs and landings. Unlike mechanical issues, weather disruptions can cause a chain reaction, grounding planes in other cities and leading to rolling delays throughout the day.",
-            },
-            "section-3":{
-                "title":"Delta Airlines Takes the Brunt of Cancellations",
-                "paragraph-1":"As the largest operator at ATL, Delta Airlines has been disproportionately affected.",
-                "paragraph-2":"Delta’s extensive network relies heavily on ATL. When delays strike, the domino effect spreads to dozens of connecting flights. Crew scheduling issues, mechanical maintenance, and last-minute aircraft swaps have further compounded the problem.",
-                "paragraph-3":"Post-pandemic travel has rebounded with surprising speed. Summer vacations, business conferences, and international travel demand have overwhelmed Delta’s systems, leading to overbooking and logistical strain.",
-            },
-            "section-4":{
-                "title":"How the Disruptions Affect Travelers",
-                "paragraph-1":"Flight cancellations often mean unplanned hotel stays, expensive rebookings, and missed prepaid plans. Although some travel insurance policies cover these costs, not everyone is covered—or reimbursed fully.",
-                "paragraph-2":"Business travelers and international tourists are particularly vulnerable. Missed meetings, rescheduled layovers, and limited rebooking options are hurting confidence in using ATL as a reliable hub.",
-                "paragraph-3":"Business travelers and international tourists are particularly vulnerable. Missed meetings, rescheduled layovers, and limited rebooking options are hurting confidence in using ATL as a reliable hub.",
-            },
-            "section-5":{
-                "title":"What Is Being Done to Fix the Problem?",
-                "paragraph-1":"Delta has begun hiring additional crew, investing in fleet maintenance, and offering more real-time updates through its mobile app. The airline is also proactively canceling lower-demand flights in advance to avoid last-minute chaos.",
-                "paragraph-2":"The FAA has acknowledged the staffing issues and launched accelerated training programs. Meanwhile, ATL is working with federal and state officials to secure funding for additional gates and smoother passenger flow enhancements.",
-                "paragraph-3":"The FAA has acknowledged the staffing issues and launched accelerated training programs. Meanwhile, ATL is working with federal and state officials to secure funding for additional gates and smoother passenger flow enhancements.",
-            },
-            "section-6-conclusion":{
-                "title":"Flying Through the Chaos with Confidence",
-                "paragraph-1":"Travelers passing through ATL are facing an increasingly uncertain experience. Yet, understanding the root causes and being prepared can make a major difference. Whether you're flying for business or leisure, a little planning—and a lot of patience—can help you navigate the current turbulence at Hartsfield-Jackson Atlanta International Airport.",
-                "paragraph-2":"Stay informed, arrive early, and use the right tools. With time, operational improvements and infrastructure upgrades may bring smoother skies to ATL’s millions of passengers.",
-                "paragraph-3":"Stay informed, arrive early, and use the right tools. With time, operational improvements and infrastructure upgrades may bring smoother skies to ATL’s millions of passengers.",
-            },
-            "section-7-assoc-press":{
-                "title":"The Atlanta Local",
-                "paragraph-1":"Copyright 2025 The Associated Press. All rights reserved. This material may not be published, broadcast, rewritten or redistributed without permission.",
-            },
-            "sectition-8-faqs":[
-                {
-                    "question":"Why is Delta most affected by ATL delays?", 
-                     "answer":"As the main airline operating at ATL, Delta’s extensive schedule is deeply tied to ATL’s functioning. A disruption here affects Delta's entire network.",
-                 },
-                    {
-                    "question":"Is it better to fly out of a different airport nearby?", 
-                     "answer":"Sometimes. Nearby airports like Birmingham or Charlotte may offer alternatives, but not all destinations are available.",
-                 },
-                {
-                    "question":"How can I get compensation for canceled flights?", 
-                     "answer":"Check Delta’s cancellation policy and the Department of Transportation’s refund rules. You may be eligible for vouchers or refunds.",
-                 },
-
-                {
-                    "question":"Does ATL have enough infrastructure to handle its current traffic?", 
-                     "answer":"The airport is working on expanding, but current facilities are stretched thin during peak hours.",
-                 },
-
-                {
-                    "question":"Can travel insurance help in these situations?", 
-                     "answer":"Yes, if you have coverage for delays or cancellations. Always check the fine print before traveling.",
-                 },
-                {
-                    "question":"Is this situation unique to Atlanta?", 
-                     "answer":"No, but ATL’s size amplifies its challenges. Other major hubs like JFK and LAX face similar issues.",
-                 },
-            ],
-        },
-        "image":None,
-        "date_created": datetime.now()
-    },
-    {
-        "post_id":8,
-        "category":"business",
-        "title": "Entrepreneur builds app for Atlanta locals", 
-        "author": "Mike W",
-        "content":{
-            "section-1":{
-                "title":"Introduction to Hartsfield-Jackson Atlanta International Airport",
-                "paragraph-1":"Hartsfield-Jackson Atlanta International Airport (ATL) isn’t just the busiest airport in the U.S.—it’s one of the most crucial hubs in global air travel. With over 100 million passengers annually, ATL serves as a central connecting point for domestic and international flights, making any disruption at this airport a ripple felt across the nation.",
-                "paragraph-2":"Home to Delta Air Lines, which manages the lion’s share of arrivals and departures, ATL is experiencing continued delays and cancellations that are frustrating travelers and raising industry concerns.",
-                "paragraph-3":"Home to Delta Air Lines, which manages the lion’s share of arrivals and departures, ATL is experiencing continued delays and cancellations that are frustrating travelers and raising industry concerns.",
-            },
-            "section-2":{
-                "title":"Why Are Flights Being Delayed and Canceled?",
-                "paragraph-1":"Flight delays and cancellations aren’t new—but the consistency and volume ATL is facing this year have drawn attention. Multiple overlapping factors are contributing to the persistent chaos.",
-                "paragraph-2":"Atlanta’s summer weather can be unpredictable. Thunderstorms, fog, and occasional lightning strikes often disrupt takeoffs and landings. Unlike mechanical issues, weather disruptions can cause a chain reaction, grounding planes in other cities and leading to rolling delays throughout the day.",
-                "paragraph-3":"Atlanta’s summer weather can be unpredictable. Thunderstorms, fog, and occasional lightning strikes often disrupt takeoffs and landings. Unlike mechanical issues, weather disruptions can cause a chain reaction, grounding planes in other cities and leading to rolling delays throughout the day.",
-            },
-            "section-3":{
-                "title":"Delta Airlines Takes the Brunt of Cancellations",
-                "paragraph-1":"As the largest operator at ATL, Delta Airlines has been disproportionately affected.",
-                "paragraph-2":"Delta’s extensive network relies heavily on ATL. When delays strike, the domino effect spreads to dozens of connecting flights. Crew scheduling issues, mechanical maintenance, and last-minute aircraft swaps have further compounded the problem.",
-                "paragraph-3":"Post-pandemic travel has rebounded with surprising speed. Summer vacations, business conferences, and international travel demand have overwhelmed Delta’s systems, leading to overbooking and logistical strain.",
-            },
-            "section-4":{
-                "title":"How the Disruptions Affect Travelers",
-                "paragraph-1":"Flight cancellations often mean unplanned hotel stays, expensive rebookings, and missed prepaid plans. Although some travel insurance policies cover these costs, not everyone is covered—or reimbursed fully.",
-                "paragraph-2":"Business travelers and international tourists are particularly vulnerable. Missed meetings, rescheduled layovers, and limited rebooking options are hurting confidence in using ATL as a reliable hub.",
-                "paragraph-3":"Business travelers and international tourists are particularly vulnerable. Missed meetings, rescheduled layovers, and limited rebooking options are hurting confidence in using ATL as a reliable hub.",
-            },
-            "section-5":{
-                "title":"What Is Being Done to Fix the Problem?",
-                "paragraph-1":"Delta has begun hiring additional crew, investing in fleet maintenance, and offering more real-time updates through its mobile app. The airline is also proactively canceling lower-demand flights in advance to avoid last-minute chaos.",
-                "paragraph-2":"The FAA has acknowledged the staffing issues and launched accelerated training programs. Meanwhile, ATL is working with federal and state officials to secure funding for additional gates and smoother passenger flow enhancements.",
-                "paragraph-3":"The FAA has acknowledged the staffing issues and launched accelerated training programs. Meanwhile, ATL is working with federal and state officials to secure funding for additional gates and smoother passenger flow enhancements.",
-            },
-            "section-6-conclusion":{
-                "title":"Flying Through the Chaos with Confidence",
-                "paragraph-1":"Travelers passing through ATL are facing an increasingly uncertain experience. Yet, understanding the root causes and being prepared can make a major difference. Whether you're flying for business or leisure, a little planning—and a lot of patience—can help you navigate the current turbulence at Hartsfield-Jackson Atlanta International Airport.",
-                "paragraph-2":"Stay informed, arrive early, and use the right tools. With time, operational improvements and infrastructure upgrades may bring smoother skies to ATL’s millions of passengers.",
-                "paragraph-3":"Stay informed, arrive early, and use the right tools. With time, operational improvements and infrastructure upgrades may bring smoother skies to ATL’s millions of passengers.",
-            },
-            "section-7-assoc-press":{
-                "title":"The Atlanta Local",
-                "paragraph-1":"Copyright 2025 The Associated Press. All rights reserved. This material may not be published, broadcast, rewritten or redistributed without permission.",
-            },
-            "sectition-8-faqs":[
-                {
-                    "question":"Why is Delta most affected by ATL delays?", 
-                     "answer":"As the main airline operating at ATL, Delta’s extensive schedule is deeply tied to ATL’s functioning. A disruption here affects Delta's entire network.",
-                 },
-                    {
-                    "question":"Is it better to fly out of a different airport nearby?", 
-                     "answer":"Sometimes. Nearby airports like Birmingham or Charlotte may offer alternatives, but not all destinations are available.",
-                 },
-                {
-                    "question":"How can I get compensation for canceled flights?", 
-                     "answer":"Check Delta’s cancellation policy and the Department of Transportation’s refund rules. You may be eligible for vouchers or refunds.",
-                 },
-
-                {
-                    "question":"Does ATL have enough infrastructure to handle its current traffic?", 
-                     "answer":"The airport is working on expanding, but current facilities are stretched thin during peak hours.",
-                 },
-
-                {
-                    "question":"Can travel insurance help in these situations?", 
-                     "answer":"Yes, if you have coverage for delays or cancellations. Always check the fine print before traveling.",
-                 },
-                {
-                    "question":"Is this situation unique to Atlanta?", 
-                     "answer":"No, but ATL’s size amplifies its challenges. Other major hubs like JFK and LAX face similar issues.",
-                 },
-            ],
-        },
-        "image":"images/post_img_1.png",
-        "date_created": datetime.now()
-    },
-    {
-        "post_id":9,
-        "category":"business",
-        "title": "City Council Approves New Park Plan", 
-        "author": "Mike W",
-        "content":{
-            "section-1":{
-                "title":"Introduction to Hartsfield-Jackson Atlanta International Airport",
-                "paragraph-1":"Hartsfield-Jackson Atlanta International Airport (ATL) isn’t just the busiest airport in the U.S.—it’s one of the most crucial hubs in global air travel. With over 100 million passengers annually, ATL serves as a central connecting point for domestic and international flights, making any disruption at this airport a ripple felt across the nation.",
-                "paragraph-2":"Home to Delta Air Lines, which manages the lion’s share of arrivals and departures, ATL is experiencing continued delays and cancellations that are frustrating travelers and raising industry concerns.",
-                "paragraph-3":"Home to Delta Air Lines, which manages the lion’s share of arrivals and departures, ATL is experiencing continued delays and cancellations that are frustrating travelers and raising industry concerns.",
-            },
-            "section-2":{
-                "title":"Why Are Flights Being Delayed and Canceled?",
-                "paragraph-1":"Flight delays and cancellations aren’t new—but the consistency and volume ATL is facing this year have drawn attention. Multiple overlapping factors are contributing to the persistent chaos.",
-                "paragraph-2":"Atlanta’s summer weather can be unpredictable. Thunderstorms, fog, and occasional lightning strikes often disrupt takeoffs and landings. Unlike mechanical issues, weather disruptions can cause a chain reaction, grounding planes in other cities and leading to rolling delays throughout the day.",
-                "paragraph-3":"Atlanta’s summer weather can be unpredictable. Thunderstorms, fog, and occasional lightning strikes often disrupt takeoffs and landings. Unlike mechanical issues, weather disruptions can cause a chain reaction, grounding planes in other cities and leading to rolling delays throughout the day.",
-            },
-            "section-3":{
-                "title":"Delta Airlines Takes the Brunt of Cancellations",
-                "paragraph-1":"As the largest operator at ATL, Delta Airlines has been disproportionately affected.",
-                "paragraph-2":"Delta’s extensive network relies heavily on ATL. When delays strike, the domino effect spreads to dozens of connecting flights. Crew scheduling issues, mechanical maintenance, and last-minute aircraft swaps have further compounded the problem.",
-                "paragraph-3":"Post-pandemic travel has rebounded with surprising speed. Summer vacations, business conferences, and international travel demand have overwhelmed Delta’s systems, leading to overbooking and logistical strain.",
-            },
-            "section-4":{
-                "title":"How the Disruptions Affect Travelers",
-                "paragraph-1":"Flight cancellations often mean unplanned hotel stays, expensive rebookings, and missed prepaid plans. Although some travel insurance policies cover these costs, not everyone is covered—or reimbursed fully.",
-                "paragraph-2":"Business travelers and international tourists are particularly vulnerable. Missed meetings, rescheduled layovers, and limited rebooking options are hurting confidence in using ATL as a reliable hub.",
-                "paragraph-3":"Business travelers and international tourists are particularly vulnerable. Missed meetings, rescheduled layovers, and limited rebooking options are hurting confidence in using ATL as a reliable hub.",
-            },
-            "section-5":{
-                "title":"What Is Being Done to Fix the Problem?",
-                "paragraph-1":"Delta has begun hiring additional crew, investing in fleet maintenance, and offering more real-time updates through its mobile app. The airline is also proactively canceling lower-demand flights in advance to avoid last-minute chaos.",
-                "paragraph-2":"The FAA has acknowledged the staffing issues and launched accelerated training programs. Meanwhile, ATL is working with federal and state officials to secure funding for additional gates and smoother passenger flow enhancements.",
-                "paragraph-3":"The FAA has acknowledged the staffing issues and launched accelerated training programs. Meanwhile, ATL is working with federal and state officials to secure funding for additional gates and smoother passenger flow enhancements.",
-            },
-            "section-6-conclusion":{
-                "title":"Flying Through the Chaos with Confidence",
-                "paragraph-1":"Travelers passing through ATL are facing an increasingly uncertain experience. Yet, understanding the root causes and being prepared can make a major difference. Whether you're flying for business or leisure, a little planning—and a lot of patience—can help you navigate the current turbulence at Hartsfield-Jackson Atlanta International Airport.",
-                "paragraph-2":"Stay informed, arrive early, and use the right tools. With time, operational improvements and infrastructure upgrades may bring smoother skies to ATL’s millions of passengers.",
-                "paragraph-3":"Stay informed, arrive early, and use the right tools. With time, operational improvements and infrastructure upgrades may bring smoother skies to ATL’s millions of passengers.",
-            },
-            "section-7-assoc-press":{
-                "title":"The Atlanta Local",
-                "paragraph-1":"Copyright 2025 The Associated Press. All rights reserved. This material may not be published, broadcast, rewritten or redistributed without permission.",
-            },
-            "sectition-8-faqs":[
-                {
-                    "question":"Why is Delta most affected by ATL delays?", 
-                     "answer":"As the main airline operating at ATL, Delta’s extensive schedule is deeply tied to ATL’s functioning. A disruption here affects Delta's entire network.",
-                 },
-                    {
-                    "question":"Is it better to fly out of a different airport nearby?", 
-                     "answer":"Sometimes. Nearby airports like Birmingham or Charlotte may offer alternatives, but not all destinations are available.",
-                 },
-                {
-                    "question":"How can I get compensation for canceled flights?", 
-                     "answer":"Check Delta’s cancellation policy and the Department of Transportation’s refund rules. You may be eligible for vouchers or refunds.",
-                 },
-
-                {
-                    "question":"Does ATL have enough infrastructure to handle its current traffic?", 
-                     "answer":"The airport is working on expanding, but current facilities are stretched thin during peak hours.",
-                 },
-
-                {
-                    "question":"Can travel insurance help in these situations?", 
-                     "answer":"Yes, if you have coverage for delays or cancellations. Always check the fine print before traveling.",
-                 },
-                {
-                    "question":"Is this situation unique to Atlanta?", 
-                     "answer":"No, but ATL’s size amplifies its challenges. Other major hubs like JFK and LAX face similar issues.",
-                 },
-            ],
-        },
-        "image":"images/post_img_2.png",
-        "date_created": datetime.now()
-    },
-    {
-        "post_id":10,
-        "category":"business",
-        "title": "Meet the Chef Behind ATL's Hottest New Pop-Up", 
-        "author": "Mike W",
-        "content":{
-            "section-1":{
-                "title":"Introduction to Hartsfield-Jackson Atlanta International Airport",
-                "paragraph-1":"Hartsfield-Jackson Atlanta International Airport (ATL) isn’t just the busiest airport in the U.S.—it’s one of the most crucial hubs in global air travel. With over 100 million passengers annually, ATL serves as a central connecting point for domestic and international flights, making any disruption at this airport a ripple felt across the nation.",
-                "paragraph-2":"Home to Delta Air Lines, which manages the lion’s share of arrivals and departures, ATL is experiencing continued delays and cancellations that are frustrating travelers and raising industry concerns.",
-                "paragraph-3":"Home to Delta Air Lines, which manages the lion’s share of arrivals and departures, ATL is experiencing continued delays and cancellations that are frustrating travelers and raising industry concerns.",
-            },
-            "section-2":{
-                "title":"Why Are Flights Being Delayed and Canceled?",
-                "paragraph-1":"Flight delays and cancellations aren’t new—but the consistency and volume ATL is facing this year have drawn attention. Multiple overlapping factors are contributing to the persistent chaos.",
-                "paragraph-2":"Atlanta’s summer weather can be unpredictable. Thunderstorms, fog, and occasional lightning strikes often disrupt takeoffs and landings. Unlike mechanical issues, weather disruptions can cause a chain reaction, grounding planes in other cities and leading to rolling delays throughout the day.",
-                "paragraph-3":"Atlanta’s summer weather can be unpredictable. Thunderstorms, fog, and occasional lightning strikes often disrupt takeoffs and landings. Unlike mechanical issues, weather disruptions can cause a chain reaction, grounding planes in other cities and leading to rolling delays throughout the day.",
-            },
-            "section-3":{
-                "title":"Delta Airlines Takes the Brunt of Cancellations",
-                "paragraph-1":"As the largest operator at ATL, Delta Airlines has been disproportionately affected.",
-                "paragraph-2":"Delta’s extensive network relies heavily on ATL. When delays strike, the domino effect spreads to dozens of connecting flights. Crew scheduling issues, mechanical maintenance, and last-minute aircraft swaps have further compounded the problem.",
-                "paragraph-3":"Post-pandemic travel has rebounded with surprising speed. Summer vacations, business conferences, and international travel demand have overwhelmed Delta’s systems, leading to overbooking and logistical strain.",
-            },
-            "section-4":{
-                "title":"How the Disruptions Affect Travelers",
-                "paragraph-1":"Flight cancellations often mean unplanned hotel stays, expensive rebookings, and missed prepaid plans. Although some travel insurance policies cover these costs, not everyone is covered—or reimbursed fully.",
-                "paragraph-2":"Business travelers and international tourists are particularly vulnerable. Missed meetings, rescheduled layovers, and limited rebooking options are hurting confidence in using ATL as a reliable hub.",
-                "paragraph-3":"Business travelers and international tourists are particularly vulnerable. Missed meetings, rescheduled layovers, and limited rebooking options are hurting confidence in using ATL as a reliable hub.",
-            },
-            "section-5":{
-                "title":"What Is Being Done to Fix the Problem?",
-                "paragraph-1":"Delta has begun hiring additional crew, investing in fleet maintenance, and offering more real-time updates through its mobile app. The airline is also proactively canceling lower-demand flights in advance to avoid last-minute chaos.",
-                "paragraph-2":"The FAA has acknowledged the staffing issues and launched accelerated training programs. Meanwhile, ATL is working with federal and state officials to secure funding for additional gates and smoother passenger flow enhancements.",
-                "paragraph-3":"The FAA has acknowledged the staffing issues and launched accelerated training programs. Meanwhile, ATL is working with federal and state officials to secure funding for additional gates and smoother passenger flow enhancements.",
-            },
-            "section-6-conclusion":{
-                "title":"Flying Through the Chaos with Confidence",
-                "paragraph-1":"Travelers passing through ATL are facing an increasingly uncertain experience. Yet, understanding the root causes and being prepared can make a major difference. Whether you're flying for business or leisure, a little planning—and a lot of patience—can help you navigate the current turbulence at Hartsfield-Jackson Atlanta International Airport.",
-                "paragraph-2":"Stay informed, arrive early, and use the right tools. With time, operational improvements and infrastructure upgrades may bring smoother skies to ATL’s millions of passengers.",
-                "paragraph-3":"Stay informed, arrive early, and use the right tools. With time, operational improvements and infrastructure upgrades may bring smoother skies to ATL’s millions of passengers.",
-            },
-            "section-7-assoc-press":{
-                "title":"The Atlanta Local",
-                "paragraph-1":"Copyright 2025 The Associated Press. All rights reserved. This material may not be published, broadcast, rewritten or redistributed without permission.",
-            },
-            "sectition-8-faqs":[
-                {
-                    "question":"Why is Delta most affected by ATL delays?", 
-                     "answer":"As the main airline operating at ATL, Delta’s extensive schedule is deeply tied to ATL’s functioning. A disruption here affects Delta's entire network.",
-                 },
-                    {
-                    "question":"Is it better to fly out of a different airport nearby?", 
-                     "answer":"Sometimes. Nearby airports like Birmingham or Charlotte may offer alternatives, but not all destinations are available.",
-                 },
-                {
-                    "question":"How can I get compensation for canceled flights?", 
-                     "answer":"Check Delta’s cancellation policy and the Department of Transportation’s refund rules. You may be eligible for vouchers or refunds.",
-                 },
-
-                {
-                    "question":"Does ATL have enough infrastructure to handle its current traffic?", 
-                     "answer":"The airport is working on expanding, but current facilities are stretched thin during peak hours.",
-                 },
-
-                {
-                    "question":"Can travel insurance help in these situations?", 
-                     "answer":"Yes, if you have coverage for delays or cancellations. Always check the fine print before traveling.",
-                 },
-                {
-                    "question":"Is this situation unique to Atlanta?", 
-                     "answer":"No, but ATL’s size amplifies its challenges. Other major hubs like JFK and LAX face similar issues.",
-                 },
-            ],
-        },
-        "image":"images/post_img_3.png",
-        "date_created": datetime.now()
-    },
-    {
-        "post_id":11,
-        "category":"business",
-        "title": "West End Mural Project Brings History to Life", 
-        "author": "Mike W",
-        "content":{
-            "section-1":{
-                "title":"Introduction to Hartsfield-Jackson Atlanta International Airport",
-                "paragraph-1":"Hartsfield-Jackson Atlanta International Airport (ATL) isn’t just the busiest airport in the U.S.—it’s one of the most crucial hubs in global air travel. With over 100 million passengers annually, ATL serves as a central connecting point for domestic and international flights, making any disruption at this airport a ripple felt across the nation.",
-                "paragraph-2":"Home to Delta Air Lines, which manages the lion’s share of arrivals and departures, ATL is experiencing continued delays and cancellations that are frustrating travelers and raising industry concerns.",
-                "paragraph-3":"Home to Delta Air Lines, which manages the lion’s share of arrivals and departures, ATL is experiencing continued delays and cancellations that are frustrating travelers and raising industry concerns.",
-            },
-            "section-2":{
-                "title":"Why Are Flights Being Delayed and Canceled?",
-                "paragraph-1":"Flight delays and cancellations aren’t new—but the consistency and volume ATL is facing this year have drawn attention. Multiple overlapping factors are contributing to the persistent chaos.",
-                "paragraph-2":"Atlanta’s summer weather can be unpredictable. Thunderstorms, fog, and occasional lightning strikes often disrupt takeoffs and landings. Unlike mechanical issues, weather disruptions can cause a chain reaction, grounding planes in other cities and leading to rolling delays throughout the day.",
-                "paragraph-3":"Atlanta’s summer weather can be unpredictable. Thunderstorms, fog, and occasional lightning strikes often disrupt takeoffs and landings. Unlike mechanical issues, weather disruptions can cause a chain reaction, grounding planes in other cities and leading to rolling delays throughout the day.",
-            },
-            "section-3":{
-                "title":"Delta Airlines Takes the Brunt of Cancellations",
-                "paragraph-1":"As the largest operator at ATL, Delta Airlines has been disproportionately affected.",
-                "paragraph-2":"Delta’s extensive network relies heavily on ATL. When delays strike, the domino effect spreads to dozens of connecting flights. Crew scheduling issues, mechanical maintenance, and last-minute aircraft swaps have further compounded the problem.",
-                "paragraph-3":"Post-pandemic travel has rebounded with surprising speed. Summer vacations, business conferences, and international travel demand have overwhelmed Delta’s systems, leading to overbooking and logistical strain.",
-            },
-            "section-4":{
-                "title":"How the Disruptions Affect Travelers",
-                "paragraph-1":"Flight cancellations often mean unplanned hotel stays, expensive rebookings, and missed prepaid plans. Although some travel insurance policies cover these costs, not everyone is covered—or reimbursed fully.",
-                "paragraph-2":"Business travelers and international tourists are particularly vulnerable. Missed meetings, rescheduled layovers, and limited rebooking options are hurting confidence in using ATL as a reliable hub.",
-                "paragraph-3":"Business travelers and international tourists are particularly vulnerable. Missed meetings, rescheduled layovers, and limited rebooking options are hurting confidence in using ATL as a reliable hub.",
-            },
-            "section-5":{
-                "title":"What Is Being Done to Fix the Problem?",
-                "paragraph-1":"Delta has begun hiring additional crew, investing in fleet maintenance, and offering more real-time updates through its mobile app. The airline is also proactively canceling lower-demand flights in advance to avoid last-minute chaos.",
-                "paragraph-2":"The FAA has acknowledged the staffing issues and launched accelerated training programs. Meanwhile, ATL is working with federal and state officials to secure funding for additional gates and smoother passenger flow enhancements.",
-                "paragraph-3":"The FAA has acknowledged the staffing issues and launched accelerated training programs. Meanwhile, ATL is working with federal and state officials to secure funding for additional gates and smoother passenger flow enhancements.",
-            },
-            "section-6-conclusion":{
-                "title":"Flying Through the Chaos with Confidence",
-                "paragraph-1":"Travelers passing through ATL are facing an increasingly uncertain experience. Yet, understanding the root causes and being prepared can make a major difference. Whether you're flying for business or leisure, a little planning—and a lot of patience—can help you navigate the current turbulence at Hartsfield-Jackson Atlanta International Airport.",
-                "paragraph-2":"Stay informed, arrive early, and use the right tools. With time, operational improvements and infrastructure upgrades may bring smoother skies to ATL’s millions of passengers.",
-                "paragraph-3":"Stay informed, arrive early, and use the right tools. With time, operational improvements and infrastructure upgrades may bring smoother skies to ATL’s millions of passengers.",
-            },
-            "section-7-assoc-press":{
-                "title":"The Atlanta Local",
-                "paragraph-1":"Copyright 2025 The Associated Press. All rights reserved. This material may not be published, broadcast, rewritten or redistributed without permission.",
-            },
-            "sectition-8-faqs":[
-                {
-                    "question":"Why is Delta most affected by ATL delays?", 
-                     "answer":"As the main airline operating at ATL, Delta’s extensive schedule is deeply tied to ATL’s functioning. A disruption here affects Delta's entire network.",
-                 },
-                    {
-                    "question":"Is it better to fly out of a different airport nearby?", 
-                     "answer":"Sometimes. Nearby airports like Birmingham or Charlotte may offer alternatives, but not all destinations are available.",
-                 },
-                {
-                    "question":"How can I get compensation for canceled flights?", 
-                     "answer":"Check Delta’s cancellation policy and the Department of Transportation’s refund rules. You may be eligible for vouchers or refunds.",
-                 },
-
-                {
-                    "question":"Does ATL have enough infrastructure to handle its current traffic?", 
-                     "answer":"The airport is working on expanding, but current facilities are stretched thin during peak hours.",
-                 },
-
-                {
-                    "question":"Can travel insurance help in these situations?", 
-                     "answer":"Yes, if you have coverage for delays or cancellations. Always check the fine print before traveling.",
-                 },
-                {
-                    "question":"Is this situation unique to Atlanta?", 
-                     "answer":"No, but ATL’s size amplifies its challenges. Other major hubs like JFK and LAX face similar issues.",
-                 },
-            ],
-        },
-        "image":"images/post_img_1.png",
-        "date_created": datetime.now()
-    },
-
-]
-
-search_results = [
-    {
-        "atl_place_id":1,
-        "img":"media/blog/atlanta_local_main_image.JPG",
-        "title":"Salata",
-        "slug":"salata",
-        "rating":4,
-        "review_count":238,
-        "categories":["healthy","salad"],
-        "is_atl_verified":True,
-        "review_link":None,
-        "open_status":"open",
-        "open_now_status":True,
-        "address":"650 Ponce de Leon Ave NE, Atlanta, GA 30308",
-        "lat":"33.775006",
-        "lng":" -84.365838",
-    },
-
-    {
-        "atl_place_id":2,
-        "img":"media/blog/atlanta_local_main_image.JPG",
-        "title":"Gusto! Healthy Bowls & Wraps (West End)",
-        "slug":"gusto",
-        "rating":4.5,
-        "review_count":75,
-        "categories":["fast food","healthy bowls"],
-        "is_atl_verified":True,
-        "review_link":None,
-        "open_status":"open",
-        "open_now_status":True,
-        "address":"1020 White St SW, Atlanta, GA 30310",
-        "lat":"33.7368",
-        "lng":"-84.4216",
-
-    },
-
-
-    {
-        "atl_place_id":3,
-        "img":"media/blog/atlanta_local_main_image.JPG",
-        "title":"Honeysuckle Gelato (West End)",
-        "slug":"honeysuckle",
-        "rating":4.6,
-        "review_count":30,
-        "categories":["ice cream shop"],
-        "is_atl_verified":False,
-        "review_link":None,
-        "open_status":"open",
-        "open_now_status":True,
-        "address":"1020 White St SW, Atlanta, GA 30310",
-        "lat":"33.7368",
-        "lng":"-84.4216",
-    },
-
-    {
-        "atl_place_id":4,
-        "img":"media/blog/atlanta_local_main_image.JPG",
-        "title":"Sakera Sake Bar & Bottles (West End)",
-        "slug":"sakera",
-        "rating":4.9,
-        "review_count":50,
-        "categories":["bar","sake bar"],
-        "is_atl_verified":True,
-        "review_link":None,
-        "open_status":"open",
-        "open_now_status":True,
-        "address":"1020 White St SW, Atlanta, GA 30310",
-        "lat":"33.7368",
-        "lng":"-84.4216",
-    },
-
-    {
-        "atl_place_id":5,
-        "img":"media/blog/atlanta_local_main_image.JPG",
-        "title":"Starbucks (Moreland Ave NE)",
-        "slug":"starbucks_moreland",
-        "rating":4.2,
-        "review_count":735,
-        "categories":["coffee shop"],
-        "is_atl_verified":True,
-        "review_link":None,
-        "open_status":"open",
-        "open_now_status":True,
-        "address":"406 Moreland Ave NE, Atlanta, GA 30307",
-        "lat":"33.7599",
-        "lng":"-84.3494",
-    },
-
-    {
-        "atl_place_id":6,
-        "img":"media/blog/atlanta_local_main_image.JPG",
-        "title":"Tea'z Social",
-        "slug":"teaz_social",
-        "rating":4.9,
-        "review_count":238,
-        "categories":["tea house","cafe"],
-        "is_atl_verified":False,
-        "review_link":None,
-        "open_status":"closed",
-        "open_now_status":False,
-        "address":"337 Moreland Ave NE, Atlanta, GA 30307",
-        "lat":"33.7608",
-        "lng":"-84.3499",
-    },
-
-    {
-        "atl_place_id":7,
-        "img":"media/blog/atlanta_local_main_image.JPG",
-        "title":"Mr. Everything Cafe (MLK)",
-        "slug":"mr_everything_cafe_mlk",
-        "rating":4.3,
-        "review_count":238,
-        "categories":["cafe","fast casual"],
-        "is_atl_verified":True,
-        "review_link":None,
-        "open_status":"open",
-        "open_now_status":True,
-        "address":"882 Martin Luther King Jr Dr SW, Atlanta, GA 303148",
-        "lat":"33.7537,",
-        "lng":"-84.4163",
-    },
-
-    {
-        "atl_place_id":8,
-        "img":"media/blog/atlanta_local_main_image.JPG",
-        "title":"Busy Bee Cafe",
-        "slug":"busy_bee_cafe",
-        "rating":4.0,
-        "review_count":238,
-        "categories":["soul food","restaurant"],
-        "is_atl_verified":True,
-        "review_link":None,
-        "open_status":"open",
-        "open_now_status":True,
-        "address":"810 Martin Luther King Jr Dr SW, Atlanta, GA 30314",
-        "lat":"33.7489",
-        "lng":"-84.4141",
-    },
-
-    {
-        "atl_place_id":9,
-        "img":"media/blog/atlanta_local_main_image.JPG",
-        "title":"King Jai the Barber (Gentleman’s Refinery)",
-        "slug":"king_jai_barber",
-        "rating":4.8,
-        "review_count":81,
-        "categories":["barber","barbershop"],
-        "is_atl_verified":True,
-        "review_link":None,
-        "open_status":"open",
-        "open_now_status":True,
-        "address":"1107 Euclid Ave NE, Atlanta, GA 30307",
-        "lat":"33.7656",
-        "lng":"-84.3491",
-    },
-
-    {
-        "atl_place_id":10,
-        "img":"media/blog/atlanta_local_main_image.JPG",
-        "title":"Liquid Wizdom",
-        "slug":"mr_everything_cafe_mlk",
-        "rating":4.8,
-        "review_count":24,
-        "categories":["juice shop"],
-        "is_atl_verified":True,
-        "review_link":None,
-        "open_status":"open",
-        "open_now_status":True,
-        "address":"1133 Euclid Ave NE, Atlanta, GA 30307",
-        "lat":"33.7662",
-        "lng":"-84.3477",
-    },
-
-    {
-        "atl_place_id":11,
-        "img":"media/blog/atlanta_local_main_image.JPG",
-        "title":"Classic Fades Barbershop",
-        "slug":"classic_fades_barbershop",
-        "rating":5.0,
-        "review_count":94,
-        "categories":["barber","barbershop"],
-        "is_atl_verified":False,
-        "review_link":None,
-        "open_status":"open",
-        "open_now_status":True,
-        "address":"3479 Memorial Dr, Ste 1, Decatur, GA 30032 (inside Kroger/Belvedere Plaza)",
-        "lat":"33.752274",
-        "lng":"-84.269225",
-    },
-
-
-    {
-        "atl_place_id":12,
-        "img":"media/blog/atlanta_local_main_image.JPG",
-        "title":"Dynamic Cuts Barbershop",
-        "slug":"dynamic_cuts_barbershop",
-        "rating":4.9,
-        "review_count":591,
-        "categories":["barber","barbershop"],
-        "is_atl_verified":False,
-        "review_link":None,
-        "open_status":"open",
-        "open_now_status":True,
-        "address":"4112 Redan Rd, Suite G, Stone Mountain, GA 30083",
-        "lat":"33.763737",
-        "lng":"-84.222301",
-    },
-
-
-    {
-        "atl_place_id":13,
-        "img":"media/blog/atlanta_local_main_image.JPG",
-        "title":"All Edge Barbershop & Salon",
-        "slug":"all_edge_barbershop_salon",
-        "rating":5.0,
-        "review_count":446,
-        "categories":["barber","barbershop"],
-        "is_atl_verified":False,
-        "review_link":None,
-        "open_status":"open",
-        "open_now_status":True,
-        "address":"4586 Memorial Dr, Decatur, GA 30032",
-        "lat":"33.7799099312",
-        "lng":"-84.2390579359",
-    },    
-
-
-]
-
-
 
 def admin_required(view_func):
     @wraps(view_func)
@@ -1147,41 +69,129 @@ def _save_blog_image(file_storage):
 @main.route("/")
 @main.route("/home")
 def home():
-    atl_places = search_results
+    atl_places = get_place_index().places
     return render_template("search_map/search_home.html", atl_places=atl_places)
 
 
 @main.route('/search-map')
 def search_map():
-    atl_places = search_results
+    atl_places = get_place_index().places
     return render_template('search_map/search_home.html', atl_places=atl_places)
 
+def _geo_filter_args():
+    """
+    Read ?bbox=west,south,east,north and ?near=lat,lng&radius_m=<meters>.
+    Returns a dict of search_places kwargs; raises ValueError on bad input.
+    """
+    geo = {}
+    raw_bbox = request.args.get("bbox")
+    if raw_bbox:
+        geo["bbox"] = parse_bbox(raw_bbox)
+    raw_near = request.args.get("near")
+    if raw_near:
+        geo["near"] = parse_latlng(raw_near)
+        radius = request.args.get("radius_m", default=DEFAULT_RADIUS_M, type=float)
+        if not math.isfinite(radius) or radius <= 0:
+            raise ValueError("radius_m must be a positive number")
+        geo["radius_m"] = min(radius, MAX_RADIUS_M)
+    return geo
+
+def _optional_bool_arg(name):
+    """?name=true|false -> True/False; missing or blank -> None (no filter)."""
+    raw = (request.args.get(name) or "").strip().lower()
+    if not raw:
+        return None
+    return raw in ("1", "true", "yes")
+
 @main.route('/api/atl-places', methods=['GET'])
 def api_atl_places():
     """
-    Dev endpoint: serves the in-memory search_results list as JSON.
-    Later you can replace this with a DB-backed query.
+    Serves the place catalog (atl_place table, via the in-memory index) as JSON.
+      - ?bbox=west,south,east,north  (only pins in the map viewport)
+      - ?near=lat,lng&radius_m=<meters>
     """
-    return jsonify(search_results)
+    try:
+        geo = _geo_filter_args()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    if not geo:
+        return jsonify(get_place_index().places)
+    return jsonify(places_in_area(get_place_index(), **geo))
 
 @main.route("/api/search/places")
 def api_search_places():
     """
     Dedicated search endpoint. Frontend can hit this with ?q=...
     You can evolve the internals in search_service.py without touching this.
+      - ?ranking=legacy|bm25 (default legacy)
+      - ?fuzzy=true|false (typo-tolerant matching, default false)
+      - ?bbox=west,south,east,north
+      - ?near=lat,lng&radius_m=<meters>
+      - ?limit=<int> (default 50, max 200), ?offset=<int>
+      - ?category=<name>[,<name>...]  ?verified=true|false  ?open_now=true|false
+      - ?facets=true|false (counts for categories / verified / open now)
     """
     q = (request.args.get("q") or "").strip()
+    limit = max(1, min(request.args.get("limit", default=50, type=int), 200))
+    offset = max(0, request.args.get("offset", default=0, type=int))
+    fuzzy = request.args.get("fuzzy", default="false").lower() in ("1", "true", "yes")
+    with_facets = request.args.get("facets", default="false").lower() in ("1", "true", "yes")
+    categories = [c.strip() for raw in request.args.getlist("category") for c in raw.split(",") if c.strip()]
+    ranking = (request.args.get("ranking") or "legacy").strip().lower()
+    if ranking not in RANKING_MODES:
+        return jsonify({"error": f"ranking must be one of: {', '.join(RANKING_MODES)}"}), 400
+    try:
+        geo = _geo_filter_args()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
     # Toggle this if you want "browse mode" on empty queries.
     SHOW_ALL_ON_EMPTY = False
 
-    results = search_places(q, search_results, show_all_on_empty=SHOW_ALL_ON_EMPTY)
+    results, total, facets = search_places_page(
+        q,
+        get_place_index(),
+        limit=limit,
+        offset=offset,
+        show_all_on_empty=SHOW_ALL_ON_EMPTY,
+        ranking=ranking,
+        fuzzy=fuzzy,
+        category=categories or None,
+        verified=_optional_bool_arg("verified"),
+        open_now=_optional_bool_arg("open_now"),
+        facets=with_facets,
+        **geo,
+    )
+    next_offset = offset + len(results)
 
-    return jsonify({
+    payload = {
         "query": q,
+        "ranking": ranking,
+        "fuzzy": fuzzy,
         "count": len(results),
-        "total": len(results),
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+        "next_offset": next_offset if next_offset < total else None,
         "places": results,
+    }
+    if facets is not None:
+        payload["facets"] = facets
+    return jsonify(payload)
+
+@main.route("/api/search/suggest")
+def api_search_suggest():
+    """
+    Autocomplete endpoint, cheap enough to call on every keystroke.
+      - ?prefix=<typed text>
+      - ?limit=<int> (default 8, max 20)
+    """
+    prefix = request.args.get("prefix") or ""
+    limit = max(1, min(request.args.get("limit", default=8, type=int), 20))
+
+    return jsonify({
+        "prefix": prefix,
+        "suggestions": suggest(prefix, get_place_index(), limit=limit),
     })
 
 @main.route("/news")
@@ -1422,7 +432,7 @@ def admin_create_blog_post():
 @admin_required
 def admin_blog_detail(post_id):
     post = BlogPost.query.get_or_404(post_id)
-    bc = BlogContent.query.filter_by(post_id=post_id).first()
+    bc = BlogContent.query.options(undefer_content()).filter_by(post_id=post_id).first()
 
     post_form = BlogPostUpdateForm(obj=post)
     content_form = BlogContentForm(obj=bc) if bc else BlogContentForm()
@@ -1527,5 +537,26 @@ def debug_db():
         "news_post_count": news_count
     })
 
+@main.route('/api/debug/search-cache')
+@admin_required
+def debug_search_cache():
+    # Hit/miss counters for the /api/search/places query cache
+    return jsonify(QUERY_CACHE.stats())
 
+@main.route('/api/debug/response-cache')
+@admin_required
+def debug_response_cache():
+    # Backend, size and hit/miss counters for the /api/v1 response cache
+    return jsonify(response_cache.stats())
 
+@main.route('/api/debug/slug-index')
+@admin_required
+def debug_slug_index():
+    # Entries and hit/miss counters of this worker's slug -> post map
+    return jsonify(slug_index.stats())
+
+@main.route('/api/debug/mongo')
+@admin_required
+def debug_mongo():
+    # Last out-of-band ping result; a stale one is refreshed in the background
+    return jsonify(mongo.health())
@@ -385,8 +385,10 @@ class BlogPostOutSchema(Schema):
 
 
 
-blog_post_out = BlogPostOutSchema()
-blog_post_list_out = BlogPostOutSchema(many=True)
+# `content` is left out of the dumps: endpoints embed BlogContent themselves,
+# only when they serve it, so dumping a post never loads its content row
+blog_post_out = BlogPostOutSchema(exclude=("content",))
+blog_post_list_out = BlogPostOutSchema(many=True, exclude=("content",))
 
 # ======================================================
 # BlogPost Schemas (fixed validator signatures)
@@ -612,8 +614,17 @@ class PostAnalyticsUpdateSchema(Schema):
         if v is not None and v < 0:
             raise ValidationError("shares cannot be negative.")
 
+class PostAnalyticsHitSchema(Schema):
+    event = fields.String(load_default="view")
+
+    @validates("event")
+    def _v_event(self, v, **kwargs):
+        if v not in ("view", "like", "share"):
+            raise ValidationError("event must be one of: view, like, share.")
+
 post_analytics_create = PostAnalyticsCreateSchema()
 post_analytics_update = PostAnalyticsUpdateSchema()
+post_analytics_hit = PostAnalyticsHitSchema()
 
 # ------------------------------------------------------
 # BlogPost + Analytics combined output
@@ -624,8 +635,8 @@ class BlogPostWithAnalyticsOutSchema(BlogPostOutSchema):
     comments = fields.Function(lambda o: getattr(getattr(o, "analytics", None), "comments", 0))
     shares   = fields.Function(lambda o: getattr(getattr(o, "analytics", None), "shares", 0))
 
-blog_post_with_analytics_out = BlogPostWithAnalyticsOutSchema()
-blog_post_with_analytics_list_out = BlogPostWithAnalyticsOutSchema(many=True)
+blog_post_with_analytics_out = BlogPostWithAnalyticsOutSchema(exclude=("content",))
+blog_post_with_analytics_list_out = BlogPostWithAnalyticsOutSchema(many=True, exclude=("content",))
 
 # ======================================================
 # Latest News Posts View Schema
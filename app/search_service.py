@@ -1,7 +1,20 @@
 # search_service.py
 from __future__ import annotations
+import heapq
+import itertools
+import math
 import re
-from typing import List, Dict, Set, Tuple
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Callable, List, Dict, NamedTuple, Set, Tuple
+
+try:  # optional: vectorized scoring path for large catalogs
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
 
 # -------- tokenization & synonyms (easy to evolve later) ---------------------
 
@@ -23,64 +36,923 @@ DEFAULT_SYNONYMS: Dict[str, Set[str]] = {
     "restaurant": {"restaurant", "food", "dining"},
 }
 
-def _expand_query_terms(q: str, synonyms: Dict[str, Set[str]] | None) -> Set[str]:
+def _expand_query_terms(
+    q: str,
+    synonyms: Dict[str, Set[str]] | None,
+    correct: Callable[[str], Set[str]] | None = None,
+) -> Set[str]:
     base = set(_tokens(q))
+    if correct is not None:
+        # spelling corrections first, so "barbr" -> "barber" still gets its synonyms
+        base = {c for t in base for c in correct(t)}
     syn = synonyms or DEFAULT_SYNONYMS
     expanded: Set[str] = set()
     for t in base:
         expanded |= syn.get(t, {t})
     return expanded or base
 
-# -------- scoring ------------------------------------------------------------
+# -------- inverted index -----------------------------------------------------
+
+# Field weights for the default scorer. The position of a field in this dict is
+# also the bit it occupies in a posting's field mask.
+FIELD_WEIGHTS: Dict[str, int] = {
+    "title": 3,
+    "tags": 2,        # optional field
+    "categories": 2,
+    "address": 1,
+    "slug": 1,
+}
+_FIELDS: Tuple[str, ...] = tuple(FIELD_WEIGHTS)
+
+# mask -> summed weight of the fields in that mask (32 entries, built once)
+_MASK_WEIGHT: List[int] = [
+    sum(w for bit, w in enumerate(FIELD_WEIGHTS.values()) if mask & (1 << bit))
+    for mask in range(1 << len(_FIELDS))
+]
+
+_SUBSTRING_MEMO_MAX = 4096
+
+# BM25F parameters: per-field weights reuse FIELD_WEIGHTS; `b` controls how
+# much a long field (e.g. a full street address) is penalized.
+BM25_K1 = 1.2
+BM25_B: Dict[str, float] = {
+    "title": 0.75,
+    "tags": 0.5,
+    "categories": 0.5,
+    "address": 0.75,
+    "slug": 0.3,
+}
+
+RANKING_MODES: Tuple[str, ...] = ("legacy", "bm25")
+
+# Fuzzy matching (SymSpell-style): max edit distance, and how many leading
+# characters of a token feed the deletion dictionary.
+FUZZY_MAX_EDIT = 2
+FUZZY_PREFIX_LEN = 7
+FUZZY_MIN_LEN = 3   # shorter terms are never "corrected"
+
+# Catalogs at least this large are scored with NumPy (when installed);
+# below it the dict-based path is faster.
+VECTORIZE_MIN_PLACES = 2000
+
+# Query-result cache in front of search_places_page
+QUERY_CACHE_SIZE = 1024
+QUERY_CACHE_TTL = 60.0   # seconds
+
+# Spatial grid: ~1.1km x ~0.9km cells around Atlanta's latitude.
+GEO_CELL_DEG = 0.01
+_EARTH_RADIUS_M = 6_371_000.0
+DEFAULT_RADIUS_M = 1_600.0
+MAX_RADIUS_M = 50_000.0
+
+def _field_text(place: dict, field: str) -> str:
+    val = place.get(field)
+    if isinstance(val, (list, tuple)):
+        return " ".join(v for v in val if v)
+    return val or ""
+
+def _parse_coord(val, limit: float) -> float:
+    """Parse a lat/lng that may be a padded string (e.g. " -84.36"); NaN if unusable."""
+    try:
+        num = float(str(val).strip())
+    except (TypeError, ValueError):
+        return math.nan
+    return num if -limit <= num <= limit else math.nan
+
+def _haversine_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp, dl = p2 - p1, math.radians(lng2 - lng1)
+    h = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * _EARTH_RADIUS_M * math.asin(math.sqrt(h))
+
+def _deletes(word: str, max_edit: int) -> Set[str]:
+    """All strings reachable from `word` by deleting up to `max_edit` characters."""
+    out: Set[str] = set()
+    frontier = {word}
+    for _ in range(max_edit):
+        nxt: Set[str] = set()
+        for w in frontier:
+            for i in range(len(w)):
+                nxt.add(w[:i] + w[i + 1:])
+        nxt -= out
+        out |= nxt
+        frontier = nxt
+    return out
+
+def _edit_distance(a: str, b: str, max_edit: int) -> int:
+    """
+    Optimal-string-alignment distance (adjacent transpositions count as 1),
+    giving up early with max_edit + 1 once the bound is exceeded.
+    """
+    if abs(len(a) - len(b)) > max_edit:
+        return max_edit + 1
+    prev2: List[int] = []
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        if min(cur) > max_edit:
+            return max_edit + 1
+        prev2, prev = prev, cur
+    return prev[-1]
+
+def _bits_from_docs(docs, n_bytes: int) -> int:
+    """Bitset (Python int, bit i = place i) from place positions, in O(n/8)."""
+    buf = bytearray(n_bytes)
+    for doc in docs:
+        buf[doc >> 3] |= 1 << (doc & 7)
+    return int.from_bytes(buf, "little")
+
+def _has_bit(buf: bytes, doc: int) -> bool:
+    return bool(buf[doc >> 3] >> (doc & 7) & 1)
+
+def _trigrams(token: str) -> Set[str]:
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+
+class PlaceIndex:
+    """
+    Inverted index over a list of places, built once and reused per query:
+
+      postings[token] -> {place position: bitmask of fields holding the token}
+
+    Query terms keep the original "term appears inside a field token"
+    semantics: each term is resolved to the vocabulary tokens containing it
+    (via a trigram index over the vocabulary, memoized), and only the places
+    in those posting lists are scored.
+
+    The BM25F statistics (per-field term frequencies, length normalizers and
+    idf per token) are also computed here, so ranking=bm25 costs no more per
+    query than the default scorer.
+    """
+
+    _generations = itertools.count(1)
+
+    def __init__(self, places: List[dict]):
+        self.source = places
+        self.places: List[dict] = list(places)
+        self.generation = next(PlaceIndex._generations)   # identifies this catalog build
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.field_tf: Dict[str, Dict[int, Tuple[int, ...]]] = {}
+
+        n_fields = len(_FIELDS)
+        field_len: List[List[int]] = [[0] * len(self.places) for _ in _FIELDS]
+
+        for doc, place in enumerate(self.places):
+            counts: Dict[str, List[int]] = {}
+            for bit, field in enumerate(_FIELDS):
+                toks = _tokens(_field_text(place, field))
+                field_len[bit][doc] = len(toks)
+                for tok in toks:
+                    posting = self.postings.setdefault(tok, {})
+                    posting[doc] = posting.get(doc, 0) | (1 << bit)
+                    counts.setdefault(tok, [0] * n_fields)[bit] += 1
+            for tok, tfs in counts.items():
+                self.field_tf.setdefault(tok, {})[doc] = tuple(tfs)
+
+        # BM25F statistics
+        n_docs = len(self.places)
+        self.idf: Dict[str, float] = {
+            tok: math.log(1.0 + (n_docs - len(posting) + 0.5) / (len(posting) + 0.5))
+            for tok, posting in self.postings.items()
+        }
+        self._bm25_norm: List[List[float]] = []
+        for bit, field in enumerate(_FIELDS):
+            lengths = field_len[bit]
+            avg = (sum(lengths) / n_docs) if n_docs else 0.0
+            b = BM25_B[field]
+            self._bm25_norm.append([
+                (1.0 - b + b * (ln / avg)) if avg else 1.0 for ln in lengths
+            ])
+
+        self._vocab_grams: Dict[str, Set[str]] = {}
+        for tok in self.postings:
+            for g in _trigrams(tok):
+                self._vocab_grams.setdefault(g, set()).add(tok)
+
+        self._substring_memo: Dict[str, Tuple[str, ...]] = {}
+        self._columnar: ColumnarScorer | None = None
+
+        # SymSpell deletion dictionary: delete-variant of a token's prefix ->
+        # vocabulary tokens, so a misspelling resolves with a few dict hits.
+        self._deletions: Dict[str, List[str]] = {}
+        for tok in self.postings:
+            if len(tok) < FUZZY_MIN_LEN:
+                continue
+            head = tok[:FUZZY_PREFIX_LEN]
+            for variant in _deletes(head, FUZZY_MAX_EDIT) | {head}:
+                self._deletions.setdefault(variant, []).append(tok)
+        self._correction_memo: Dict[str, Set[str]] = {}
+        self._suggesters: Dict[int, PrefixSuggester] = {}
+
+        # Tie-break columns for ranking (desc): review_count, then rating.
+        self.review_count = array("d", (p.get("review_count") or 0 for p in self.places))
+        self.rating = array("d", (p.get("rating") or 0 for p in self.places))
+
+        # Facet bitsets (bit i = place i): per category, ATL verified, open now.
+        self._n_bytes = (len(self.places) + 7) // 8
+        cat_docs: Dict[str, List[int]] = {}
+        for doc, place in enumerate(self.places):
+            for cat in {" ".join(_tokens(c)) for c in place.get("categories") or []}:
+                if cat:
+                    cat_docs.setdefault(cat, []).append(doc)
+        self.category_bits: Dict[str, int] = {
+            cat: _bits_from_docs(docs, self._n_bytes) for cat, docs in cat_docs.items()
+        }
+        self.verified_bits = _bits_from_docs(
+            (d for d, p in enumerate(self.places) if p.get("is_atl_verified")), self._n_bytes
+        )
+        self.open_now_bits = _bits_from_docs(
+            (d for d, p in enumerate(self.places) if p.get("open_now_status")), self._n_bytes
+        )
+        self._all_bits = (1 << len(self.places)) - 1
+
+        # Coordinates parsed once into float arrays (NaN = no usable coords),
+        # bucketed into a uniform lat/lng grid for bbox / radius lookups.
+        self.lat = array("d", (_parse_coord(p.get("lat"), 90.0) for p in self.places))
+        self.lng = array("d", (_parse_coord(p.get("lng"), 180.0) for p in self.places))
+        self._grid: Dict[Tuple[int, int], List[int]] = {}
+        for doc in range(len(self.places)):
+            la, ln = self.lat[doc], self.lng[doc]
+            if la == la and ln == ln:   # not NaN
+                self._grid.setdefault(self._cell(la, ln), []).append(doc)
+
+    def __len__(self) -> int:
+        return len(self.places)
+
+    def is_stale(self, places: List[dict]) -> bool:
+        return places is not self.source or len(places) != len(self.places)
+
+    @staticmethod
+    def _cell(lat: float, lng: float) -> Tuple[int, int]:
+        return (math.floor(lat / GEO_CELL_DEG), math.floor(lng / GEO_CELL_DEG))
+
+    def within_bbox(self, west: float, south: float, east: float, north: float) -> Set[int]:
+        """Places inside a lng/lat bounding box (only the covering grid cells are visited)."""
+        (r0, c0), (r1, c1) = self._cell(south, west), self._cell(north, east)
+        n_cells = (r1 - r0 + 1) * (c1 - c0 + 1)
+        if n_cells > len(self._grid):
+            buckets = [docs for (r, c), docs in self._grid.items() if r0 <= r <= r1 and c0 <= c <= c1]
+        else:
+            buckets = [self._grid.get((r, c), ()) for r in range(r0, r1 + 1) for c in range(c0, c1 + 1)]
+
+        lat, lng = self.lat, self.lng
+        return {
+            doc for docs in buckets for doc in docs
+            if south <= lat[doc] <= north and west <= lng[doc] <= east
+        }
+
+    def within_radius(self, lat: float, lng: float, radius_m: float) -> Set[int]:
+        """Places within `radius_m` meters of a point: bbox prefilter, then haversine."""
+        dlat = math.degrees(radius_m / _EARTH_RADIUS_M)
+        dlng = dlat / max(math.cos(math.radians(lat)), 1e-6)
+        box = self.within_bbox(lng - dlng, lat - dlat, lng + dlng, lat + dlat)
+        return {doc for doc in box if _haversine_m(lat, lng, self.lat[doc], self.lng[doc]) <= radius_m}
+
+    def area_filter(
+        self,
+        bbox: Tuple[float, float, float, float] | None = None,
+        near: Tuple[float, float] | None = None,
+        radius_m: float | None = None,
+    ) -> Set[int] | None:
+        """Combined geo filter as a set of place positions (None = no geo filter)."""
+        allowed: Set[int] | None = None
+        if bbox is not None:
+            allowed = self.within_bbox(*bbox)
+        if near is not None:
+            ring = self.within_radius(near[0], near[1], radius_m or DEFAULT_RADIUS_M)
+            allowed = ring if allowed is None else allowed & ring
+        return allowed
+
+    def facet_filter(
+        self,
+        category: List[str] | None = None,
+        verified: bool | None = None,
+        open_now: bool | None = None,
+    ) -> int | None:
+        """
+        AND of the requested facet bitsets (categories are OR-ed together);
+        None when no facet filter is requested.
+        """
+        if not category and verified is None and open_now is None:
+            return None
+        bits = self._all_bits
+        if category:
+            cat_bits = 0
+            for cat in category:
+                cat_bits |= self.category_bits.get(" ".join(_tokens(cat)), 0)
+            bits &= cat_bits
+        if verified is not None:
+            bits &= self.verified_bits if verified else ~self.verified_bits
+        if open_now is not None:
+            bits &= self.open_now_bits if open_now else ~self.open_now_bits
+        return bits & self._all_bits
+
+    def facet_counts(self, match_bits: int) -> dict:
+        """Facet counts for a match set: one AND + popcount per facet value."""
+        cats = []
+        for cat, bits in self.category_bits.items():
+            n = (bits & match_bits).bit_count()
+            if n:
+                cats.append({"value": cat, "count": n})
+        cats.sort(key=lambda c: (-c["count"], c["value"]))
+        return {
+            "categories": cats,
+            "is_atl_verified": (self.verified_bits & match_bits).bit_count(),
+            "open_now_status": (self.open_now_bits & match_bits).bit_count(),
+        }
+
+    def vocab_containing(self, term: str) -> Tuple[str, ...]:
+        """Vocabulary tokens that contain `term` as a substring."""
+        hit = self._substring_memo.get(term)
+        if hit is not None:
+            return hit
+
+        if len(term) >= 3:
+            pools = sorted((self._vocab_grams.get(g, set()) for g in _trigrams(term)), key=len)
+            pool = set.intersection(*pools) if pools and pools[0] else set()
+        else:
+            pool = self.postings.keys()
+        hit = tuple(tok for tok in pool if term in tok)
+
+        if len(self._substring_memo) >= _SUBSTRING_MEMO_MAX:
+            self._substring_memo.clear()
+        self._substring_memo[term] = hit
+        return hit
+
+    def corrections(self, term: str) -> Set[str]:
+        """
+        `term` plus, if it is not itself a vocabulary token, the closest
+        vocabulary tokens within edit distance 1 (short terms) or 2.
+        """
+        hit = self._correction_memo.get(term)
+        if hit is not None:
+            return hit
+
+        out = {term}
+        if term not in self.postings and len(term) >= FUZZY_MIN_LEN:
+            max_edit = 1 if len(term) <= 4 else FUZZY_MAX_EDIT
+            head = term[:FUZZY_PREFIX_LEN]
+            candidates: Set[str] = set()
+            for variant in _deletes(head, max_edit) | {head}:
+                candidates.update(self._deletions.get(variant, ()))
+
+            best = max_edit + 1
+            closest: Set[str] = set()
+            for cand in candidates:
+                d = _edit_distance(term, cand, best)
+                if d < best:
+                    best, closest = d, {cand}
+                elif d == best and d <= max_edit:
+                    closest.add(cand)
+            out |= closest
+
+        if len(self._correction_memo) >= _SUBSTRING_MEMO_MAX:
+            self._correction_memo.clear()
+        self._correction_memo[term] = out
+        return out
+
+    def score(self, terms: Set[str]) -> Dict[int, int]:
+        """
+        Score only the places reachable from the terms' posting lists.
+        Each term adds each field's weight at most once per place.
+        """
+        scores: Dict[int, int] = {}
+        for t in terms:
+            masks: Dict[int, int] = {}
+            for tok in self.vocab_containing(t):
+                for doc, mask in self.postings[tok].items():
+                    masks[doc] = masks.get(doc, 0) | mask
+            for doc, mask in masks.items():
+                scores[doc] = scores.get(doc, 0) + _MASK_WEIGHT[mask]
+        return scores
+
+    def score_bm25(self, terms: Set[str]) -> Dict[int, float]:
+        """
+        BM25F over whole tokens (so "bar" no longer matches "barber"):
+        field-weighted, length-normalized tf per place, saturated by k1 and
+        scaled by the token's idf. All statistics come from index build time.
+        """
+        weights = tuple(FIELD_WEIGHTS.values())
+        norms = self._bm25_norm
+        scores: Dict[int, float] = {}
+        for t in terms:
+            posting = self.field_tf.get(t)
+            if not posting:
+                continue
+            idf = self.idf[t]
+            for doc, tfs in posting.items():
+                tf = 0.0
+                for bit, n in enumerate(tfs):
+                    if n:
+                        tf += weights[bit] * n / norms[bit][doc]
+                scores[doc] = scores.get(doc, 0.0) + idf * tf / (BM25_K1 + tf)
+        return scores
+
+    @property
+    def vectorized(self) -> bool:
+        return np is not None and len(self.places) >= VECTORIZE_MIN_PLACES
+
+    def columnar(self) -> "ColumnarScorer":
+        if self._columnar is None:
+            self._columnar = ColumnarScorer(self)
+        return self._columnar
+
+    def suggester(self, synonyms: Dict[str, Set[str]] | None = None) -> "PrefixSuggester":
+        syn = synonyms or DEFAULT_SYNONYMS
+        sug = self._suggesters.get(id(syn))
+        if sug is None:
+            sug = self._suggesters[id(syn)] = PrefixSuggester(self, syn)
+        return sug
+
+# -------- vectorized scoring -------------------------------------------------
+
+class ColumnarScorer:
+    """
+    Columnar copy of a PlaceIndex for NumPy scoring: one CSR term x place
+    matrix per field (row = vocabulary token, value = term frequency),
+    plus float arrays for the BM25 normalizers and the review_count / rating
+    tie-breakers. A query is scored as weighted sparse row gathers into a
+    dense score vector. The arithmetic runs in the same order as the dict
+    scorers, so scores and result order are identical.
+    """
+
+    def __init__(self, index: PlaceIndex):
+        self.n = len(index.places)
+        self.token_id: Dict[str, int] = {tok: i for i, tok in enumerate(index.field_tf)}
+        self.indptr: List["np.ndarray"] = []
+        self.indices: List["np.ndarray"] = []
+        self.data: List["np.ndarray"] = []
+        for bit in range(len(_FIELDS)):
+            indptr = [0]
+            indices: List[int] = []
+            data: List[int] = []
+            for posting in index.field_tf.values():
+                for doc in sorted(posting):
+                    tf = posting[doc][bit]
+                    if tf:
+                        indices.append(doc)
+                        data.append(tf)
+                indptr.append(len(indices))
+            self.indptr.append(np.asarray(indptr, dtype=np.int64))
+            self.indices.append(np.asarray(indices, dtype=np.int32))
+            self.data.append(np.asarray(data, dtype=np.float64))
+
+        self.norms = [np.asarray(col, dtype=np.float64) for col in index._bm25_norm]
+        self.idf = index.idf
+        self.review_count = np.asarray(index.review_count, dtype=np.float64)
+        self.rating = np.asarray(index.rating, dtype=np.float64)
+        self._index = index
+
+    def _row(self, bit: int, tid: int) -> Tuple["np.ndarray", "np.ndarray"]:
+        lo, hi = self.indptr[bit][tid], self.indptr[bit][tid + 1]
+        return self.indices[bit][lo:hi], self.data[bit][lo:hi]
+
+    def score(self, terms: Set[str]) -> "np.ndarray":
+        """Legacy weights: each field's weight once per (term, place) with a substring hit."""
+        scores = np.zeros(self.n, dtype=np.float64)
+        for t in terms:
+            tids = [self.token_id[tok] for tok in self._index.vocab_containing(t)]
+            if not tids:
+                continue
+            for bit, w in enumerate(FIELD_WEIGHTS.values()):
+                rows = [self._row(bit, tid)[0] for tid in tids]
+                docs = rows[0] if len(rows) == 1 else np.concatenate(rows)
+                if docs.size:
+                    hit = np.zeros(self.n, dtype=bool)
+                    hit[docs] = True
+                    scores += w * hit
+        return scores
 
-def _score_place(place: dict, terms: Set[str]) -> int:
+    def score_bm25(self, terms: Set[str]) -> "np.ndarray":
+        scores = np.zeros(self.n, dtype=np.float64)
+        for t in terms:
+            tid = self.token_id.get(t)
+            if tid is None:
+                continue
+            tf = np.zeros(self.n, dtype=np.float64)
+            for bit, w in enumerate(FIELD_WEIGHTS.values()):
+                docs, counts = self._row(bit, tid)
+                if docs.size:
+                    tf[docs] += w * counts / self.norms[bit][docs]
+            touched = tf > 0
+            scores[touched] += self.idf[t] * tf[touched] / (BM25_K1 + tf[touched])
+        return scores
+
+    def rank(
+        self,
+        scores: "np.ndarray",
+        keep: "np.ndarray | None",
+        offset: int,
+        stop: int | None,
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        (ranked page positions, all matching positions). Order: score,
+        review_count, rating (desc), then catalog order, via one lexsort.
+        """
+        matched = scores > 0
+        if keep is not None:
+            matched &= keep
+        cand = np.flatnonzero(matched)
+        order = np.lexsort((cand, -self.rating[cand], -self.review_count[cand], -scores[cand]))
+        return cand[order][offset:stop], cand
+
+# -------- autocomplete -------------------------------------------------------
+
+_SUGGEST_MEMO_PREFIX_LEN = 2   # memoize the (wide) 1-2 character prefix ranges
+
+class PrefixSuggester:
     """
-    Very basic scoring you can iterate on:
-      title > tags/categories > address > slug
+    Sorted-array prefix index over place titles, categories and synonym keys.
+
+    Every completion is ranked once at build time (places by review_count,
+    then rating; categories and synonym keys by the reviews of the places
+    they cover) and stored by rank position. Each completion is keyed at
+    every word start, so "bar" finds "Sakera Sake Bar & Bottles" too.
+    A lookup is two bisects plus a k-smallest over the matching slice.
     """
-    title = " ".join(_tokens(place.get("title", "")))
-    cats  = " ".join(_tokens(" ".join(place.get("categories") or [])))
-    tags  = " ".join(_tokens(" ".join(place.get("tags") or [])))   # optional field
-    addr  = " ".join(_tokens(place.get("address", "")))
-    slug  = " ".join(_tokens(place.get("slug", "")))
 
-    score = 0
-    for t in terms:
-        if t in title: score += 3
-        if t in tags:  score += 2
-        if t in cats:  score += 2
-        if t in addr:  score += 1
-        if t in slug:  score += 1
-    return score
+    def __init__(self, index: PlaceIndex, synonyms: Dict[str, Set[str]]):
+        # (text, type, slug, rank key) before ranking
+        raw: List[Tuple[str, str, str | None, Tuple[float, ...]]] = []
+
+        cat_reviews: Dict[str, List[float]] = {}
+        for place in index.places:
+            reviews = place.get("review_count") or 0
+            rating = place.get("rating") or 0
+            title = (place.get("title") or "").strip()
+            if title:
+                raw.append((title, "place", place.get("slug"), (reviews, rating)))
+            for cat in place.get("categories") or []:
+                key = " ".join(_tokens(cat))
+                if key:
+                    agg = cat_reviews.setdefault(key, [0, 0])
+                    agg[0] += reviews
+                    agg[1] += 1
+
+        for cat, (reviews, count) in cat_reviews.items():
+            raw.append((cat, "category", None, (reviews, count)))
+
+        for key, group in synonyms.items():
+            docs: Set[int] = set()
+            for t in group:
+                docs.update(index.postings.get(t, ()))
+            reviews = sum(index.places[d].get("review_count") or 0 for d in docs)
+            raw.append((key, "term", None, (reviews, len(docs))))
+
+        raw.sort(key=lambda r: r[3], reverse=True)
+        self.completions: List[dict] = []
+        pairs: List[Tuple[str, int]] = []
+        seen_terms: Set[str] = set()
+        for text, kind, slug, _ in raw:
+            toks = _tokens(text)
+            if kind != "place":
+                # a synonym key that is also a category only shows up once
+                if text in seen_terms:
+                    continue
+                seen_terms.add(text)
+            rank = len(self.completions)
+            item = {"text": text, "type": kind}
+            if slug:
+                item["slug"] = slug
+            self.completions.append(item)
+            for i in range(len(toks)):
+                pairs.append((" ".join(toks[i:]), rank))
+
+        pairs.sort()
+        self._keys: List[str] = [k for k, _ in pairs]
+        self._ranks: List[int] = [r for _, r in pairs]
+        self._memo: Dict[Tuple[str, int], List[dict]] = {}
+
+    def suggest(self, prefix: str, limit: int = 8) -> List[dict]:
+        norm = " ".join(_tokens(prefix))
+        if not norm or limit <= 0:
+            return []
+        if prefix[-1:].isspace():
+            norm += " "   # "sake " should not complete to "sakera"
+
+        memo_key = (norm, limit)
+        if len(norm) <= _SUGGEST_MEMO_PREFIX_LEN and memo_key in self._memo:
+            return self._memo[memo_key]
+
+        lo = bisect_left(self._keys, norm)
+        hi = bisect_left(self._keys, norm + "\uffff", lo)
+        out = [self.completions[r] for r in heapq.nsmallest(limit, set(self._ranks[lo:hi]))]
+
+        if len(norm) <= _SUGGEST_MEMO_PREFIX_LEN:
+            self._memo[memo_key] = out
+        return out
+
+
+# -------- query cache --------------------------------------------------------
+
+class QueryCache:
+    """
+    Bounded LRU + TTL cache of SearchPage results.
+
+    Keys hold the *expanded* term set (after synonyms and spelling
+    corrections), so editing the synonym table changes the keys and can
+    never serve stale rankings. The whole cache is dropped as soon as a
+    query arrives for a new catalog build (PlaceIndex.generation).
+    """
+
+    def __init__(self, maxsize: int = QUERY_CACHE_SIZE, ttl: float = QUERY_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._generation = None
+        self._data: "OrderedDict[tuple, Tuple[float, SearchPage]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, generation: int, key: tuple) -> "SearchPage | None":
+        with self._lock:
+            if generation != self._generation:
+                self._data.clear()
+                self._generation = generation
+            entry = self._data.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, generation: int, key: tuple, page: "SearchPage") -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._data[key] = (time.monotonic() + self.ttl, page)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+QUERY_CACHE = QueryCache()
+
+
+_INDEX: PlaceIndex | None = None
+
+def get_index(places: List[dict] | PlaceIndex) -> PlaceIndex:
+    """
+    Return the prebuilt index for `places`, (re)building it only when a
+    different list is passed in or the list has changed size.
+    """
+    global _INDEX
+    if isinstance(places, PlaceIndex):
+        return places
+    if _INDEX is None or _INDEX.is_stale(places):
+        _INDEX = PlaceIndex(places)
+    return _INDEX
 
 # -------- public API ---------------------------------------------------------
 
+class SearchPage(NamedTuple):
+    places: List[dict]
+    total: int
+    facets: dict | None = None
+
+
+def search_places_page(
+    q: str,
+    places: List[dict] | PlaceIndex,
+    *,
+    limit: int | None = None,
+    offset: int = 0,
+    synonyms: Dict[str, Set[str]] | None = None,
+    show_all_on_empty: bool = False,
+    ranking: str = "legacy",
+    fuzzy: bool = False,
+    bbox: Tuple[float, float, float, float] | None = None,
+    near: Tuple[float, float] | None = None,
+    radius_m: float | None = None,
+    category: List[str] | None = None,
+    verified: bool | None = None,
+    open_now: bool | None = None,
+    facets: bool = False,
+    use_cache: bool = True,
+) -> SearchPage:
+    """
+    One page of search results plus the exact number of matches:
+    SearchPage(places[offset:offset + limit], total, facets).
+
+    Only the best offset+limit candidates are selected, with a bounded heap
+    (O(n log k)); the full ranked list is never built. limit=None returns
+    every match.
+
+    ranking:
+      - "legacy": fixed field weights, substring matching (default)
+      - "bm25":   BM25F over whole tokens with precomputed field statistics
+    fuzzy:
+      also match the closest vocabulary tokens for misspelled terms
+      ("barbr" -> "barber", "cofee" -> "coffee")
+    bbox / near+radius_m:
+      restrict results to (west, south, east, north) and/or a circle around
+      (lat, lng); places without usable coordinates are excluded.
+    category / verified / open_now:
+      facet filters backed by precomputed bitsets. With an empty query they
+      browse the filtered places in catalog order.
+    facets:
+      also return counts per category, ATL verified and open now over the
+      whole match set (not just this page).
+    use_cache:
+      serve repeated queries from QUERY_CACHE (LRU + TTL).
+    """
+    if ranking not in RANKING_MODES:
+        raise ValueError(f"Unknown ranking mode: {ranking!r}")
+    offset = max(offset, 0)
+    stop = None if limit is None else offset + max(limit, 0)
+
+    index = get_index(places)
+    q = (q or "").strip()
+    terms = _expand_query_terms(q, synonyms, index.corrections if fuzzy else None) if q else set()
+
+    cache_key = None
+    if use_cache:
+        cache_key = (
+            frozenset(terms), bool(q), show_all_on_empty, ranking, offset, stop,
+            bbox, near, radius_m if near is not None else None,
+            tuple(sorted(category)) if category else None, verified, open_now, facets,
+        )
+        cached = QUERY_CACHE.get(index.generation, cache_key)
+        if cached is not None:
+            return cached
+
+    page = _search_page(index, bool(q), terms, show_all_on_empty, ranking, offset, stop,
+                        bbox, near, radius_m, category, verified, open_now, facets)
+    if cache_key is not None:
+        QUERY_CACHE.put(index.generation, cache_key, page)
+    return page
+
+def _search_page(
+    index: PlaceIndex,
+    has_query: bool,
+    terms: Set[str],
+    show_all_on_empty: bool,
+    ranking: str,
+    offset: int,
+    stop: int | None,
+    bbox, near, radius_m,
+    category, verified, open_now,
+    facets: bool,
+) -> SearchPage:
+    allowed = index.area_filter(bbox, near, radius_m)
+    facet_bits = index.facet_filter(category, verified, open_now)
+    facet_buf = None if facet_bits is None else facet_bits.to_bytes(index._n_bytes, "little")
+
+    if not has_query:
+        if not show_all_on_empty and facet_bits is None:
+            return SearchPage([], 0, index.facet_counts(0) if facets else None)
+        if allowed is None and facet_bits is None:
+            docs = range(len(index.places))
+            total = len(index.places)
+            page = index.places[offset:stop]
+        else:
+            docs = range(len(index.places)) if allowed is None else sorted(allowed)
+            if facet_buf is not None:
+                docs = [doc for doc in docs if _has_bit(facet_buf, doc)]
+            total = len(docs)
+            page = [index.places[doc] for doc in docs[offset:stop]]
+        match_bits = None
+        if facets:
+            match_bits = index._all_bits if isinstance(docs, range) else _bits_from_docs(docs, index._n_bytes)
+        return SearchPage(page, total, index.facet_counts(match_bits) if facets else None)
+
+    if index.vectorized:
+        return _search_page_vectorized(index, terms, ranking, offset, stop, allowed, facet_buf, facets)
+
+    scores = index.score_bm25(terms) if ranking == "bm25" else index.score(terms)
+    if allowed is not None or facet_buf is not None:
+        scores = {
+            doc: sc for doc, sc in scores.items()
+            if (allowed is None or doc in allowed)
+            and (facet_buf is None or _has_bit(facet_buf, doc))
+        }
+
+    # Sort by score, then review_count, then rating (desc); equal keys keep
+    # catalog order (hence -doc).
+    reviews, rating = index.review_count, index.rating
+    key = lambda doc: (scores[doc], reviews[doc], rating[doc], -doc)
+    if stop is None:
+        ranked = sorted(scores, key=key, reverse=True)
+    else:
+        ranked = heapq.nlargest(stop, scores, key=key)
+
+    counts = index.facet_counts(_bits_from_docs(scores, index._n_bytes)) if facets else None
+    return SearchPage([index.places[doc] for doc in ranked[offset:]], len(scores), counts)
+
+def _search_page_vectorized(
+    index: PlaceIndex,
+    terms: Set[str],
+    ranking: str,
+    offset: int,
+    stop: int | None,
+    allowed: Set[int] | None,
+    facet_buf: bytes | None,
+    facets: bool,
+) -> SearchPage:
+    cols = index.columnar()
+    scores = cols.score_bm25(terms) if ranking == "bm25" else cols.score(terms)
+
+    keep = None
+    if facet_buf is not None:
+        keep = np.unpackbits(np.frombuffer(facet_buf, dtype=np.uint8), bitorder="little")[:cols.n].astype(bool)
+    if allowed is not None:
+        in_area = np.zeros(cols.n, dtype=bool)
+        in_area[np.fromiter(allowed, dtype=np.int64, count=len(allowed))] = True
+        keep = in_area if keep is None else keep & in_area
+
+    ranked, matched = cols.rank(scores, keep, offset, stop)
+    counts = None
+    if facets:
+        mask = np.zeros(cols.n, dtype=bool)
+        mask[matched] = True
+        bits = int.from_bytes(np.packbits(mask, bitorder="little").tobytes(), "little")
+        counts = index.facet_counts(bits)
+    return SearchPage([index.places[doc] for doc in ranked.tolist()], int(matched.size), counts)
+
 def search_places(
     q: str,
-    places: List[dict],
+    places: List[dict] | PlaceIndex,
     *,
     synonyms: Dict[str, Set[str]] | None = None,
     show_all_on_empty: bool = False,
+    **options,
 ) -> List[dict]:
     """
     Returns a filtered/sorted list of places. Keep this as your single
     search entry point so you can swap in BM25/embeddings/ML later.
+    Accepts the same keyword options as search_places_page (ranking, geo
+    and facet filters, limit/offset).
     """
-    q = (q or "").strip()
-    if not q:
-        return places if show_all_on_empty else []
-
-    terms = _expand_query_terms(q, synonyms)
-    scored: List[Tuple[int, dict]] = []
-
-    for p in places:
-        s = _score_place(p, terms)
-        if s > 0:
-            scored.append((s, p))
-
-    # Sort by score, then review_count, then rating (desc)
-    scored.sort(
-        key=lambda t: (t[0], t[1].get("review_count", 0), t[1].get("rating", 0)),
-        reverse=True,
-    )
-    return [p for _, p in scored]
+    return search_places_page(
+        q, places, synonyms=synonyms, show_all_on_empty=show_all_on_empty, **options
+    ).places
+
+def places_in_area(
+    places: List[dict] | PlaceIndex,
+    *,
+    bbox: Tuple[float, float, float, float] | None = None,
+    near: Tuple[float, float] | None = None,
+    radius_m: float | None = None,
+) -> List[dict]:
+    """Places inside a bbox and/or radius, in catalog order (all places if no filter)."""
+    return search_places("", places, show_all_on_empty=True, bbox=bbox, near=near, radius_m=radius_m)
+
+def parse_bbox(raw: str) -> Tuple[float, float, float, float]:
+    """
+    Parse "west,south,east,north" (Leaflet's LatLngBounds.toBBoxString()).
+    Raises ValueError on malformed input.
+    """
+    parts = [float(x) for x in raw.split(",")]
+    if len(parts) != 4 or not all(map(math.isfinite, parts)):
+        raise ValueError("bbox must be west,south,east,north")
+    west, south, east, north = parts
+    if not (-180 <= west <= east <= 180 and -90 <= south <= north <= 90):
+        raise ValueError("bbox is out of range")
+    return west, south, east, north
+
+def parse_latlng(raw: str) -> Tuple[float, float]:
+    """Parse "lat,lng". Raises ValueError on malformed input."""
+    parts = [float(x) for x in raw.split(",")]
+    if len(parts) != 2 or not all(map(math.isfinite, parts)):
+        raise ValueError("near must be lat,lng")
+    lat, lng = parts
+    if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+        raise ValueError("near is out of range")
+    return lat, lng
+
+def suggest(
+    prefix: str,
+    places: List[dict] | PlaceIndex,
+    *,
+    limit: int = 8,
+    synonyms: Dict[str, Set[str]] | None = None,
+) -> List[dict]:
+    """
+    Top-`limit` completions for a typed prefix, as tiny
+    {"text", "type", ["slug"]} dicts suited to per-keystroke calls.
+    """
+    return get_index(places).suggester(synonyms).suggest(prefix, limit)
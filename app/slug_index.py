@@ -0,0 +1,120 @@
+# slug_index.py
+from __future__ import annotations
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, object_session
+
+from .models import db, BlogPost, NewsPost
+
+# Defaults (overridable via SLUG_INDEX_* config)
+SLUG_INDEX_SIZE = 4096
+SLUG_INDEX_TTL = 60.0
+
+
+class PostRef(NamedTuple):
+    post_id: int
+    is_news: bool
+    blog_cat_id: int
+
+
+class SlugIndex:
+    """
+    Process-local `<ident>` (slug or numeric id) -> PostRef map, filled on
+    first use, so resolving the ident of a detail / read-next / related
+    request is a dict hit. LRU-bounded at SLUG_INDEX_SIZE entries.
+
+    Commits that insert, update or delete a BlogPost or NewsPost drop that
+    post's entries (see the session hooks below, which also cover the admin
+    forms). Like the memory response cache, other workers converge within
+    SLUG_INDEX_TTL; callers that fetch the post re-check its slug and
+    resolve() again on a mismatch.
+    """
+
+    def __init__(self):
+        self.maxsize = SLUG_INDEX_SIZE
+        self.ttl = SLUG_INDEX_TTL
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()   # ident -> (expires, ref)
+        self._lock = threading.Lock()
+        self._generation = 0   # bumped by every invalidation
+        self.hits = self.misses = 0
+
+    def init_app(self, app) -> None:
+        self.maxsize = int(app.config.get("SLUG_INDEX_SIZE", SLUG_INDEX_SIZE))
+        self.ttl = float(app.config.get("SLUG_INDEX_TTL", SLUG_INDEX_TTL))
+
+    def resolve(self, ident: str) -> PostRef | None:
+        """PostRef for a slug or numeric id; None if no such post (misses are not cached)."""
+        ident = str(ident)
+        with self._lock:
+            item = self._data.get(ident)
+            if item is not None and item[0] >= time.monotonic():
+                self._data.move_to_end(ident)
+                self.hits += 1
+                return item[1]
+            generation = self._generation
+        self.misses += 1
+
+        by = BlogPost.post_id == int(ident) if ident.isdigit() else BlogPost.slug == ident
+        row = db.session.execute(
+            select(BlogPost.post_id, NewsPost.post_id.is_not(None), BlogPost.blog_cat_id)
+            .outerjoin(NewsPost, NewsPost.post_id == BlogPost.post_id)
+            .where(by)
+        ).first()
+        if row is None:
+            return None
+        ref = PostRef(row[0], bool(row[1]), row[2])
+        with self._lock:
+            # A write committed while we read: our row may predate it
+            if generation == self._generation and self.maxsize > 0:
+                self._data[ident] = (time.monotonic() + self.ttl, ref)
+                self._data.move_to_end(ident)
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+        return ref
+
+    def discard(self, ident: str) -> None:
+        with self._lock:
+            self._data.pop(str(ident), None)
+
+    def invalidate(self, post_ids=None) -> None:
+        """Drop the entries of `post_ids` (every entry if None)."""
+        with self._lock:
+            self._generation += 1
+            if post_ids is None:
+                self._data.clear()
+                return
+            ids = set(post_ids)
+            for ident in [k for k, (_, ref) in self._data.items() if ref.post_id in ids]:
+                del self._data[ident]
+
+    def stats(self) -> dict:
+        return {"entries": len(self._data), "hits": self.hits, "misses": self.misses}
+
+
+slug_index = SlugIndex()
+
+# -------- invalidation on commit ----------------------------------------------------
+
+_PENDING = "slug_index_pending"
+
+@event.listens_for(BlogPost, "after_insert")
+@event.listens_for(BlogPost, "after_update")
+@event.listens_for(BlogPost, "after_delete")
+@event.listens_for(NewsPost, "after_insert")
+@event.listens_for(NewsPost, "after_delete")
+def _post_changed(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING, set()).add(target.post_id)
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session):
+    # Ids flushed in a transaction that was rolled back stay pending until
+    # the next commit: a spurious miss, never a stale hit.
+    pending = session.info.pop(_PENDING, None)
+    if pending:
+        slug_index.invalidate(pending)
@@ -363,69 +363,37 @@ function renderWatchNow(post) {
   const pathParts = window.location.pathname.split('/').filter(Boolean);
   const slug = decodeURIComponent(pathParts[pathParts.length - 1] || '');
 
-  // API endpoints:
-  // - main post by slug (includes content)
-  //   ✅ Correct endpoint shape: /api/v1/blog-posts/<ident>
-  const postURLBySlug = `/api/v1/blog-posts/${encodeURIComponent(slug)}?include_content=true`;
-  const mostReadBlogURL = `/api/v1/analytics/most-read/blog`;
+  // API endpoint: the whole page (post + most_read + read_next + related)
+  // in one request — /api/v1/pages/blog/<ident>
+  const pageURL = `/api/v1/pages/blog/${encodeURIComponent(slug)}`;
 
   (async () => {
     try {
-      // 1) Fetch the main post by slug
-      const postRes = await fetch(postURLBySlug, { headers: { 'Accept': 'application/json' } });
-      if (!postRes.ok) {
-        console.error('[blog] post (by slug) fetch failed', postRes.status, await postRes.text());
+      const res = await fetch(pageURL, { headers: { 'Accept': 'application/json' } });
+      if (!res.ok) {
+        console.error('[blog] page fetch failed', res.status, await res.text());
         return;
       }
-      const post = await postRes.json();
-      console.log('[blog] post payload (slug):', post);
+      const page = await res.json();
+      console.log('[blog] page payload (slug):', page);
 
-      // Render the main article immediately
-      applyMainToDom(post);
+      // Main article
+      applyMainToDom(page.post);
 
-      // 2) Fire off dependent requests that need the numeric id
-      const postId = post?.post_id;
-      const readNextURL = postId ? `/api/v1/blog/${postId}/read-next` : null;
-      const relatedURL  = postId ? `/api/v1/blog/${postId}/related`   : null;
-
-      const fetches = [
-        fetch(mostReadBlogURL, { headers: { 'Accept': 'application/json' } }),
-        readNextURL ? fetch(readNextURL, { headers: { 'Accept': 'application/json' } }) : Promise.resolve(null),
-        relatedURL  ? fetch(relatedURL,  { headers: { 'Accept': 'application/json' } }) : Promise.resolve(null),
-      ];
-
-      const [mostReadRes, readNextRes, relatedRes] = await Promise.all(fetches);
+      // Count the view (write-behind; fire-and-forget)
+      if (page.post?.post_id && navigator.sendBeacon) {
+        navigator.sendBeacon(`/api/v1/post-analytics/${page.post.post_id}/hit`,
+          new Blob([JSON.stringify({ event: 'view' })], { type: 'application/json' }));
+      }
 
       // Most Read
-      if (mostReadRes && mostReadRes.ok) {
-        const mr = await mostReadRes.json();
-        const mostReadItems = Array.isArray(mr?.items) ? mr.items : [];
-        renderMostReadGrid(mostReadItems);
-      } else if (mostReadRes) {
-        console.error('[most-read] fetch failed', mostReadRes.status, await mostReadRes.text());
-      }
+      renderMostReadGrid(Array.isArray(page?.most_read?.items) ? page.most_read.items : []);
 
       // Read Next
-      if (readNextRes) {
-        if (!readNextRes.ok) {
-          console.error('[readNext] fetch failed', readNextRes.status, await readNextRes.text());
-        } else {
-          const data = await readNextRes.json();
-          const readNext = Array.isArray(data.items) ? data.items : [];
-          renderReadNextCarousel(readNext);
-        }
-      }
+      renderReadNextCarousel(Array.isArray(page?.read_next?.items) ? page.read_next.items : []);
 
       // Related
-      if (relatedRes) {
-        if (!relatedRes.ok) {
-          console.error('[related] fetch failed', relatedRes.status, await relatedRes.text());
-        } else {
-          const data = await relatedRes.json();
-          const relatedItems = Array.isArray(data.items) ? data.items : [];
-          renderRelatedArticles(relatedItems);
-        }
-      }
+      renderRelatedArticles(Array.isArray(page?.related?.items) ? page.related.items : []);
 
     } catch (err) {
       console.warn('error loading blog detail:', err);
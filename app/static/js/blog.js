@@ -161,6 +161,9 @@ console.log('blog.js loaded for /blog route');
     params.set('page', String(page));
     params.set('per_page', String(state.perPage));
     params.set('include_content', 'true'); // 🔔 expects BlogContent on list; server backlog if missing
+    // Cards only read title/image/link + the teaser paragraphs firstParagraph() looks at
+    params.set('fields', 'post_id,title,slug,image,image_url,content');
+    params.set('content_fields', 'section_1_paragraph_1,section_1_paragraph_2,section_2_paragraph_1,section_3_paragraph_1');
 
     const url = `/api/v1/analytics/latest-blog?${params.toString()}`;
     console.log('[blog] fetching (paged):', url);
@@ -391,6 +391,12 @@ console.log('news-detail.js file loaded');
         console.log('[news] post payload:', post);
       }
 
+      // Count the view (write-behind; fire-and-forget)
+      if (post?.post_id && navigator.sendBeacon) {
+        navigator.sendBeacon(`/api/v1/post-analytics/${post.post_id}/hit`,
+          new Blob([JSON.stringify({ event: 'view' })], { type: 'application/json' }));
+      }
+
       let readNext = [];
       if (!readNextRes.ok) {
         console.error('[readNext] fetch failed', readNextRes.status, await readNextRes.text());
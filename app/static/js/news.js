@@ -133,62 +133,41 @@ console.log('news.js loaded for /news route');
   }
 
   // --- build URLs ---
+  // Cards only need title/image/link + the teaser paragraphs firstParagraph() reads
+  const CARD_FIELDS = 'post_id,title,slug,image,image_url,content';
+  const TEASER_FIELDS = 'section_1_paragraph_1,section_1_paragraph_2,section_2_paragraph_1,section_3_paragraph_1';
+
   const params = new URLSearchParams();
   params.set('per_page', '10');
-  params.set('include_content', 'true');
+  params.set('latest', '3');
+  params.set('fields', CARD_FIELDS);
+  params.set('content_fields', TEASER_FIELDS);
 
-  const postsURL        = `/api/v1/news-posts?${params.toString()}`;
-  const mainURL         = `/api/v1/news-main?active=1&include_content=true`;
-  const mostReadNewsURL = `/api/v1/analytics/most-read/news`;
-  const latestNewsURL   = `/api/v1/analytics/latest-news?include_content=true&per_page=3`;
+  // One request for every section (posts, main, most_read, latest)
+  const pageURL = `/api/v1/pages/news?${params.toString()}`;
 
   (async () => {
     try {
-      const [postsRes, mainRes, mostReadRes, latestNewsRes] = await Promise.all([
-        fetch(postsURL,        { headers: { 'Accept': 'application/json' } }),
-        fetch(mainURL,         { headers: { 'Accept': 'application/json' } }),
-        fetch(mostReadNewsURL, { headers: { 'Accept': 'application/json' } }),
-        fetch(latestNewsURL,   { headers: { 'Accept': 'application/json' } })
-      ]);
+      const res = await fetch(pageURL, { headers: { 'Accept': 'application/json' } });
+      if (!res.ok) {
+        console.error('[news] page fetch failed', res.status, await res.text());
+        return;
+      }
+      const page = await res.json();
+      console.log('[news] page payload:', page);
 
       // ----- Posts (for fallback) -----
-      let posts = [];
-      if (!postsRes.ok) {
-        console.error('[news] posts fetch failed', postsRes.status, await postsRes.text());
-      } else {
-        const data = await postsRes.json();
-        console.log('[news] posts payload:', data);
-        posts = Array.isArray(data.items) ? data.items
-              : (Array.isArray(data.news) ? data.news : []);
-      }
+      const posts = Array.isArray(page?.posts?.items) ? page.posts.items : [];
 
       // ----- Main story -----
-      let mainItem = null;
-      if (!mainRes.ok) {
-        console.error('[news] main fetch failed', mainRes.status, await mainRes.text());
-      } else {
-        const payload = await mainRes.json();
-        const first = Array.isArray(payload?.items) ? payload.items[0] : null;
-        if (first) {
-          mainItem = first.post || null; // server returns { news_main: {...}, post: {...} }
-        }
-      }
+      const first = Array.isArray(page?.main?.items) ? page.main.items[0] : null;
+      const mainItem = first ? (first.post || null) : null; // { news_main: {...}, post: {...} }
 
       // ----- Most Read News (top 10 from view; we will show 7) -----
-      if (mostReadRes.ok) {
-        const mr = await mostReadRes.json();
-        renderMostRead(Array.isArray(mr?.items) ? mr.items : []);
-      } else {
-        console.error('[news] most-read news fetch failed', mostReadRes.status, await mostReadRes.text());
-      }
+      renderMostRead(Array.isArray(page?.most_read?.items) ? page.most_read.items : []);
 
-      // ----- Latest News (top 3, full content) -----
-      if (latestNewsRes.ok) {
-        const ln = await latestNewsRes.json();
-        renderLatestNews(Array.isArray(ln?.items) ? ln.items : []);
-      } else {
-        console.error('[news] latest news fetch failed', latestNewsRes.status, await latestNewsRes.text());
-      }
+      // ----- Latest News (top 3) -----
+      renderLatestNews(Array.isArray(page?.latest?.items) ? page.latest.items : []);
 
       // Apply to DOM: main if present, else fallback to first post
       applyMainToDom(mainItem || posts[0] || null);
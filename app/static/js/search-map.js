@@ -68,10 +68,15 @@ document.addEventListener('DOMContentLoaded', function () {
   const markersLayer = L.layerGroup().addTo(map);
 
   // ---------- API helpers ----------
+  // Only the pins inside the current viewport are requested (bbox=west,south,east,north).
+  function currentBBox() {
+    return map.getBounds().toBBoxString();
+  }
+
   async function loadPlaces() {
-    // Initial load of *all* places, with fallback to injected window.ATL_PLACES
+    // Places in the current viewport, with fallback to injected window.ATL_PLACES
     try {
-      const res = await fetch('/api/atl-places', { headers: { 'Accept': 'application/json' } });
+      const res = await fetch(`/api/atl-places?bbox=${encodeURIComponent(currentBBox())}`, { headers: { 'Accept': 'application/json' } });
       if (!res.ok) throw new Error('HTTP ' + res.status);
       const data = await res.json();
       return Array.isArray(data) ? data : (data && data.places) ? data.places : [];
@@ -81,19 +86,48 @@ document.addEventListener('DOMContentLoaded', function () {
     }
   }
 
-  function urlForQuery(q) {
-    return q ? `/api/search/places?q=${encodeURIComponent(q)}` : `/api/atl-places`;
+  function urlForQuery(q, bbox) {
+    const geo = bbox ? `bbox=${encodeURIComponent(bbox)}` : '';
+    if (q) return `/api/search/places?q=${encodeURIComponent(q)}${geo ? '&' + geo : ''}`;
+    return `/api/atl-places${geo ? '?' + geo : ''}`;
   }
 
-  async function fetchForQuery(q) {
-    const res = await fetch(urlForQuery((q || '').trim()), { headers: { 'Accept': 'application/json' } });
+  // /api/search/places is paged (limit <= 200): follow next_offset so dense
+  // areas still get every pin, up to MAX_MAP_PINS.
+  const SEARCH_PAGE_SIZE = 200;
+  const MAX_MAP_PINS = 2000;
+
+  async function fetchJSON(url) {
+    const res = await fetch(url, { headers: { 'Accept': 'application/json' } });
     if (!res.ok) throw new Error('HTTP ' + res.status);
-    const data = await res.json();
-    return Array.isArray(data) ? data : (data && data.places) ? data.places : [];
+    return res.json();
+  }
+
+  async function fetchForQuery(q, bbox) {
+    const query = (q || '').trim();
+    const url = urlForQuery(query, bbox);
+    if (!query) {
+      const data = await fetchJSON(url);
+      return Array.isArray(data) ? data : (data && data.places) ? data.places : [];
+    }
+
+    const places = [];
+    let offset = 0;
+    let total = 0;
+    while (offset != null && places.length < MAX_MAP_PINS) {
+      const data = await fetchJSON(`${url}&limit=${SEARCH_PAGE_SIZE}&offset=${offset}`);
+      places.push(...(data.places || []));
+      total = data.total || places.length;
+      offset = data.next_offset;
+    }
+    if (offset != null) {
+      console.warn(`Map shows the first ${places.length} of ${total} matches; zoom in to see the rest.`);
+    }
+    return places;
   }
 
   // ---------- Plotter (clears + redraws) ----------
-  function plotPlaces(raw) {
+  function plotPlaces(raw, { fit = false } = {}) {
     // reset duplicate-tracker for jitter each redraw
     dupCount = {};
     markersLayer.clearLayers();
@@ -126,21 +160,39 @@ document.addEventListener('DOMContentLoaded', function () {
       L.marker([jLat, jLng], { icon }).addTo(markersLayer).bindPopup(popup);
     });
 
-    if (markersLayer.getLayers().length) {
+    if (fit && markersLayer.getLayers().length) {
       map.fitBounds(markersLayer.getBounds(), { padding: [24, 24] });
     }
   }
 
-  // ---------- Initial load (all places) ----------
+  // ---------- Initial load (places in the starting viewport) ----------
+  let currentQuery = '';
+
   loadPlaces()
-    .then(plotPlaces)
+    .then(places => plotPlaces(places))
     .catch(err => console.error('Failed to load places:', err));
 
+  // Re-fetch only the pins inside the viewport after the user pans/zooms.
+  let moveTimer = null;
+  map.on('moveend', () => {
+    clearTimeout(moveTimer);
+    moveTimer = setTimeout(async () => {
+      try {
+        plotPlaces(await fetchForQuery(currentQuery, currentBBox()));
+      } catch (err) {
+        console.error('Viewport fetch failed:', err);
+      }
+    }, 150);
+  });
+
   // ---------- Search handlers (click + Enter) ----------
   async function reloadMapForQuery(q) {
+    currentQuery = (q || '').trim();
     try {
-      const places = await fetchForQuery(q);
-      plotPlaces(places);
+      // A new search looks city-wide and zooms to the matches; later pans
+      // narrow it back down to the viewport.
+      const places = await fetchForQuery(currentQuery, currentQuery ? null : currentBBox());
+      plotPlaces(places, { fit: !!currentQuery });
     } catch (err) {
       console.error('Search fetch failed:', err);
     }
@@ -169,8 +221,51 @@ document.addEventListener('DOMContentLoaded', function () {
     });
   }
 
+  // ---------- Autocomplete (per keystroke, tiny payloads) ----------
+  function bindSuggest(inputSelector) {
+    const input = document.querySelector(inputSelector);
+    if (!input) return;
+
+    const list = document.createElement('datalist');
+    list.id = `${(input.id || input.className.split(' ')[0] || 'search')}-suggestions`;
+    document.body.appendChild(list);
+    input.setAttribute('list', list.id);
+    input.setAttribute('autocomplete', 'off');
+
+    let timer = null;
+    let inflight = null;
+    input.addEventListener('input', () => {
+      clearTimeout(timer);
+      timer = setTimeout(async () => {
+        const prefix = input.value;
+        if (!prefix.trim()) { list.innerHTML = ''; return; }
+        if (inflight) inflight.abort();
+        inflight = new AbortController();
+        try {
+          const res = await fetch(`/api/search/suggest?prefix=${encodeURIComponent(prefix)}`, {
+            headers: { 'Accept': 'application/json' },
+            signal: inflight.signal,
+          });
+          if (!res.ok) return;
+          const data = await res.json();
+          list.innerHTML = '';
+          (data.suggestions || []).forEach(s => {
+            const opt = document.createElement('option');
+            opt.value = s.text;
+            list.appendChild(opt);
+          });
+        } catch (err) {
+          if (err.name !== 'AbortError') console.warn('Suggest fetch failed:', err);
+        }
+      }, 80);
+    });
+  }
+
   // Hook up your existing inputs (kept exactly as before)
   bindSearchHandler('.search-map-input', '.direction-icon'); // legacy hook (if present)
   bindSearchHandler('.map-search-input', '.map-search-btn'); // filter search row
   bindSearchHandler('#top-search-input', '#top-search-btn'); // top white bar
+
+  bindSuggest('.map-search-input');
+  bindSuggest('#top-search-input');
 });
@@ -1,4 +1,5 @@
 import os
+import tempfile
 import certifi
 from dotenv import load_dotenv
 
@@ -17,6 +18,40 @@ class Config(BaseConfig):
     MONGO_DBNAME = os.environ.get("MONGO_DBNAME")
     MONGO_URI = os.environ.get("MONGO_URI")
     MONGO_CERT = certifi.where()
+    # Mongo is connected lazily (app.mongo.MongoConnection); bound every wait on it
+    MONGO_CONNECT_TIMEOUT_MS = int(os.environ.get("MONGO_CONNECT_TIMEOUT_MS", "2000"))
+    MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.environ.get("MONGO_SERVER_SELECTION_TIMEOUT_MS", "2000"))
+    MONGO_SOCKET_TIMEOUT_MS = int(os.environ.get("MONGO_SOCKET_TIMEOUT_MS", "5000"))
+    # Seconds before /api/debug/mongo starts a new background ping
+    MONGO_HEALTH_INTERVAL = float(os.environ.get("MONGO_HEALTH_INTERVAL", "30"))
+    # How often (seconds) a worker re-checks atl_place for catalog changes
+    PLACE_CATALOG_REFRESH_SECONDS = int(os.environ.get("PLACE_CATALOG_REFRESH_SECONDS", "60"))
+    # Relationships batch-loaded on BlogPost list queries, and how ("selectin" | "joined")
+    POST_LIST_EAGER_LOADS = ("author", "category", "analytics")
+    POST_LIST_LOAD_STRATEGY = os.environ.get("POST_LIST_LOAD_STRATEGY", "selectin")
+    # Response cache for public JSON reads: "memory" (per worker), "sqlite" (shared file) or "none"
+    RESPONSE_CACHE_BACKEND = os.environ.get("RESPONSE_CACHE_BACKEND", "memory")
+    RESPONSE_CACHE_PATH = os.environ.get(
+        "RESPONSE_CACHE_PATH", os.path.join(tempfile.gettempdir(), "atllocal_response_cache.sqlite3")
+    )
+    RESPONSE_CACHE_TTL = float(os.environ.get("RESPONSE_CACHE_TTL", "30"))
+    RESPONSE_CACHE_SIZE = int(os.environ.get("RESPONSE_CACHE_SIZE", "512"))
+    # Write-behind PostAnalytics hit counters: flush interval (<= 0 = apply inline)
+    # and the spool file for counts the final flush could not write
+    ANALYTICS_FLUSH_SECONDS = float(os.environ.get("ANALYTICS_FLUSH_SECONDS", "5"))
+    ANALYTICS_SPOOL_PATH = os.environ.get(
+        "ANALYTICS_SPOOL_PATH", os.path.join(tempfile.gettempdir(), "atllocal_analytics_spool.jsonl")
+    )
+    # Materialized most-read rankings: rows kept per scope/window, and minimum seconds between refreshes
+    MOST_READ_TOP_N = int(os.environ.get("MOST_READ_TOP_N", "100"))
+    MOST_READ_REFRESH_SECONDS = int(os.environ.get("MOST_READ_REFRESH_SECONDS", "60"))
+    # BlogContent storage layout: "wide" (columns only), "dual" (also write the
+    # packed copy) or "packed" (serve it); see `flask pack-content`
+    CONTENT_STORAGE = os.environ.get("CONTENT_STORAGE", "wide")
+    # Per-worker <ident> -> post_id/is_news/blog_cat_id map: entries and seconds
+    # before another worker's writes are seen (the writing worker sees them at once)
+    SLUG_INDEX_SIZE = int(os.environ.get("SLUG_INDEX_SIZE", "4096"))
+    SLUG_INDEX_TTL = float(os.environ.get("SLUG_INDEX_TTL", "60"))
 
 class TestConfig(Config):
     # No hardcoded path; env controls it. Optional fallback to local sqlite.
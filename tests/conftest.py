@@ -0,0 +1,46 @@
+# Run from anywhere: the app imports `config` and `app` from the repo root
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ["FLASK_ENV"] = "test"
+os.environ["TEST_DATABASE_URL"] = "sqlite://"
+os.environ.setdefault("DEV_DATABASE_URL", "sqlite://")
+os.environ.setdefault("PROD_DATABASE_URL", "sqlite://")
+os.environ["RESPONSE_CACHE_BACKEND"] = "none"  # count queries, not cache hits
+os.environ["ANALYTICS_FLUSH_SECONDS"] = "0"
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+
+import config
+
+config.TestConfig.SQLALCHEMY_ENGINE_OPTIONS = {
+    "poolclass": StaticPool,  # one in-memory database shared by every session
+    "connect_args": {"check_same_thread": False},
+}
+
+from app import create_app
+from app.models import SCHEMA, db
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The app on an empty in-memory SQLite database (schema attached, tables created)."""
+    app = create_app()
+    with app.app_context():
+        @event.listens_for(db.engine, "connect")
+        def _attach_schema(dbapi_conn, _record):
+            dbapi_conn.execute(f"ATTACH DATABASE ':memory:' AS {SCHEMA}")
+        db.engine.dispose()
+        db.create_all()
+    yield app
+    with app.app_context():
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
@@ -0,0 +1,36 @@
+"""
+?near= / ?radius_m= / ?bbox= validation on the place endpoints: anything
+that is not a finite, in-range number is a 400, never a 500 from the
+spatial index.
+"""
+import pytest
+
+PLACE_ENDPOINTS = ["/api/atl-places?", "/api/search/places?q=coffee&"]
+
+
+@pytest.mark.parametrize("endpoint", PLACE_ENDPOINTS)
+@pytest.mark.parametrize("geo", [
+    "near=33.75,-84.39&radius_m=nan",
+    "near=33.75,-84.39&radius_m=inf",
+    "near=33.75,-84.39&radius_m=-inf",
+    "near=33.75,-84.39&radius_m=0",
+    "near=33.75,-84.39&radius_m=-5",
+    "near=nan,-84.39",
+    "near=33.75,inf",
+    "near=33.75",
+    "bbox=-84.5,nan,-84.3,33.8",
+    "bbox=-inf,33.7,-84.3,33.8",
+    "bbox=-84.3,33.7,-84.5,33.8",
+])
+def test_invalid_geo_filter_is_rejected(client, endpoint, geo):
+    response = client.get(endpoint + geo)
+
+    assert response.status_code == 400
+    assert "error" in response.get_json()
+
+
+@pytest.mark.parametrize("endpoint", PLACE_ENDPOINTS)
+def test_valid_geo_filter_is_accepted(client, endpoint):
+    response = client.get(endpoint + "near=33.75,-84.39&radius_m=1500")
+
+    assert response.status_code == 200
@@ -0,0 +1,100 @@
+"""
+Statement counts for the post list endpoints.
+
+Author, category and analytics are batch-loaded (_post_list_options), so
+a page costs a fixed number of statements whatever its size; these tests
+fail if a relationship goes back to lazy loading one row at a time.
+"""
+import datetime
+
+import pytest
+from sqlalchemy import event
+
+from app.models import db, MyUser, BlogCategory, BlogPost, BlogContent, NewsPost, PostAnalytics
+
+POSTS = 30
+PER_PAGE = 20
+# The page, COUNT(*) for the pager, and one SELECT ... IN per batch-loaded
+# relationship (author, category, analytics); 2 with POST_LIST_LOAD_STRATEGY=joined
+MAX_STATEMENTS = 5
+# BlogContent columns the seed rows must fill in
+_REQUIRED_CONTENT = [
+    c.name for c in BlogContent.__table__.columns
+    if not c.nullable and not c.primary_key and c.default is None and c.server_default is None
+    and c.name != "post_id"
+]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def posts(app):
+    with app.app_context():
+        _seed()
+    yield
+    with app.app_context():
+        for model in (NewsPost, PostAnalytics, BlogContent, BlogPost, BlogCategory, MyUser):
+            model.query.delete()
+        db.session.commit()
+
+
+def _seed():
+    # Several authors and categories, so each batch load covers many rows
+    users = [
+        MyUser(
+            first_name="Author", last_name=str(i), email=f"author{i}@example.com", gender="x",
+            dob=datetime.date(1990, 1, 1), zip_code="30303", image=f"author{i}.png", password_hash="x",
+        )
+        for i in range(2)
+    ]
+    categories = [BlogCategory(title=f"Category {i}", slug=f"category-{i}") for i in range(3)]
+    db.session.add_all([*users, *categories])
+    db.session.flush()
+
+    start = datetime.datetime(2025, 1, 1)
+    for i in range(POSTS):
+        when = start + datetime.timedelta(days=i)
+        post = BlogPost(
+            title=f"Post {i}", slug=f"post-{i}", image=f"media/blog/post-{i}.png",
+            blog_cat_id=categories[i % len(categories)].blog_cat_id,
+            author_id=users[i % len(users)].my_user_id,
+            created_at=when, updated_at=when,
+        )
+        db.session.add(post)
+        db.session.flush()
+        db.session.add(BlogContent(post_id=post.post_id, **{c: f"{c} of post {i}" for c in _REQUIRED_CONTENT}))
+        db.session.add(PostAnalytics(post_id=post.post_id, views=i, likes=0, comments=0, shares=0))
+        if i % 2 == 0:
+            db.session.add(NewsPost(post_id=post.post_id))
+    db.session.commit()
+
+
+@pytest.fixture
+def statements(app):
+    seen = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        seen.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, "before_cursor_execute", _record)
+    yield seen
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+@pytest.mark.parametrize("path", ["/api/v1/blog-posts", "/api/v1/news-posts"])
+def test_list_page_statement_count(client, statements, path):
+    response = client.get(f"{path}?per_page={PER_PAGE}")
+
+    assert response.status_code == 200
+    assert len(response.get_json()["items"]) == min(PER_PAGE, POSTS if "blog" in path else POSTS // 2)
+    assert len(statements) <= MAX_STATEMENTS, statements
+
+
+@pytest.mark.parametrize("path", ["/api/v1/blog-posts", "/api/v1/news-posts"])
+def test_list_statement_count_does_not_grow_with_page_size(client, statements, path):
+    client.get(f"{path}?per_page=2")
+    small = len(statements)
+    statements.clear()
+    client.get(f"{path}?per_page={PER_PAGE}")
+
+    assert len(statements) == small